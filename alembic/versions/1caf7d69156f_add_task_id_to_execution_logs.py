@@ -0,0 +1,47 @@
+"""Add task_id to execution logs
+
+Revision ID: 1caf7d69156f
+Revises: 7140757cfa8d
+Create Date: 2026-10-18 14:05:12.604219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1caf7d69156f'
+down_revision: Union[str, Sequence[str], None] = '7140757cfa8d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('execution_logs', sa.Column('task_id', sa.UUID(), nullable=True))
+    op.drop_constraint('uq_execution_logs_event_workflow', 'execution_logs', type_='unique')
+    op.create_index(
+        'uq_execution_logs_event_workflow',
+        'execution_logs',
+        ['event_id', 'workflow_id'],
+        unique=True,
+        postgresql_where=sa.text('task_id IS NULL'),
+    )
+    op.create_index(
+        'uq_execution_logs_event_workflow_task',
+        'execution_logs',
+        ['event_id', 'workflow_id', 'task_id'],
+        unique=True,
+        postgresql_where=sa.text('task_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DELETE FROM execution_logs WHERE task_id IS NOT NULL')
+    op.drop_index('uq_execution_logs_event_workflow_task', table_name='execution_logs')
+    op.drop_index('uq_execution_logs_event_workflow', table_name='execution_logs')
+    op.create_unique_constraint('uq_execution_logs_event_workflow', 'execution_logs', ['event_id', 'workflow_id'])
+    op.drop_column('execution_logs', 'task_id')
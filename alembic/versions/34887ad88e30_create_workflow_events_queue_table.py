@@ -0,0 +1,40 @@
+"""Create workflow events queue table
+
+Revision ID: 34887ad88e30
+Revises: 065f2383ddd5
+Create Date: 2026-10-18 11:02:17.540116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '34887ad88e30'
+down_revision: Union[str, Sequence[str], None] = '065f2383ddd5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('workflow_events',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('envelope', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('deliveries', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('visible_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id')
+    )
+    op.create_index('ix_workflow_events_visible_at', 'workflow_events', ['visible_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workflow_events_visible_at', table_name='workflow_events')
+    op.drop_table('workflow_events')
@@ -0,0 +1,40 @@
+"""Add retry backoff and dead-letter columns to event_outbox
+
+Revision ID: 3f8a2c6d9e14
+Revises: b7d41e09c3a2
+Create Date: 2026-10-18 20:41:09.552013
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a2c6d9e14'
+down_revision: Union[str, Sequence[str], None] = 'b7d41e09c3a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'event_outbox',
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    )
+    op.add_column('event_outbox', sa.Column('dead_lettered_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        'ix_event_outbox_next_attempt_at',
+        'event_outbox',
+        ['next_attempt_at'],
+        postgresql_where=sa.text('dead_lettered_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_event_outbox_next_attempt_at', table_name='event_outbox')
+    op.drop_column('event_outbox', 'dead_lettered_at')
+    op.drop_column('event_outbox', 'next_attempt_at')
@@ -0,0 +1,42 @@
+"""Create scheduled retries table
+
+Revision ID: 42032e23bad7
+Revises: 1caf7d69156f
+Create Date: 2026-10-18 15:11:38.270915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '42032e23bad7'
+down_revision: Union[str, Sequence[str], None] = '1caf7d69156f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('scheduled_retries',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('workflow_id', sa.UUID(), nullable=False),
+    sa.Column('envelope', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id', 'workflow_id', name='uq_scheduled_retries_event_workflow')
+    )
+    op.create_index('ix_scheduled_retries_next_attempt_at', 'scheduled_retries', ['next_attempt_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scheduled_retries_next_attempt_at', table_name='scheduled_retries')
+    op.drop_table('scheduled_retries')
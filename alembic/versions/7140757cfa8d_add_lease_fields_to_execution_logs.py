@@ -0,0 +1,37 @@
+"""Add lease fields to execution logs
+
+Revision ID: 7140757cfa8d
+Revises: 34887ad88e30
+Create Date: 2026-10-18 13:20:41.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7140757cfa8d'
+down_revision: Union[str, Sequence[str], None] = '34887ad88e30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('execution_logs', sa.Column('lease_owner', sa.String(length=128), nullable=True))
+    op.add_column('execution_logs', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        'ix_execution_logs_pending_lease',
+        'execution_logs',
+        ['lease_expires_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_execution_logs_pending_lease', table_name='execution_logs')
+    op.drop_column('execution_logs', 'lease_expires_at')
+    op.drop_column('execution_logs', 'lease_owner')
@@ -0,0 +1,147 @@
+"""Partition execution_logs by created_at
+
+Revision ID: b7d41e09c3a2
+Revises: 42032e23bad7
+Create Date: 2026-10-18 18:02:47.118305
+
+The existing table is attached as the first partition, covering everything
+before tomorrow (UTC), so no rows are copied; its primary key is rebuilt as
+(id, created_at). The unique (event_id, workflow_id[, task_id]) indexes move
+to the new execution_log_keys table. Daily partitions for the next week and
+a default partition are created here; the worker's PartitionMaintainer keeps
+creating them ahead afterwards.
+"""
+from datetime import datetime, time, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e09c3a2'
+down_revision: Union[str, Sequence[str], None] = '42032e23bad7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    'ix_execution_logs_workflow_created': '(workflow_id, created_at)',
+    'ix_execution_logs_workflow_status_created': '(workflow_id, status, created_at)',
+    'ix_execution_logs_queued_to_dlq_created': '(queued_to_dlq, created_at)',
+    'ix_execution_logs_pending_lease': "(lease_expires_at) WHERE status = 'pending'",
+}
+DAYS_AHEAD = 7
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('execution_log_keys',
+    sa.Column('log_id', sa.UUID(), nullable=False),
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('workflow_id', sa.UUID(), nullable=False),
+    sa.Column('task_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('log_id')
+    )
+    op.execute(
+        'INSERT INTO execution_log_keys (log_id, event_id, workflow_id, task_id, created_at) '
+        'SELECT id, event_id, workflow_id, task_id, created_at FROM execution_logs'
+    )
+    op.create_index(
+        'uq_execution_log_keys_event_workflow',
+        'execution_log_keys',
+        ['event_id', 'workflow_id'],
+        unique=True,
+        postgresql_where=sa.text('task_id IS NULL'),
+    )
+    op.create_index(
+        'uq_execution_log_keys_event_workflow_task',
+        'execution_log_keys',
+        ['event_id', 'workflow_id', 'task_id'],
+        unique=True,
+        postgresql_where=sa.text('task_id IS NOT NULL'),
+    )
+    op.create_index('ix_execution_log_keys_created', 'execution_log_keys', ['created_at'])
+
+    cut = datetime.combine(datetime.now(timezone.utc).date() + timedelta(days=1), time(), timezone.utc)
+
+    op.drop_index('uq_execution_logs_event_workflow_task', table_name='execution_logs')
+    op.drop_index('uq_execution_logs_event_workflow', table_name='execution_logs')
+    op.execute('ALTER TABLE execution_logs RENAME TO execution_logs_legacy')
+    for name in INDEXES:
+        op.execute(f'ALTER INDEX {name} RENAME TO {name}_legacy')
+    op.execute('ALTER TABLE execution_logs_legacy DROP CONSTRAINT execution_logs_pkey')
+    op.execute('ALTER TABLE execution_logs_legacy ADD PRIMARY KEY (id, created_at)')
+
+    op.execute(
+        'CREATE TABLE execution_logs (LIKE execution_logs_legacy INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (created_at)'
+    )
+    op.execute('ALTER TABLE execution_logs ADD PRIMARY KEY (id, created_at)')
+    op.execute(
+        'ALTER TABLE execution_logs ADD CONSTRAINT execution_logs_workflow_id_fkey '
+        'FOREIGN KEY (workflow_id) REFERENCES workflows(id)'
+    )
+
+    # The CHECK lets ATTACH skip its validation scan.
+    op.execute(
+        'ALTER TABLE execution_logs_legacy ADD CONSTRAINT execution_logs_legacy_bound '
+        f"CHECK (created_at < '{cut.isoformat()}') NOT VALID"
+    )
+    op.execute('ALTER TABLE execution_logs_legacy VALIDATE CONSTRAINT execution_logs_legacy_bound')
+    op.execute(
+        'ALTER TABLE execution_logs ATTACH PARTITION execution_logs_legacy '
+        f"FOR VALUES FROM (MINVALUE) TO ('{cut.isoformat()}')"
+    )
+    op.execute('ALTER TABLE execution_logs_legacy DROP CONSTRAINT execution_logs_legacy_bound')
+
+    # Matching indexes on the legacy partition are attached, not rebuilt.
+    for name, columns in INDEXES.items():
+        op.execute(f'CREATE INDEX {name} ON execution_logs {columns}')
+
+    for day in range(DAYS_AHEAD):
+        start = cut + timedelta(days=day)
+        end = start + timedelta(days=1)
+        op.execute(
+            f'CREATE TABLE execution_logs_p{start:%Y%m%d} PARTITION OF execution_logs '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute('CREATE TABLE execution_logs_default PARTITION OF execution_logs DEFAULT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER TABLE execution_logs RENAME TO execution_logs_partitioned')
+    op.execute('ALTER INDEX execution_logs_pkey RENAME TO execution_logs_partitioned_pkey')
+    for name in INDEXES:
+        op.execute(f'ALTER INDEX {name} RENAME TO {name}_partitioned')
+    op.execute(
+        'CREATE TABLE execution_logs (LIKE execution_logs_partitioned INCLUDING DEFAULTS)'
+    )
+    op.execute('INSERT INTO execution_logs SELECT * FROM execution_logs_partitioned')
+    op.execute('DROP TABLE execution_logs_partitioned')
+    op.execute('ALTER TABLE execution_logs ADD CONSTRAINT execution_logs_pkey PRIMARY KEY (id)')
+    op.execute(
+        'ALTER TABLE execution_logs ADD CONSTRAINT execution_logs_workflow_id_fkey '
+        'FOREIGN KEY (workflow_id) REFERENCES workflows(id)'
+    )
+    for name, columns in INDEXES.items():
+        op.execute(f'CREATE INDEX {name} ON execution_logs {columns}')
+    op.create_index(
+        'uq_execution_logs_event_workflow',
+        'execution_logs',
+        ['event_id', 'workflow_id'],
+        unique=True,
+        postgresql_where=sa.text('task_id IS NULL'),
+    )
+    op.create_index(
+        'uq_execution_logs_event_workflow_task',
+        'execution_logs',
+        ['event_id', 'workflow_id', 'task_id'],
+        unique=True,
+        postgresql_where=sa.text('task_id IS NOT NULL'),
+    )
+    op.drop_index('ix_execution_log_keys_created', table_name='execution_log_keys')
+    op.drop_index('uq_execution_log_keys_event_workflow_task', table_name='execution_log_keys')
+    op.drop_index('uq_execution_log_keys_event_workflow', table_name='execution_log_keys')
+    op.drop_table('execution_log_keys')
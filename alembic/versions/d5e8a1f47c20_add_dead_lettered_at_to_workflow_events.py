@@ -0,0 +1,37 @@
+"""Add dead_lettered_at to workflow_events
+
+Revision ID: d5e8a1f47c20
+Revises: 3f8a2c6d9e14
+Create Date: 2026-10-18 21:02:37.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8a1f47c20'
+down_revision: Union[str, Sequence[str], None] = '3f8a2c6d9e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('workflow_events', sa.Column('dead_lettered_at', sa.DateTime(timezone=True), nullable=True))
+    op.drop_index('ix_workflow_events_visible_at', table_name='workflow_events')
+    op.create_index(
+        'ix_workflow_events_visible_at',
+        'workflow_events',
+        ['visible_at'],
+        postgresql_where=sa.text('dead_lettered_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workflow_events_visible_at', table_name='workflow_events')
+    op.create_index('ix_workflow_events_visible_at', 'workflow_events', ['visible_at'])
+    op.drop_column('workflow_events', 'dead_lettered_at')
@@ -0,0 +1,113 @@
+"""Benchmark: deep pages of the execution log listing, OFFSET vs cursor.
+
+    python -m benchmarks.execution_log_pagination --rows 2000000 --page-size 50 --pages 1 100 10000
+
+Runs against ``settings.DATABASE_URL`` (migrated schema required). Seeds
+``--rows`` execution logs for one workflow with a single ``INSERT ...
+SELECT generate_series`` and runs ``ANALYZE``, then times fetching each
+page number in ``--pages`` both by ``offset`` and by the cursor of the
+previous page, through ``ExecutionLogRepository.list``. The cursor for a
+deep page is taken from the row just before it, so only the page fetch
+itself is timed. All rows created are deleted at the end.
+"""
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.db.models import ExecutionLog, Workflow
+from src.repositories.execution_log import ExecutionLogRepository, encode_cursor
+
+SEED = text(
+    """
+    INSERT INTO execution_logs
+        (id, workflow_id, event_id, trace_id, action, status, retryable,
+         attempts, queued_to_dlq, created_at)
+    SELECT gen_random_uuid(), :workflow_id, gen_random_uuid(), 'bench', 'LogAction',
+           'success', false, 1, false,
+           now() - make_interval(secs => i / 10.0)
+    FROM generate_series(1, :rows) AS i
+    """
+)
+
+
+async def timed(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def main(rows: int, page_size: int, pages: list[int], repeat: int) -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    workflow = Workflow(id=uuid4(), name=f"bench-{uuid4()}", status="published", is_active=True)
+    async with factory() as session:
+        async with session.begin():
+            session.add(workflow)
+
+    try:
+        started = time.perf_counter()
+        async with factory() as session:
+            async with session.begin():
+                await session.execute(SEED, {"workflow_id": workflow.id, "rows": rows})
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("ANALYZE execution_logs"))
+        print(f"seeded {rows} rows in {time.perf_counter() - started:.1f}s")
+
+        async with factory() as session:
+            repo = ExecutionLogRepository(session)
+            for page in pages:
+                offset = (page - 1) * page_size
+                if offset >= rows:
+                    print(f"page {page}: beyond {rows} rows, skipped")
+                    continue
+
+                cursor = None
+                if offset:
+                    before = (
+                        await session.execute(
+                            select(ExecutionLog.created_at, ExecutionLog.id)
+                            .where(ExecutionLog.workflow_id == workflow.id)
+                            .order_by(ExecutionLog.created_at.desc(), ExecutionLog.id.desc())
+                            .offset(offset - 1)
+                            .limit(1)
+                        )
+                    ).one()
+                    cursor = encode_cursor(before.created_at, before.id)
+
+                by_offset = await timed(
+                    repeat,
+                    lambda: repo.list(workflow_id=workflow.id, limit=page_size, offset=offset),
+                )
+                by_cursor = await timed(
+                    repeat,
+                    lambda: repo.list(workflow_id=workflow.id, limit=page_size, cursor=cursor),
+                )
+                print(f"page {page:>6}: offset {by_offset:9.2f} ms   cursor {by_cursor:7.2f} ms")
+    finally:
+        async with factory() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(ExecutionLog).where(ExecutionLog.workflow_id == workflow.id)
+                )
+                await session.execute(delete(Workflow).where(Workflow.id == workflow.id))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.page_size, args.pages, args.repeat))
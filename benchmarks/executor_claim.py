@@ -0,0 +1,116 @@
+"""Benchmark: per-event execution-log round trips, legacy vs single-statement claim.
+
+    python -m benchmarks.executor_claim --events 2000 --duplicates 0.2 --rtt-ms 1
+
+Runs against ``settings.DATABASE_URL`` (migrated schema required). Each
+"event" is processed in its own transaction, as the worker does. Both paths
+are timed and their SQL statements counted. ``--rtt-ms`` adds a sleep per
+statement to approximate the network round trip to a remote database;
+against a local socket the difference is mostly hidden. All rows created
+are deleted at the end.
+"""
+import argparse
+import asyncio
+import random
+import time
+from uuid import uuid4
+
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.db.models import ExecutionLog, Workflow
+from src.repositories.execution_log import ExecutionLogRepository
+
+FINAL = {"status": "success", "retryable": False, "queued_to_dlq": False, "duration": 0.001}
+
+
+def _payload(workflow_id, event_id) -> dict:
+    return {
+        "workflow_id": workflow_id,
+        "event_id": event_id,
+        "trace_id": "bench",
+        "action": "LogAction",
+        "status": "pending",
+        "retryable": False,
+    }
+
+
+async def legacy(repo: ExecutionLogRepository, payload: dict) -> None:
+    log, is_new = await repo.create_pending(payload)
+    if not is_new and log.status != "failed":
+        return
+    await repo.increment_attempts(log)
+    await repo.mark_finished(log, FINAL)
+
+
+async def claim(repo: ExecutionLogRepository, payload: dict) -> None:
+    entry = await repo.claim(payload, lease_owner="bench", lease_seconds=60)
+    if not entry.claimed:
+        return
+    await repo.finish(entry.id, FINAL)
+
+
+async def run_path(name, fn, factory, workflow_id, event_ids, counter) -> None:
+    counter["n"] = 0
+    started = time.perf_counter()
+    for event_id in event_ids:
+        async with factory() as session:
+            async with session.begin():
+                await fn(ExecutionLogRepository(session), _payload(workflow_id, event_id))
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:>7}: {len(event_ids)} events in {elapsed:.3f}s "
+        f"({elapsed / len(event_ids) * 1000:.3f} ms/event, "
+        f"{counter['n'] / len(event_ids):.2f} statements/event)"
+    )
+
+
+async def main(events: int, duplicates: float, rtt_ms: float) -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    counter = {"n": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(*_):
+        counter["n"] += 1
+        if rtt_ms:
+            time.sleep(rtt_ms / 1000)
+
+    workflow = Workflow(id=uuid4(), name=f"bench-{uuid4()}", status="published", is_active=True)
+    async with factory() as session:
+        async with session.begin():
+            session.add(workflow)
+
+    def workload() -> list:
+        ids = [uuid4() for _ in range(events)]
+        redelivered = random.sample(ids, int(events * duplicates))
+        mixed = ids + redelivered
+        random.shuffle(mixed)
+        return mixed
+
+    try:
+        # Warm up connections and prepared statements for both paths.
+        await run_path("warmup", legacy, factory, workflow.id, workload()[:50], counter)
+        await run_path("warmup", claim, factory, workflow.id, workload()[:50], counter)
+
+        await run_path("legacy", legacy, factory, workflow.id, workload(), counter)
+        await run_path("claim", claim, factory, workflow.id, workload(), counter)
+    finally:
+        async with factory() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(ExecutionLog).where(ExecutionLog.workflow_id == workflow.id)
+                )
+                await session.execute(delete(Workflow).where(Workflow.id == workflow.id))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--duplicates", type=float, default=0.2)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.events, args.duplicates, args.rtt_ms))
@@ -0,0 +1,100 @@
+"""Benchmark: HttpCallAction throughput, pooled client vs a new client per call.
+
+    python -m benchmarks.http_call --requests 1000 --concurrency 10
+
+Starts a minimal keep-alive HTTP/1.1 server on localhost and fires webhook
+calls at it. "pooled" reuses one client (the worker setup); "unpooled"
+opens a fresh client per call, paying for client construction (SSL context)
+and a new TCP connection each time. Over TLS or a real network the
+handshake makes the gap larger still.
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import httpx
+
+from src.actions.http_call import HttpCallAction
+from src.core.http_client import HostLimiter, build_http_client
+from src.db.models import Workflow
+from src.events.schema import EventEnvelope
+from src.models.actions import ExecutionContext
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\nContent-Length: 2\r\n\r\nok"
+
+
+async def _serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+class _UnpooledAction(HttpCallAction):
+    async def run(self, context):
+        async with httpx.AsyncClient() as client:
+            return await HttpCallAction(client=client, limiter=self._limiter).run(context)
+
+
+async def _run(name: str, action: HttpCallAction, context, requests: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            return await action.run(context)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    failed = sum(result.status != "success" for result in results)
+    print(f"{name:>8}: {requests / elapsed:8.0f} req/s ({elapsed:.2f}s, {failed} failed)")
+
+
+async def main(requests: int, concurrency: int) -> None:
+    server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    context = ExecutionContext(
+        event=EventEnvelope(
+            event_id=uuid4(),
+            event_type="workflow.triggered",
+            version=1,
+            timestamp=datetime.now(timezone.utc),
+            source="benchmark",
+            payload={"workflow_id": str(uuid4())},
+            trace_id="bench",
+        ),
+        workflow=Workflow(id=uuid4(), name="bench", status="published", is_active=True),
+        trace_id="bench",
+        config={"url": f"http://127.0.0.1:{port}/hook"},
+    )
+    limiter = HostLimiter(concurrency)
+
+    async with server:
+        client = build_http_client()
+        try:
+            await _run("warmup", HttpCallAction(client=client, limiter=limiter), context, 100, concurrency)
+            await _run("pooled", HttpCallAction(client=client, limiter=limiter), context, requests, concurrency)
+        finally:
+            await client.aclose()
+        await _run("unpooled", _UnpooledAction(limiter=limiter), context, requests, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
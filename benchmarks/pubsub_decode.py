@@ -0,0 +1,76 @@
+"""Benchmark: per-message CPU of the Pub/Sub push decode paths.
+
+    python -m benchmarks.pubsub_decode --messages 50000 --payload-keys 20
+
+"legacy" is the previous path: FastAPI parses the request into
+``PubSubPushBody``, then the data is base64-decoded, ``json.loads``-ed and
+validated into ``EventEnvelope``. "raw" is ``decode_push_body``: orjson pulls
+``message.data`` out of the raw body and the envelope is validated once from
+its JSON bytes.
+"""
+import argparse
+import base64
+import json
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.events.schema import EventEnvelope
+from src.worker.models.pubsub_push import PubSubPushBody
+from src.worker.services.pubsub_decoder import decode_push_body
+
+
+def _legacy_decode(body: bytes) -> EventEnvelope:
+    push = PubSubPushBody.model_validate(json.loads(body))
+    data = base64.b64decode(push.message.data)
+    return EventEnvelope.model_validate(json.loads(data.decode("utf-8")))
+
+
+def _push_body(payload_keys: int) -> bytes:
+    envelope = EventEnvelope(
+        event_id=uuid4(),
+        event_type="workflow.triggered",
+        version=1,
+        timestamp=datetime.now(timezone.utc),
+        source="benchmark",
+        trace_id="bench",
+        payload={"workflow_id": str(uuid4()), **{f"field_{i}": f"value-{i}" * 4 for i in range(payload_keys)}},
+    )
+    return json.dumps(
+        {
+            "message": {
+                "messageId": "1",
+                "data": base64.b64encode(envelope.model_dump_json().encode()).decode(),
+                "attributes": {},
+                "publishTime": datetime.now(timezone.utc).isoformat(),
+            },
+            "subscription": "projects/bench/subscriptions/bench",
+        }
+    ).encode()
+
+
+def _measure(name: str, decode, body: bytes, messages: int) -> float:
+    for _ in range(min(messages, 1000)):
+        decode(body)
+    started = time.process_time()
+    for _ in range(messages):
+        decode(body)
+    per_message = (time.process_time() - started) / messages * 1e6
+    print(f"{name:>7}: {per_message:6.1f} µs CPU/message")
+    return per_message
+
+
+def main(messages: int, payload_keys: int) -> None:
+    body = _push_body(payload_keys)
+    print(f"push body: {len(body)} bytes")
+    legacy = _measure("legacy", _legacy_decode, body, messages)
+    raw = _measure("raw", decode_push_body, body, messages)
+    print(f"speedup: {legacy / raw:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--payload-keys", type=int, default=20)
+    args = parser.parse_args()
+    main(args.messages, args.payload_keys)
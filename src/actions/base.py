@@ -1,8 +1,53 @@
+import random
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
-from src.models.actions import ExecutionContext, ActionResult
+from src.models.actions import ExecutionContext, ActionResult, PortableContext
+
+MAX_ATTEMPTS = 3
+
+# Where an action's work runs: on the event loop, in the shared thread pool,
+# or in the shared process pool (see src/worker/services/action_pools.py).
+ASYNC = "async"
+THREAD = "thread"
+PROCESS = "process"
+EXECUTION_MODES = (ASYNC, THREAD, PROCESS)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how fast a retryable action is re-attempted (exponential backoff, full jitter)."""
+    max_attempts: int = MAX_ATTEMPTS
+    base_delay: float = 1.0
+    multiplier: float = 2.0
+    max_delay: float = 300.0
+
+    def delay(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** max(attempt - 1, 0))
+        return random.uniform(0, ceiling)
 
 
 class BaseAction(ABC):
+    retry_policy: RetryPolicy = RetryPolicy()
+    execution_mode: str = ASYNC
+
+    def breaker_key(self, context: ExecutionContext) -> str | None:
+        """Circuit breaker this run reports to; ``None`` disables the breaker."""
+        return self.__class__.__name__
+
     @abstractmethod
     async def run(self, context: ExecutionContext) -> ActionResult:...
+
+
+class SyncAction(BaseAction):
+    """Blocking action run off the event loop; subclasses implement ``run_sync``."""
+    # With PROCESS the instance and its result are pickled, so neither may hold
+    # sockets or sessions. A timeout fails the run but cannot interrupt it; the
+    # call keeps its pool slot until it returns.
+    execution_mode: str = THREAD
+
+    @abstractmethod
+    def run_sync(self, context: PortableContext) -> ActionResult:...
+
+    async def run(self, context: ExecutionContext) -> ActionResult:
+        return self.run_sync(context.portable())
@@ -0,0 +1,12 @@
+import asyncio
+
+from src.actions.base import BaseAction, ExecutionContext, ActionResult
+
+
+class DelayAction(BaseAction):
+    """Waits ``config["seconds"]`` (counted against the step timeout) before succeeding."""
+
+    async def run(self, context: ExecutionContext) -> ActionResult:
+        seconds = float(context.config.get("seconds", 0))
+        await asyncio.sleep(seconds)
+        return ActionResult(status="success", result={"delayed_seconds": seconds})
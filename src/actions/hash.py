@@ -0,0 +1,23 @@
+import hashlib
+import json
+
+from src.actions.base import PROCESS, ActionResult, PortableContext, SyncAction
+
+
+class HashAction(SyncAction):
+    """Digests ``config["value"]`` (default: the event payload) as canonical JSON."""
+    # Large payloads make this CPU-bound.
+    execution_mode = PROCESS
+
+    def run_sync(self, context: PortableContext) -> ActionResult:
+        algorithm = context.config.get("algorithm", "sha256")
+        value = context.config.get("value", context.event.payload)
+        data = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+        try:
+            digest = hashlib.new(algorithm, data)
+        except ValueError as e:
+            return ActionResult(status="failed", error=str(e), retryable=False)
+        return ActionResult(
+            status="success",
+            result={"algorithm": algorithm, "digest": digest.hexdigest(), "bytes": len(data)},
+        )
@@ -0,0 +1,94 @@
+import httpx
+
+from src.actions.base import BaseAction, ExecutionContext, ActionResult, RetryPolicy
+from src.core.config import settings
+from src.core.http_client import HostLimiter, get_http_client, host_limiter
+
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class HttpCallAction(BaseAction):
+    """Calls ``config["url"]`` on the shared pooled client; timeouts, 408/425/429 and 5xx are retryable."""
+    # Remote outages tend to last, so retry more often and back off further.
+    retry_policy = RetryPolicy(max_attempts=5, base_delay=2.0, max_delay=600.0)
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        limiter: HostLimiter | None = None,
+    ) -> None:
+        self._client = client
+        self._limiter = limiter or host_limiter
+
+    def breaker_key(self, context: ExecutionContext) -> str | None:
+        try:
+            host = httpx.URL(context.config.get("url") or "").host
+        except httpx.InvalidURL:
+            host = ""
+        return f"{self.__class__.__name__}:{host}"
+
+    def _request_kwargs(self, context: ExecutionContext) -> dict:
+        config = context.config
+        kwargs: dict = {"headers": config.get("headers") or {}}
+        if "json" in config:
+            kwargs["json"] = config["json"]
+        elif "body" in config:
+            kwargs["content"] = config["body"]
+        else:
+            kwargs["json"] = context.event.model_dump(mode="json")
+        if "timeout_seconds" in config:
+            kwargs["timeout"] = float(config["timeout_seconds"])
+        return kwargs
+
+    async def run(self, context: ExecutionContext) -> ActionResult:
+        url = context.config.get("url")
+        if not url:
+            return ActionResult(status="failed", error="http_call requires config.url", retryable=False)
+
+        method = context.config.get("method", "POST").upper()
+        max_bytes = int(context.config.get("max_response_bytes", settings.HTTP_MAX_RESPONSE_BYTES))
+        client = self._client or get_http_client()
+
+        try:
+            request = client.build_request(method, url, **self._request_kwargs(context))
+            async with self._limiter.for_host(request.url.host):
+                response = await client.send(request, stream=True)
+                try:
+                    body, truncated = await self._read_body(response, max_bytes)
+                finally:
+                    await response.aclose()
+        except httpx.InvalidURL as e:
+            return ActionResult(status="failed", error=str(e), retryable=False)
+        except httpx.TransportError as e:
+            return ActionResult(
+                status="failed",
+                error=f"{e.__class__.__name__}: {e}",
+                retryable=True,
+            )
+
+        result = {
+            "status_code": response.status_code,
+            "body": body.decode(response.charset_encoding or "utf-8", errors="replace"),
+            "truncated": truncated,
+        }
+        if response.is_success:
+            return ActionResult(status="success", result=result)
+
+        return ActionResult(
+            status="failed",
+            result=result,
+            error=f"HTTP {response.status_code}",
+            retryable=response.status_code in RETRYABLE_STATUS_CODES,
+        )
+
+    @staticmethod
+    async def _read_body(response: httpx.Response, max_bytes: int) -> tuple[bytes, bool]:
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            if size + len(chunk) > max_bytes:
+                chunks.append(chunk[: max_bytes - size])
+                return b"".join(chunks), True
+            chunks.append(chunk)
+            size += len(chunk)
+        return b"".join(chunks), False
@@ -0,0 +1,88 @@
+import importlib
+import logging
+from importlib.metadata import entry_points
+
+from src.actions.base import BaseAction
+from src.core.exceptions import UnknownActionType
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "workflows.actions"
+
+# Task type -> "module:Class". Modules are imported on first use only.
+BUILTIN_ACTIONS: dict[str, str] = {
+    "log": "src.actions.log:LogAction",
+    "delay": "src.actions.delay:DelayAction",
+    "http_call": "src.actions.http_call:HttpCallAction",
+    "hash": "src.actions.hash:HashAction",
+}
+
+
+class ActionRegistry:
+    """Maps task types to action instances from built-ins and ``workflows.actions`` entry points."""
+
+    def __init__(
+        self,
+        builtins: dict[str, str] | None = None,
+        group: str | None = ENTRY_POINT_GROUP,
+    ) -> None:
+        self._builtins = dict(BUILTIN_ACTIONS if builtins is None else builtins)
+        self._group = group
+        self._targets: dict[str, str | type[BaseAction]] | None = None
+        # Imported and instantiated on first lookup, then kept for the life of
+        # the process, so actions must not keep per-run state.
+        self._instances: dict[str, BaseAction] = {}
+
+    def _load_targets(self) -> dict[str, str | type[BaseAction]]:
+        targets: dict[str, str | type[BaseAction]] = {}
+        if self._group:
+            for entry_point in entry_points(group=self._group):
+                targets[entry_point.name] = entry_point.value
+        for task_type, target in self._builtins.items():
+            if task_type in targets and targets[task_type] != target:
+                logger.warning(
+                    "Entry point shadowed by built-in action",
+                    extra={"task_type": task_type, "entry_point": targets[task_type]},
+                )
+            targets[task_type] = target
+        return targets
+
+    @property
+    def _resolved_targets(self) -> dict[str, str | type[BaseAction]]:
+        if self._targets is None:
+            self._targets = self._load_targets()
+        return self._targets
+
+    def register(self, task_type: str, target: str | type[BaseAction]) -> None:
+        """Add or replace a type; ``target`` is a class or a "module:Class" path."""
+        self._resolved_targets[task_type] = target
+        self._instances.pop(task_type, None)
+
+    def types(self) -> list[str]:
+        return sorted(self._resolved_targets)
+
+    def _import(self, task_type: str, target: str | type[BaseAction]) -> type[BaseAction]:
+        if not isinstance(target, str):
+            return target
+
+        module_name, _, attr = target.partition(":")
+        action_cls = getattr(importlib.import_module(module_name), attr)
+        if not (isinstance(action_cls, type) and issubclass(action_cls, BaseAction)):
+            raise TypeError(f"{target} registered for {task_type!r} is not a BaseAction")
+        return action_cls
+
+    def get(self, task_type: str) -> BaseAction:
+        action = self._instances.get(task_type)
+        if action is not None:
+            return action
+
+        target = self._resolved_targets.get(task_type)
+        if target is None:
+            raise UnknownActionType(f"Unknown task type: {task_type!r}")
+
+        action = self._import(task_type, target)()
+        self._instances[task_type] = action
+        return action
+
+
+action_registry = ActionRegistry()
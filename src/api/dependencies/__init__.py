@@ -1,10 +1,12 @@
 from src.api.dependencies.auth import authorize
 from src.api.dependencies.producer import get_event_producer
+from src.api.dependencies.triggers import get_trigger_service
 from src.api.dependencies.workflows import get_workflow_repo, get_workflow_service
 
 __all__ = (
     "authorize",
     "get_event_producer",
+    "get_trigger_service",
     "get_workflow_repo",
     "get_workflow_service",
 )
\ No newline at end of file
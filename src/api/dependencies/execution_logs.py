@@ -1,11 +1,37 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import get_session
+from src.api.dependencies.producer import get_event_producer
+from src.core.config import settings
+from src.db.session import async_session_factory, get_read_session, get_session
+from src.infrastructure.messaging.base import EventProducer
 from src.repositories.execution_log import ExecutionLogRepository
+from src.services.dlq_redrive import DlqRedrive
+from src.services.execution_log_archive import ExecutionLogArchive, execution_log_archive
 
 
 def get_execution_log_repo(
     session: AsyncSession = Depends(get_session),
 ) -> ExecutionLogRepository:
     return ExecutionLogRepository(session)
+
+
+def get_execution_log_read_repo(
+    session: AsyncSession = Depends(get_read_session),
+) -> ExecutionLogRepository:
+    return ExecutionLogRepository(session)
+
+
+def get_dlq_redrive(
+    producer: EventProducer = Depends(get_event_producer),
+) -> DlqRedrive:
+    return DlqRedrive(
+        async_session_factory,
+        producer,
+        batch_size=settings.DLQ_REDRIVE_BATCH_SIZE,
+        rate=settings.DLQ_REDRIVE_RATE_PER_SECOND,
+    )
+
+
+def get_execution_log_archive() -> ExecutionLogArchive | None:
+    return execution_log_archive
@@ -1,7 +1,7 @@
 from fastapi import Request
 
-from src.infrastructure.messaging.producer import PubSubProducer
+from src.infrastructure.messaging.base import EventProducer
 
 
-def get_event_producer(request: Request) -> PubSubProducer:
+def get_event_producer(request: Request) -> EventProducer:
     return request.app.state.event_producer
@@ -0,0 +1,20 @@
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies.producer import get_event_producer
+from src.core.config import settings
+from src.db.session import get_session
+from src.repositories.event_outbox import EventOutboxRepository
+from src.services.trigger import TriggerService
+
+
+def get_trigger_service(
+        request: Request,
+        session: AsyncSession = Depends(get_session),
+) -> TriggerService:
+    return TriggerService(
+        get_event_producer(request),
+        EventOutboxRepository(session),
+        session,
+        use_outbox=settings.EVENT_OUTBOX_ENABLED,
+    )
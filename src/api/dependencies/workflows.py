@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.dependencies.tasks import get_task_repo
 from src.repositories.task import TaskRepository
 from src.repositories.workflow import WorkflowRepository
-from src.db.session import get_session
+from src.db.session import get_read_session, get_session
 from src.services.workflow import WorkflowService
 
 
@@ -19,3 +19,9 @@ def get_workflow_service(
 ) -> WorkflowService:
     return WorkflowService(repo, task, session)
 
+
+def get_workflow_read_service(
+        session: AsyncSession = Depends(get_read_session),
+) -> WorkflowService:
+    """Service for GET endpoints, on the read replica when one is configured."""
+    return WorkflowService(WorkflowRepository(session), TaskRepository(session), session)
@@ -1,11 +1,22 @@
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from src.api.dependencies.auth import authorize
-from src.api.dependencies.execution_logs import get_execution_log_repo
-from src.models.execution_log import ExecutionLogListResponse
+from src.api.dependencies.execution_logs import (
+    get_dlq_redrive,
+    get_execution_log_archive,
+    get_execution_log_read_repo,
+)
+from src.models.execution_log import (
+    DlqRedriveRequest,
+    DlqRedriveStatus,
+    ExecutionLogListResponse,
+)
 from src.repositories.execution_log import ExecutionLogRepository
+from src.services.dlq_redrive import DlqFilter, DlqRedrive, redrive_jobs
+from src.services.execution_log_archive import ExecutionLogArchive, list_page_with_archive
 
 
 router = APIRouter(
@@ -19,6 +30,13 @@ router = APIRouter(
     "",
     response_model=ExecutionLogListResponse,
     summary="List execution logs with filters",
+    description=(
+        "Newest first. Pass `next_cursor` from the previous response as `cursor` "
+        "to get the next page; `offset` is kept for existing clients, cannot be "
+        "combined with `cursor`, and deep offsets scan every skipped row. When the Parquet archive is configured "
+        "and `since` predates what is kept in Postgres, cursor pages continue "
+        "into the archive."
+    ),
 )
 async def list_execution_logs(
     workflow_id: UUID | None = None,
@@ -26,17 +44,67 @@ async def list_execution_logs(
     status: str | None = None,
     trace_id: str | None = None,
     queued_to_dlq: bool | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-    repo: ExecutionLogRepository = Depends(get_execution_log_repo),
+    cursor: str | None = None,
+    repo: ExecutionLogRepository = Depends(get_execution_log_read_repo),
+    archive: ExecutionLogArchive | None = Depends(get_execution_log_archive),
 ) -> ExecutionLogListResponse:
-    logs = await repo.list(
-        workflow_id=workflow_id,
-        event_id=event_id,
-        status=status,
-        trace_id=trace_id,
-        queued_to_dlq=queued_to_dlq,
-        limit=limit,
-        offset=offset,
+    try:
+        logs, next_cursor = await list_page_with_archive(
+            repo,
+            archive,
+            workflow_id=workflow_id,
+            event_id=event_id,
+            status=status,
+            trace_id=trace_id,
+            queued_to_dlq=queued_to_dlq,
+            since=since,
+            until=until,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        # ``status`` is the query parameter here, not ``fastapi.status``.
+        raise HTTPException(status_code=400, detail=str(e))
+    return ExecutionLogListResponse(items=logs, count=len(logs), next_cursor=next_cursor)
+
+
+@router.post(
+    "/dlq/redrive",
+    response_model=DlqRedriveStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Re-publish DLQ'd executions matching the filters",
+)
+async def redrive_dlq(
+    body: DlqRedriveRequest,
+    redrive: DlqRedrive = Depends(get_dlq_redrive),
+) -> DlqRedriveStatus:
+    dlq_filter = DlqFilter(
+        workflow_id=body.workflow_id,
+        since=body.since,
+        until=body.until,
+        error=body.error,
     )
-    return ExecutionLogListResponse(items=logs, count=len(logs))
+    if body.dry_run:
+        return DlqRedriveStatus(total=await redrive.count(dlq_filter), done=True)
+    return DlqRedriveStatus.model_validate(redrive_jobs.start(redrive, dlq_filter))
+
+
+@router.get(
+    "/dlq/redrive/{redrive_id}",
+    response_model=DlqRedriveStatus,
+    summary="Progress of a DLQ re-drive",
+    description=(
+        "Re-drives are tracked in memory by the API instance that started them; "
+        "other instances answer 404."
+    ),
+)
+async def get_dlq_redrive_status(redrive_id: UUID) -> DlqRedriveStatus:
+    progress = redrive_jobs.get(redrive_id)
+    if progress is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Re-drive not found")
+    return DlqRedriveStatus.model_validate(progress)
@@ -1,11 +1,12 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Request, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends
 
-from src.api.dependencies import get_event_producer, authorize
-from src.api.schemas import WorkflowTriggerPayload
+from src.api.dependencies import get_trigger_service, authorize
+from src.api.schemas import WorkflowTriggerPayload, WorkflowTriggerBatchPayload
 from src.core.request_context import get_request_id
 from src.events.builder import build_event_envelope
+from src.services.trigger import TriggerService
 
 router = APIRouter(
     prefix="/triggers",
@@ -13,6 +14,67 @@ router = APIRouter(
 )
 
 
+@router.post(
+    "/webhook/batch",
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def trigger_workflows_batch(
+        payload: WorkflowTriggerBatchPayload,
+        service: TriggerService = Depends(get_trigger_service),
+):
+    trace_id = get_request_id()
+    envelopes = [
+        build_event_envelope(
+            event_type="workflow.triggered",
+            payload={
+                "workflow_id": item.workflow_id,
+                "source": item.source,
+            },
+            trace_id=trace_id,
+        )
+        for item in payload.items
+    ]
+
+    try:
+        results = await service.dispatch_batch(envelopes)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Event pipeline unavailable: {str(e)}",
+        )
+
+    items = []
+    for item, envelope, result in zip(payload.items, envelopes, results):
+        if isinstance(result, BaseException):
+            items.append({
+                "workflow_id": item.workflow_id,
+                "event_id": envelope.event_id,
+                "status": "failed",
+                "error": str(result) or result.__class__.__name__,
+            })
+        else:
+            items.append({
+                "workflow_id": item.workflow_id,
+                "event_id": envelope.event_id,
+                "status": "accepted",
+            })
+
+    failed = sum(item["status"] == "failed" for item in items)
+    if failed == len(items):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Event pipeline unavailable: no events were published",
+        )
+
+    return {
+        "status": "accepted" if not failed else "partial",
+        "accepted": len(items) - failed,
+        "failed": failed,
+        "items": items,
+        "trace_id": trace_id,
+    }
+
+
 @router.post(
     "/webhook/{workflow_id}",
     status_code=status.HTTP_202_ACCEPTED
@@ -20,7 +82,7 @@ router = APIRouter(
 async def trigger_workflow(
         workflow_id: UUID,
         payload: WorkflowTriggerPayload,
-        request: Request,
+        service: TriggerService = Depends(get_trigger_service),
 ):
     trace_id = get_request_id()
     envelope = build_event_envelope(
@@ -32,11 +94,8 @@ async def trigger_workflow(
         trace_id=trace_id,
     )
 
-    producer = get_event_producer(request)
-
-
     try:
-        producer.publish(envelope)
+        await service.dispatch(envelope)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -47,4 +106,4 @@ async def trigger_workflow(
         "status": "accepted",
         "event_id": envelope.event_id,
         "trace_id": trace_id,
-    }
\ No newline at end of file
+    }
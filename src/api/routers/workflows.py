@@ -1,7 +1,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
-from src.api.dependencies.workflows import get_workflow_service
+from src.api.dependencies.workflows import get_workflow_read_service, get_workflow_service
 from src.api.dependencies.auth import authorize
 from src.models.workflow import WorkflowCreate, WorkflowRead, WorkflowUpdate
 from src.services.workflow import WorkflowService
@@ -24,7 +24,7 @@ router = APIRouter(
 )
 async def get_workflow(
     workflow_id: UUID,
-    service: WorkflowService = Depends(get_workflow_service),
+    service: WorkflowService = Depends(get_workflow_read_service),
 ):
     return await service.get_workflow(workflow_id)
 
@@ -39,7 +39,7 @@ async def get_workflow(
     },
 )
 async def list_workflows(
-    service: WorkflowService = Depends(get_workflow_service),
+    service: WorkflowService = Depends(get_workflow_read_service),
 ):
     return await service.list_workflows()
 
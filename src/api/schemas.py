@@ -6,3 +6,12 @@ from pydantic import BaseModel, Field
 class WorkflowTriggerPayload(BaseModel):
     workflow_id: UUID = Field(..., description="Workflow identifier")
     source: str | None = None
+
+
+class WorkflowTriggerBatchPayload(BaseModel):
+    items: list[WorkflowTriggerPayload] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Triggers to publish in one call",
+    )
@@ -13,11 +13,124 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     INSTANCE_CONNECTION_NAME: str | None = None
 
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Transaction-pooling PgBouncer in front of Postgres: no prepared statement caches.
+    DB_PGBOUNCER_MODE: bool = False
+    # Connection bypassing PgBouncer, for LISTEN (the workflow cache listener).
+    DB_DIRECT_URL: str | None = None
+
+    DB_REPLICA_URL: str | None = None
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+
     ENV: str = "local"
     LOG_LEVEL: str = "INFO"
 
     GCP_PROJECT_ID: str
     PUBSUB_TOPIC_WORKFLOW_EVENTS: str
+    PUBSUB_SUBSCRIPTION_WORKFLOW_EVENTS: str | None = None
+
+    WORKER_DRAIN_TIMEOUT_SECONDS: float = 8.0
+
+    PULL_CONCURRENCY: int = 20
+    PULL_MAX_MESSAGES: int = 100
+    PULL_MAX_BYTES: int = 10 * 1024 * 1024
+    PULL_MAX_LEASE_DURATION_SECONDS: int = 600
+
+    EVENT_TRANSPORT: str = "pubsub"
+    PG_QUEUE_BATCH_SIZE: int = 10
+    PG_QUEUE_CONSUMERS: int = 4
+    PG_QUEUE_VISIBILITY_TIMEOUT_SECONDS: float = 30.0
+    PG_QUEUE_POLL_INTERVAL_SECONDS: float = 0.5
+    PG_QUEUE_MAX_DELIVERIES: int = 10
+
+    INPROCESS_QUEUE_SIZE: int = 1000
+    INPROCESS_CONSUMERS: int = 8
+    INPROCESS_ENQUEUE_TIMEOUT_SECONDS: float = 0.1
+    INPROCESS_REDELIVERY_DELAY_SECONDS: float = 1.0
+    INPROCESS_MAX_DELIVERIES: int = 10
+
+    WORKFLOW_CACHE_ENABLED: bool = True
+    WORKFLOW_CACHE_MAX_SIZE: int = 10_000
+    WORKFLOW_CACHE_TTL_SECONDS: float = 30.0
+
+    WORKFLOW_MAX_PARALLEL_STEPS: int = 10
+    WORKFLOW_STEP_TIMEOUT_SECONDS: float = 10.0
+    WORKFLOW_TIMEOUT_SECONDS: float = 60.0
+
+    WORKFLOW_CONCURRENCY_LIMITS_ENABLED: bool = False
+    WORKFLOW_MAX_CONCURRENCY: int = 10
+    WORKFLOW_CONCURRENCY_OVERRIDES: dict[str, int] = {}
+    WORKER_MAX_CONCURRENCY: int = 100
+    WORKFLOW_MAX_WAITING: int = 100
+    WORKFLOW_MAX_WAIT_SECONDS: float = 2.0
+    WORKFLOW_DEFER_SECONDS: float = 1.0
+
+    HTTP_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    HTTP_MAX_CONNECTIONS: int = 200
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 50
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP2_ENABLED: bool = False
+    HTTP_MAX_CONCURRENCY_PER_HOST: int = 20
+    HTTP_MAX_RESPONSE_BYTES: int = 1024 * 1024
+
+    ACTION_THREAD_POOL_SIZE: int = 8
+    ACTION_PROCESS_POOL_SIZE: int | None = None
+    ACTION_PROCESS_START_METHOD: str = "spawn"
+
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: float = 0.5
+    CIRCUIT_BREAKER_WINDOW: int = 20
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0
+    CIRCUIT_BREAKER_HALF_OPEN_PROBES: int = 1
+
+    DELAYED_RETRIES_ENABLED: bool = False
+    RETRY_SCHEDULER_BATCH_SIZE: int = 100
+    RETRY_SCHEDULER_POLL_INTERVAL_SECONDS: float = 1.0
+    RETRY_SCHEDULER_LEASE_SECONDS: float = 30.0
+
+    EXECUTION_LOG_WRITE_BEHIND_ENABLED: bool = False
+    EXECUTION_LOG_FLUSH_INTERVAL_MS: int = 50
+    EXECUTION_LOG_FLUSH_MAX_ROWS: int = 500
+    EXECUTION_LOG_FLUSH_MAX_ATTEMPTS: int = 5
+    EXECUTION_LOG_SPOOL_DIR: str | None = None
+
+    # execution_logs range partitions: width, how many to keep created ahead,
+    # and how old a partition must be before it is dropped (None keeps all).
+    EXECUTION_LOG_PARTITION_DAYS: int = 1
+    EXECUTION_LOG_PARTITIONS_AHEAD: int = 7
+    EXECUTION_LOG_RETENTION_DAYS: int | None = None
+    EXECUTION_LOG_PARTITION_CHECK_INTERVAL_SECONDS: float = 3600.0
+    EXECUTION_LOG_KEY_DELETE_BATCH_SIZE: int = 5000
+
+    # Parquet archive of old execution logs: a local path or a pyarrow
+    # filesystem URI (s3://, gs://). None disables archiving and archive reads.
+    EXECUTION_LOG_ARCHIVE_URI: str | None = None
+    EXECUTION_LOG_ARCHIVE_AFTER_DAYS: int = 30
+    EXECUTION_LOG_ARCHIVE_BATCH_SIZE: int = 10000
+    EXECUTION_LOG_ARCHIVE_DELETE_BATCH_SIZE: int = 1000
+    EXECUTION_LOG_ARCHIVE_FILE_ROWS: int = 1_000_000
+
+    DLQ_REDRIVE_BATCH_SIZE: int = 500
+    DLQ_REDRIVE_RATE_PER_SECOND: float = 1000.0
+
+    EXECUTION_LEASE_GRACE_SECONDS: float = 30.0
+    EXECUTION_CLAIM_CONFLICT_RETRY_SECONDS: float = 5.0
+    LEASE_SWEEPER_INTERVAL_SECONDS: float = 60.0
+
+    EVENT_OUTBOX_ENABLED: bool = False
+    OUTBOX_RELAY_BATCH_SIZE: int = 100
+    OUTBOX_RELAY_POLL_INTERVAL_SECONDS: float = 0.5
+    OUTBOX_RELAY_LEASE_SECONDS: float = 30.0
+    OUTBOX_RELAY_MAX_ATTEMPTS: int = 10
+    OUTBOX_RELAY_BACKOFF_SECONDS: float = 1.0
+    OUTBOX_RELAY_MAX_BACKOFF_SECONDS: float = 300.0
 
     @cached_property
     def DATABASE_URL(self):
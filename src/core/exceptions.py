@@ -34,6 +34,10 @@ class WorkerFatalError(WorkerError):
     retryable = False
 
 
+class UnknownActionType(WorkerFatalError):
+    pass
+
+
 def app_exception_handler(request: Request, exc: WorkflowResolutionError):
     return JSONResponse(
         status_code=400,
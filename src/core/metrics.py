@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 
 WORKER_ATTEMPTS_TOTAL = Counter(
@@ -32,6 +32,238 @@ WORKER_DURATION_SECONDS = Histogram(
     buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
 )
 
+WORKER_DELIVERY_LAG_SECONDS = Histogram(
+    "worker_event_delivery_lag_seconds",
+    "Time from event creation until the worker starts handling it",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+WORKER_CIRCUIT_BREAKER_STATE = Gauge(
+    "worker_circuit_breaker_state",
+    "Circuit breaker state (0 = closed, 1 = half-open, 2 = open)",
+    ["breaker"],
+)
+
+WORKER_CIRCUIT_BREAKER_TRANSITIONS_TOTAL = Counter(
+    "worker_circuit_breaker_transitions_total",
+    "Number of circuit breaker state changes",
+    ["breaker", "state"],
+)
+
+WORKER_CIRCUIT_BREAKER_REJECTED_TOTAL = Counter(
+    "worker_circuit_breaker_rejected_total",
+    "Number of action runs short-circuited by an open breaker",
+    ["breaker"],
+)
+
+WORKER_WORKFLOW_ADMITTED_TOTAL = Counter(
+    "worker_workflow_admitted_total",
+    "Number of events admitted past the per-workflow concurrency limit",
+    ["workflow_id"],
+)
+
+WORKER_WORKFLOW_DEFERRED_TOTAL = Counter(
+    "worker_workflow_deferred_total",
+    "Number of events deferred because their workflow was at its concurrency limit",
+    ["workflow_id"],
+)
+
+WORKER_WORKFLOW_WAITING = Gauge(
+    "worker_workflow_waiting",
+    "Events waiting for a per-workflow concurrency slot",
+    ["workflow_id"],
+)
+
+WORKER_ACTION_POOL_PENDING = Gauge(
+    "worker_action_pool_pending",
+    "Thread/process pool action runs submitted and not yet finished",
+    ["mode"],
+)
+
+WORKER_ACTION_POOL_QUEUE_DEPTH = Gauge(
+    "worker_action_pool_queue_depth",
+    "Thread/process pool action runs waiting for a free pool worker",
+    ["mode"],
+)
+
+WORKER_EXECUTION_LOG_BUFFERED = Gauge(
+    "worker_execution_log_buffered",
+    "Execution log updates waiting in the write-behind buffer",
+)
+
+WORKER_EXECUTION_LOG_FLUSHED_TOTAL = Counter(
+    "worker_execution_log_flushed_total",
+    "Execution log updates written by the write-behind buffer",
+)
+
+WORKER_EXECUTION_LOG_DROPPED_TOTAL = Counter(
+    "worker_execution_log_dropped_total",
+    "Execution log updates dropped by the write-behind buffer after repeated failures",
+)
+
+DLQ_REDRIVEN_TOTAL = Counter(
+    "dlq_redriven_total",
+    "DLQ executions re-published by a re-drive, by outcome",
+    ["outcome"],
+)
+
+WORKER_IN_FLIGHT = Gauge(
+    "worker_in_flight_events",
+    "Events currently being handled by this worker process",
+)
+
+WORKER_DRAIN_REJECTED_TOTAL = Counter(
+    "worker_drain_rejected_total",
+    "Push deliveries refused with 503 while the worker was draining",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Database connections currently checked out of the pool",
+    ["engine"],
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond the pool size",
+    ["engine"],
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured database pool size",
+    ["engine"],
+)
+
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+DB_POOL_TIMEOUTS_TOTAL = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after the pool timeout",
+    ["engine"],
+)
+
+DB_READ_SESSIONS_TOTAL = Counter(
+    "db_read_sessions_total",
+    "Read-only sessions opened, by the engine that served them",
+    ["engine"],
+)
+
+DB_REPLICA_LAG_SECONDS = Gauge(
+    "db_replica_lag_seconds",
+    "Last measured read replica lag (+Inf when unreachable)",
+)
+
+EXECUTION_LOG_PARTITIONS_AHEAD_SECONDS = Gauge(
+    "execution_log_partitions_ahead_seconds",
+    "How far past now the execution_logs range partitions reach",
+)
+
+EXECUTION_LOG_PARTITIONS_CREATED_TOTAL = Counter(
+    "execution_log_partitions_created_total",
+    "Number of execution_logs partitions created ahead of time",
+)
+
+EXECUTION_LOG_PARTITIONS_DROPPED_TOTAL = Counter(
+    "execution_log_partitions_dropped_total",
+    "Number of execution_logs partitions dropped by retention",
+)
+
+EXECUTION_LOGS_ARCHIVED_TOTAL = Counter(
+    "execution_logs_archived_total",
+    "Number of execution log rows moved to the Parquet archive",
+)
+
+WORKFLOW_CACHE_HITS_TOTAL = Counter(
+    "worker_workflow_cache_hits_total",
+    "Number of workflow lookups served from the resolver cache",
+)
+
+WORKFLOW_CACHE_MISSES_TOTAL = Counter(
+    "worker_workflow_cache_misses_total",
+    "Number of workflow lookups that went to the database",
+)
+
+WORKFLOW_CACHE_INVALIDATIONS_TOTAL = Counter(
+    "worker_workflow_cache_invalidations_total",
+    "Number of cached workflows evicted by change notifications",
+)
+
+INPROCESS_QUEUE_DEPTH = Gauge(
+    "inprocess_queue_depth",
+    "Number of events waiting in the in-process transport queue",
+)
+
+OUTBOX_BACKLOG_SIZE = Gauge(
+    "outbox_backlog_size",
+    "Number of events waiting in the outbox",
+)
+
+OUTBOX_RELAY_LAG_SECONDS = Gauge(
+    "outbox_relay_lag_seconds",
+    "Age of the oldest event waiting in the outbox",
+)
+
+OUTBOX_PUBLISHED_TOTAL = Counter(
+    "outbox_published_total",
+    "Number of outbox events relayed to the event transport",
+)
+
+OUTBOX_PUBLISH_FAILURES_TOTAL = Counter(
+    "outbox_publish_failures_total",
+    "Number of outbox events that failed to publish",
+)
+
+OUTBOX_DEAD_LETTERED_TOTAL = Counter(
+    "outbox_dead_lettered_total",
+    "Number of outbox events given up on after the maximum publish attempts",
+)
+
+PG_QUEUE_DEAD_LETTERED_TOTAL = Counter(
+    "pg_queue_dead_lettered_total",
+    "Number of workflow_events messages given up on after the maximum deliveries",
+)
+
+EXECUTION_LEASES_EXPIRED = Gauge(
+    "execution_leases_expired",
+    "Number of pending execution logs whose lease has expired",
+)
+
+EXECUTION_LEASE_OLDEST_EXPIRED_SECONDS = Gauge(
+    "execution_lease_oldest_expired_seconds",
+    "Time since the oldest pending execution lease expired",
+)
+
+EXECUTION_LEASE_RECLAIMS_TOTAL = Counter(
+    "execution_lease_reclaims_total",
+    "Number of pending executions reclaimed after their lease expired",
+)
+
+RETRIES_SCHEDULED_TOTAL = Counter(
+    "worker_retries_scheduled_total",
+    "Number of retryable failures scheduled for a delayed retry",
+)
+
+RETRIES_REINJECTED_TOTAL = Counter(
+    "worker_retries_reinjected_total",
+    "Number of scheduled retries re-published to the event transport",
+)
+
+RETRY_REINJECT_FAILURES_TOTAL = Counter(
+    "worker_retry_reinject_failures_total",
+    "Number of scheduled retries that failed to re-publish",
+)
+
+RETRY_BACKLOG_SIZE = Gauge(
+    "worker_retry_backlog_size",
+    "Number of events waiting in scheduled_retries",
+)
+
 
 def _label(workflow_id) -> dict:
     return {"workflow_id": str(workflow_id)}
@@ -55,3 +287,146 @@ def record_dlq(workflow_id) -> None:
 
 def record_duration(workflow_id, duration_seconds: float) -> None:
     WORKER_DURATION_SECONDS.labels(**_label(workflow_id)).observe(duration_seconds)
+
+
+def record_delivery_lag(lag_seconds: float) -> None:
+    WORKER_DELIVERY_LAG_SECONDS.observe(max(lag_seconds, 0.0))
+
+
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def record_circuit_transition(breaker: str, state: str) -> None:
+    WORKER_CIRCUIT_BREAKER_STATE.labels(breaker=breaker).set(CIRCUIT_STATE_VALUES[state])
+    WORKER_CIRCUIT_BREAKER_TRANSITIONS_TOTAL.labels(breaker=breaker, state=state).inc()
+
+
+def record_circuit_rejected(breaker: str) -> None:
+    WORKER_CIRCUIT_BREAKER_REJECTED_TOTAL.labels(breaker=breaker).inc()
+
+
+def record_workflow_admitted(workflow_id: str) -> None:
+    WORKER_WORKFLOW_ADMITTED_TOTAL.labels(workflow_id=workflow_id).inc()
+
+
+def record_workflow_deferred(workflow_id: str) -> None:
+    WORKER_WORKFLOW_DEFERRED_TOTAL.labels(workflow_id=workflow_id).inc()
+
+
+def record_workflow_waiting(workflow_id: str, waiting: int) -> None:
+    WORKER_WORKFLOW_WAITING.labels(workflow_id=workflow_id).set(waiting)
+
+
+def record_action_pool_depth(mode: str, pending: int, queued: int) -> None:
+    WORKER_ACTION_POOL_PENDING.labels(mode=mode).set(pending)
+    WORKER_ACTION_POOL_QUEUE_DEPTH.labels(mode=mode).set(queued)
+
+
+def record_execution_log_buffered(size: int) -> None:
+    WORKER_EXECUTION_LOG_BUFFERED.set(size)
+
+
+def record_execution_log_flushed(count: int) -> None:
+    WORKER_EXECUTION_LOG_FLUSHED_TOTAL.inc(count)
+
+
+def record_execution_log_dropped(count: int) -> None:
+    WORKER_EXECUTION_LOG_DROPPED_TOTAL.inc(count)
+
+
+def record_dlq_redriven(published: int, failed: int) -> None:
+    DLQ_REDRIVEN_TOTAL.labels(outcome="published").inc(published)
+    DLQ_REDRIVEN_TOTAL.labels(outcome="failed").inc(failed)
+
+
+def record_in_flight(count: int) -> None:
+    WORKER_IN_FLIGHT.set(count)
+
+
+def record_drain_rejected() -> None:
+    WORKER_DRAIN_REJECTED_TOTAL.inc()
+
+
+def record_db_pool_state(engine: str, checked_out: int, overflow: int, size: int) -> None:
+    DB_POOL_CHECKED_OUT.labels(engine=engine).set(checked_out)
+    DB_POOL_OVERFLOW.labels(engine=engine).set(overflow)
+    DB_POOL_SIZE.labels(engine=engine).set(size)
+
+
+def record_db_pool_wait(engine: str, seconds: float) -> None:
+    DB_POOL_WAIT_SECONDS.labels(engine=engine).observe(seconds)
+
+
+def record_db_pool_timeout(engine: str) -> None:
+    DB_POOL_TIMEOUTS_TOTAL.labels(engine=engine).inc()
+
+
+def record_read_session(engine: str) -> None:
+    DB_READ_SESSIONS_TOTAL.labels(engine=engine).inc()
+
+
+def record_replica_lag(seconds: float) -> None:
+    DB_REPLICA_LAG_SECONDS.set(seconds)
+
+
+def record_execution_log_partitions(ahead_seconds: float, created: int, dropped: int) -> None:
+    EXECUTION_LOG_PARTITIONS_AHEAD_SECONDS.set(ahead_seconds)
+    EXECUTION_LOG_PARTITIONS_CREATED_TOTAL.inc(created)
+    EXECUTION_LOG_PARTITIONS_DROPPED_TOTAL.inc(dropped)
+
+
+def record_execution_logs_archived(rows: int) -> None:
+    EXECUTION_LOGS_ARCHIVED_TOTAL.inc(rows)
+
+
+def record_workflow_cache_hit() -> None:
+    WORKFLOW_CACHE_HITS_TOTAL.inc()
+
+
+def record_workflow_cache_miss() -> None:
+    WORKFLOW_CACHE_MISSES_TOTAL.inc()
+
+
+def record_workflow_cache_invalidation() -> None:
+    WORKFLOW_CACHE_INVALIDATIONS_TOTAL.inc()
+
+
+def record_inprocess_queue_depth(depth: int) -> None:
+    INPROCESS_QUEUE_DEPTH.set(depth)
+
+
+def record_pg_queue_dead_lettered(count: int) -> None:
+    PG_QUEUE_DEAD_LETTERED_TOTAL.inc(count)
+
+
+def record_outbox_relayed(published: int, failed: int, dead_lettered: int = 0) -> None:
+    OUTBOX_PUBLISHED_TOTAL.inc(published)
+    OUTBOX_PUBLISH_FAILURES_TOTAL.inc(failed)
+    OUTBOX_DEAD_LETTERED_TOTAL.inc(dead_lettered)
+
+
+def record_outbox_backlog(size: int, lag_seconds: float) -> None:
+    OUTBOX_BACKLOG_SIZE.set(size)
+    OUTBOX_RELAY_LAG_SECONDS.set(lag_seconds)
+
+
+def record_expired_leases(count: int, oldest_seconds: float) -> None:
+    EXECUTION_LEASES_EXPIRED.set(count)
+    EXECUTION_LEASE_OLDEST_EXPIRED_SECONDS.set(oldest_seconds)
+
+
+def record_lease_reclaim() -> None:
+    EXECUTION_LEASE_RECLAIMS_TOTAL.inc()
+
+
+def record_retry_scheduled() -> None:
+    RETRIES_SCHEDULED_TOTAL.inc()
+
+
+def record_retries_reinjected(published: int, failed: int) -> None:
+    RETRIES_REINJECTED_TOTAL.inc(published)
+    RETRY_REINJECT_FAILURES_TOTAL.inc(failed)
+
+
+def record_retry_backlog(size: int) -> None:
+    RETRY_BACKLOG_SIZE.set(size)
@@ -2,5 +2,18 @@ from src.db.models.workflow import Workflow
 from src.db.models.task import Task
 from src.db.models.trigger import Trigger
 from src.db.models.execution_log import ExecutionLog
+from src.db.models.execution_log_key import ExecutionLogKey
+from src.db.models.event_outbox import EventOutbox
+from src.db.models.workflow_event import WorkflowEvent
+from src.db.models.scheduled_retry import ScheduledRetry
 
-__all__ = ["ExecutionLog", "Workflow", "Task", "Trigger"]
+__all__ = [
+    "EventOutbox",
+    "ExecutionLog",
+    "ExecutionLogKey",
+    "ScheduledRetry",
+    "Workflow",
+    "Task",
+    "Trigger",
+    "WorkflowEvent",
+]
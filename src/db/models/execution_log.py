@@ -9,7 +9,6 @@ from sqlalchemy import (
     Numeric,
     ForeignKey,
     JSON,
-    UniqueConstraint,
     Index,
     Integer,
     text,
@@ -23,10 +22,18 @@ from src.db.base import Base
 class ExecutionLog(Base):
     __tablename__ = "execution_logs"
     __table_args__ = (
-        UniqueConstraint("event_id", "workflow_id", name="uq_execution_logs_event_workflow"),
         Index("ix_execution_logs_workflow_created", "workflow_id", "created_at"),
         Index("ix_execution_logs_workflow_status_created", "workflow_id", "status", "created_at"),
         Index("ix_execution_logs_queued_to_dlq_created", "queued_to_dlq", "created_at"),
+        Index(
+            "ix_execution_logs_pending_lease",
+            "lease_expires_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Range partitions are created and dropped by PartitionMaintainer.
+        # Idempotency keys live in ``execution_log_keys``: a unique index
+        # here would have to include ``created_at``.
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -36,6 +43,7 @@ class ExecutionLog(Base):
         nullable=False,
     )
     event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    task_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     trace_id: Mapped[str] = mapped_column(String(64), nullable=False)
     action: Mapped[str] = mapped_column(String(100), nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -47,8 +55,9 @@ class ExecutionLog(Base):
     action_duration_ms: Mapped[float | None] = mapped_column(Numeric(12, 3), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
-        default=datetime.now(timezone.utc)
+        default=lambda: datetime.now(timezone.utc),
     )
     attempts: Mapped[int] = mapped_column(
         Integer,
@@ -63,3 +72,5 @@ class ExecutionLog(Base):
         server_default=expression.false(),
     )
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    lease_owner: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
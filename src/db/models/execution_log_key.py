@@ -0,0 +1,39 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+
+class ExecutionLogKey(Base):
+    """Idempotency key of an ``execution_logs`` row, unique where the partitioned table cannot be."""
+    __tablename__ = "execution_log_keys"
+    __table_args__ = (
+        # One event-level row per (event, workflow) plus one row per DAG step.
+        Index(
+            "uq_execution_log_keys_event_workflow",
+            "event_id",
+            "workflow_id",
+            unique=True,
+            postgresql_where=text("task_id IS NULL"),
+        ),
+        Index(
+            "uq_execution_log_keys_event_workflow_task",
+            "event_id",
+            "workflow_id",
+            "task_id",
+            unique=True,
+            postgresql_where=text("task_id IS NOT NULL"),
+        ),
+        Index("ix_execution_log_keys_created", "created_at"),
+    )
+
+    log_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    event_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    workflow_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    task_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # The row's, so lookups through the key hit a single partition.
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
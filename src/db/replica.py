@@ -0,0 +1,62 @@
+import logging
+import math
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction; 0 while the replica has replayed
+# everything it received (an idle primary would otherwise look like lag) and
+# when run on a primary. NULL (stale) when no WAL receiver is running, since a
+# disconnected replica has also replayed everything it received. Only the
+# receiver's pid is visible without pg_read_all_stats, so its row is checked.
+LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE pid IS NOT NULL) THEN NULL "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class ReplicaLagMonitor:
+    """Decides, at most every ``check_interval`` seconds, whether the read replica is fresh enough."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+        clock=time.monotonic,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_lag = max_lag
+        self._check_interval = check_interval
+        self._clock = clock
+        self._checked_at: float | None = None
+        self._lag = math.inf
+
+    @property
+    def lag(self) -> float:
+        return self._lag
+
+    async def _measure(self) -> float:
+        try:
+            async with self._session_factory() as session:
+                lag = (await session.execute(LAG_QUERY)).scalar()
+        except Exception:
+            logger.warning("Replica lag check failed", exc_info=True)
+            return math.inf
+        return math.inf if lag is None else float(lag)
+
+    async def is_fresh(self) -> bool:
+        now = self._clock()
+        if self._checked_at is None or now - self._checked_at >= self._check_interval:
+            # Claimed before the query so concurrent requests do not all re-check.
+            self._checked_at = now
+            self._lag = await self._measure()
+            metrics.record_replica_lag(self._lag)
+        return self._lag <= self._max_lag
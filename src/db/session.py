@@ -1,22 +1,82 @@
+import time
 from typing import AsyncGenerator
+from uuid import uuid4
 
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
-    AsyncSession, async_sessionmaker, create_async_engine,
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from src.core import metrics
 from src.core.config import settings
+from src.db.replica import ReplicaLagMonitor
 
 
-DATABASE_URL = (
-    "postgresql+asyncpg://"
-    f"{settings.DB_USER}:{settings.DB_PASSWORD}@"
-    f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
-)
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports checkouts, overflow and checkout wait time."""
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-)
+    engine_name = "primary"  # the ``engine`` metric label
+
+    def _report(self) -> None:
+        metrics.record_db_pool_state(
+            self.engine_name,
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+            size=self.size(),
+        )
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            metrics.record_db_pool_timeout(self.engine_name)
+            raise
+        finally:
+            metrics.record_db_pool_wait(self.engine_name, time.perf_counter() - started)
+        self._report()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._report()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.engine_name = self.engine_name
+        return pool
+
+
+def _pgbouncer_connect_args() -> dict:
+    # PgBouncer in transaction mode hands each transaction a different server
+    # connection, where statements prepared on another one do not exist.
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
+def build_engine(url: str, name: str = "primary") -> AsyncEngine:
+    """Create an engine with the pool settings from ``Settings``."""
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_use_lifo=True,
+        connect_args=_pgbouncer_connect_args() if settings.DB_PGBOUNCER_MODE else {},
+    )
+    engine.pool.engine_name = name
+    return engine
+
+
+engine = build_engine(settings.DATABASE_URL)
 
 async_session_factory = async_sessionmaker(
     engine,
@@ -24,6 +84,34 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+read_engine = build_engine(settings.DB_REPLICA_URL, name="replica") if settings.DB_REPLICA_URL else None
+
+read_session_factory = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
+replica_monitor = (
+    ReplicaLagMonitor(
+        read_session_factory,
+        max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+        check_interval=settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    )
+    if read_session_factory is not None
+    else None
+)
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints: the replica unless it is missing, unreachable or lagging."""
+    factory, name = async_session_factory, "primary"
+    if replica_monitor is not None and await replica_monitor.is_fresh():
+        factory, name = read_session_factory, "replica"
+    metrics.record_read_session(name)
+    async with factory() as session:
+        yield session
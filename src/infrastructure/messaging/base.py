@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from src.events.schema import EventEnvelope
+
+
+class EventProducer(ABC):
+    """Publishing side of a workflow event transport."""
+
+    @abstractmethod
+    async def publish_async(self, event: EventEnvelope) -> str:
+        """Publish one event and return its transport message id."""
+
+    @abstractmethod
+    async def publish_batch_async(
+        self, events: Sequence[EventEnvelope]
+    ) -> list[str | BaseException]:
+        """Publish many events; each item is a message id or the error that failed it."""
+
+    def close(self) -> None:
+        pass
+
+
+class EventConsumer(ABC):
+    """Pull-based consuming side of a workflow event transport; push transports use an HTTP route instead."""
+
+    @abstractmethod
+    def start(self) -> None:...
+
+    @abstractmethod
+    async def stop(self) -> None:...
@@ -0,0 +1,29 @@
+from src.core.config import settings
+from src.infrastructure.messaging.base import EventProducer
+
+
+def build_event_producer() -> EventProducer:
+    """Create the producer for the configured ``EVENT_TRANSPORT``."""
+    if settings.EVENT_TRANSPORT == "pubsub":
+        from src.infrastructure.messaging.producer import PubSubProducer
+
+        return PubSubProducer(
+            project_id=settings.GCP_PROJECT_ID,
+            topic_name=settings.PUBSUB_TOPIC_WORKFLOW_EVENTS,
+        )
+
+    if settings.EVENT_TRANSPORT == "postgres":
+        from src.db.session import async_session_factory
+        from src.infrastructure.messaging.pg_queue import PostgresQueueProducer
+
+        return PostgresQueueProducer(async_session_factory)
+
+    if settings.EVENT_TRANSPORT == "inprocess":
+        from src.infrastructure.messaging.in_process import InProcessProducer
+
+        return InProcessProducer(
+            max_size=settings.INPROCESS_QUEUE_SIZE,
+            enqueue_timeout=settings.INPROCESS_ENQUEUE_TIMEOUT_SECONDS,
+        )
+
+    raise ValueError(f"Unknown EVENT_TRANSPORT: {settings.EVENT_TRANSPORT}")
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Sequence
+
+from src.core import metrics
+from src.events.schema import EventEnvelope
+from src.infrastructure.messaging.base import EventProducer
+
+logger = logging.getLogger(__name__)
+
+
+class EventQueueFull(Exception):
+    """The in-process queue stayed full for the whole enqueue timeout."""
+
+
+@dataclass
+class QueuedEvent:
+    event: EventEnvelope
+    deliveries: int = 0
+
+
+class InProcessProducer(EventProducer):
+    """Publishes into a bounded in-memory queue; a full queue fails publishers, surfaced as 503."""
+
+    def __init__(self, max_size: int = 1000, enqueue_timeout: float = 0.1) -> None:
+        # Queued events live in memory only and are lost if the process dies.
+        self.queue: asyncio.Queue[QueuedEvent] = asyncio.Queue(maxsize=max_size)
+        self._enqueue_timeout = enqueue_timeout
+
+    async def _put(self, event: EventEnvelope) -> str:
+        item = QueuedEvent(event)
+        try:
+            if self._enqueue_timeout <= 0:
+                self.queue.put_nowait(item)
+            else:
+                await asyncio.wait_for(self.queue.put(item), timeout=self._enqueue_timeout)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            logger.warning(
+                "In-process event queue is full",
+                extra={"event_id": str(event.event_id), "queue_size": self.queue.qsize()},
+            )
+            raise EventQueueFull("In-process event queue is full")
+        metrics.record_inprocess_queue_depth(self.queue.qsize())
+        return str(event.event_id)
+
+    async def publish_async(self, event: EventEnvelope) -> str:
+        return await self._put(event)
+
+    async def publish_batch_async(
+        self, events: Sequence[EventEnvelope]
+    ) -> list[str | BaseException]:
+        results: list[str | BaseException] = []
+        for event in events:
+            try:
+                results.append(await self._put(event))
+            except EventQueueFull as e:
+                results.append(e)
+        return results
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.events.schema import EventEnvelope
+from src.infrastructure.messaging.base import EventProducer
+from src.repositories.event_outbox import EventOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Drains ``event_outbox`` into the event transport, retrying failed rows with backoff."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        producer: EventProducer,
+        batch_size: int = 100,
+        poll_interval: float = 0.5,
+        stats_interval: float = 5.0,
+        lease_seconds: float = 30.0,
+        max_attempts: int = 10,
+        backoff: float = 1.0,
+        max_backoff: float = 300.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._producer = producer
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._stats_interval = stats_interval
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def _failure(self, row, error: str) -> dict:
+        attempts = row.attempts + 1
+        delay = min(self._backoff * 2 ** (attempts - 1), self._max_backoff)
+        return {
+            "id": row.id,
+            "error": error,
+            "delay": timedelta(seconds=delay),
+            "dead": attempts >= self._max_attempts,
+        }
+
+    async def drain_once(self) -> int:
+        # Rows are leased in a short transaction, so no lock is held while
+        # publishing and a crashed relay's rows come back after the lease.
+        async with self._session_factory() as session:
+            async with session.begin():
+                rows = await EventOutboxRepository(session).claim_batch(
+                    self._batch_size, self._lease_seconds
+                )
+        if not rows:
+            return 0
+
+        events = [EventEnvelope.model_validate(row.envelope) for row in rows]
+        results = await self._producer.publish_batch_async(events)
+
+        published = []
+        failures = []
+        for row, result in zip(rows, results):
+            if isinstance(result, BaseException):
+                failures.append(self._failure(row, str(result) or result.__class__.__name__))
+            else:
+                published.append(row.id)
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                repo = EventOutboxRepository(session)
+                await repo.delete(published)
+                await repo.record_failures(failures)
+
+        dead = [failure["id"] for failure in failures if failure["dead"]]
+        metrics.record_outbox_relayed(len(published), len(failures), len(dead))
+        if failures:
+            logger.warning(
+                "Outbox relay failed to publish events",
+                extra={"published": len(published), "failed": len(failures), "dead_lettered": len(dead)},
+            )
+        if dead:
+            logger.error(
+                "Outbox events dead-lettered",
+                extra={"outbox_ids": [str(row_id) for row_id in dead]},
+            )
+        return len(rows)
+
+    async def report_backlog(self) -> None:
+        async with self._session_factory() as session:
+            size, oldest = await EventOutboxRepository(session).stats()
+
+        lag = 0.0
+        if oldest is not None:
+            lag = max((datetime.now(timezone.utc) - oldest).total_seconds(), 0.0)
+        metrics.record_outbox_backlog(size, lag)
+
+    async def run(self) -> None:
+        last_stats = 0.0
+        while not self._stopping.is_set():
+            claimed = 0
+            try:
+                claimed = await self.drain_once()
+            except Exception:
+                logger.exception("Outbox relay iteration failed")
+            finally:
+                if time.monotonic() - last_stats >= self._stats_interval:
+                    try:
+                        await self.report_backlog()
+                    except Exception:
+                        logger.exception("Outbox backlog report failed")
+                    last_stats = time.monotonic()
+
+            if claimed < self._batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
@@ -0,0 +1,45 @@
+import logging
+from typing import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.events.schema import EventEnvelope
+from src.infrastructure.messaging.base import EventProducer
+from src.repositories.workflow_event import WorkflowEventRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresQueueProducer(EventProducer):
+    """Publishes workflow events into the ``workflow_events`` table."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def publish_async(self, event: EventEnvelope) -> str:
+        result = (await self.publish_batch_async([event]))[0]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    async def publish_batch_async(
+        self, events: Sequence[EventEnvelope]
+    ) -> list[str | BaseException]:
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    inserted = await WorkflowEventRepository(session).enqueue(events)
+        except Exception as e:
+            logger.exception(
+                "Failed to enqueue events",
+                extra={"count": len(events)},
+            )
+            return [e] * len(events)
+
+        logger.info(
+            "Events enqueued",
+            extra={"count": len(inserted), "already_queued": len(events) - len(inserted)},
+        )
+        # An event_id that is already queued is not inserted again; its
+        # existing row is identified by the event_id itself.
+        return [str(inserted.get(event.event_id, event.event_id)) for event in events]
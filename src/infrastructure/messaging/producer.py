@@ -1,16 +1,24 @@
+import asyncio
 import json
 import logging
-from typing import Optional
+from typing import Optional, Sequence
 
 from google.cloud import pubsub_v1
 from google.api_core.exceptions import GoogleAPIError
 
 from src.events.schema import EventEnvelope
+from src.infrastructure.messaging.base import EventProducer
 
 logger = logging.getLogger(__name__)
 
+PUBLISH_TIMEOUT_SECONDS = 5
 
-class PubSubProducer:
+
+async def _failed(error: BaseException) -> str:
+    raise error
+
+
+class PubSubProducer(EventProducer):
     def __init__(self, project_id: str, topic_name: str) -> None:
         self._topic_path = f"projects/{project_id}/topics/{topic_name}"
 
@@ -22,8 +30,12 @@ class PubSubProducer:
             )
         )
 
+    @staticmethod
+    def _encode(event: EventEnvelope) -> bytes:
+        return json.dumps(event.model_dump(mode="json")).encode("utf-8")
+
     def publish(self, event: EventEnvelope) -> str:
-        data = json.dumps(event.model_dump(mode="json")).encode("utf-8")
+        data = self._encode(event)
 
         logging_payload = {
             "event_id": event.event_id,
@@ -32,7 +44,7 @@ class PubSubProducer:
 
         try:
             future = self._publisher.publish(self._topic_path, data=data)
-            message_id = future.result(timeout=5)
+            message_id = future.result(timeout=PUBLISH_TIMEOUT_SECONDS)
 
             logger.info(
                 "Event published",
@@ -47,5 +59,75 @@ class PubSubProducer:
             )
             raise
 
+    async def publish_async(
+        self,
+        event: EventEnvelope,
+        timeout: float = PUBLISH_TIMEOUT_SECONDS,
+    ) -> str:
+        """Publish and await the ack without blocking the event loop."""
+        data = self._encode(event)
+
+        logging_payload = {
+            "event_id": event.event_id,
+            "event_type": event.event_type,
+        }
+
+        try:
+            future = self._publisher.publish(self._topic_path, data=data)
+            message_id = await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=timeout,
+            )
+
+            logger.info(
+                "Event published",
+                extra=logging_payload
+            )
+
+            return message_id
+        except (GoogleAPIError, asyncio.TimeoutError):
+            logger.exception(
+                "Failed to publish event",
+                extra=logging_payload
+            )
+            raise
+
+    async def publish_batch_async(
+        self,
+        events: Sequence[EventEnvelope],
+        timeout: float = PUBLISH_TIMEOUT_SECONDS,
+    ) -> list[str | BaseException]:
+        """Publish many events at once; each result is a message id or the exception that failed it."""
+        # Every message reaches the batcher before any ack is awaited, so they
+        # share as few publish RPCs as the batch settings allow.
+        futures = []
+        for event in events:
+            try:
+                future = self._publisher.publish(self._topic_path, data=self._encode(event))
+                futures.append(
+                    asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+                )
+            except GoogleAPIError as e:
+                futures.append(_failed(e))
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        failed = sum(isinstance(result, BaseException) for result in results)
+        logging_payload = {
+            "published": len(results) - failed,
+            "failed": failed,
+        }
+        if failed:
+            logger.error(
+                "Failed to publish some events in batch",
+                extra=logging_payload
+            )
+        else:
+            logger.info(
+                "Event batch published",
+                extra=logging_payload
+            )
+        return results
+
     def close(self) -> None:
-        self._publisher.transport.close()
\ No newline at end of file
+        self._publisher.transport.close()
@@ -1,11 +1,14 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from prometheus_client import make_asgi_app
 
 from src.api.routers.workflows import router as workflows_router
 from src.api.routers.triggers import router as trigger_router
+from src.api.routers.execution_logs import router as execution_logs_router
 from src.core.logger import get_logger
 from src.core.exceptions import WorkflowResolutionError, app_exception_handler
 from src.core.middleware import (
@@ -16,24 +19,65 @@ from src.core.middleware import (
 )
 from src.core.request_context import get_request_id
 from src.core.config import settings
-from src.infrastructure.messaging.producer import PubSubProducer
+from src.core.http_client import close_http_client
+from src.db.session import async_session_factory
+from src.infrastructure.messaging.factory import build_event_producer
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from src.services.dlq_redrive import redrive_jobs
+from src.worker.consumers.in_process import InProcessConsumer
+from src.worker.services.action_pools import action_pools
+from src.worker.services.background import WorkerBackgroundServices
 
 logger = get_logger()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    producer = PubSubProducer(
-        project_id=settings.GCP_PROJECT_ID,
-        topic_name=settings.PUBSUB_TOPIC_WORKFLOW_EVENTS,
-    )
+    producer = build_event_producer()
 
     app.state.event_producer = producer
 
+    consumer = None
+    background = None
+    if settings.EVENT_TRANSPORT == "inprocess":
+        background = WorkerBackgroundServices(async_session_factory, producer)
+        background.start()
+        consumer = InProcessConsumer(
+            producer.queue,
+            async_session_factory,
+            concurrency=settings.INPROCESS_CONSUMERS,
+            redelivery_delay=settings.INPROCESS_REDELIVERY_DELAY_SECONDS,
+            max_deliveries=settings.INPROCESS_MAX_DELIVERIES,
+        )
+        consumer.start()
+
+    relay = None
+    if settings.EVENT_OUTBOX_ENABLED:
+        relay = OutboxRelay(
+            async_session_factory,
+            producer,
+            batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+            poll_interval=settings.OUTBOX_RELAY_POLL_INTERVAL_SECONDS,
+            lease_seconds=settings.OUTBOX_RELAY_LEASE_SECONDS,
+            max_attempts=settings.OUTBOX_RELAY_MAX_ATTEMPTS,
+            backoff=settings.OUTBOX_RELAY_BACKOFF_SECONDS,
+            max_backoff=settings.OUTBOX_RELAY_MAX_BACKOFF_SECONDS,
+        )
+        relay.start()
+
     try:
         yield
     finally:
+        await redrive_jobs.cancel_all()
+        if relay is not None:
+            await relay.stop()
+        if consumer is not None:
+            await consumer.stop()
+        if background is not None:
+            await background.stop()
         producer.close()
+        await close_http_client()
+        await asyncio.to_thread(action_pools.shutdown)
 
 
 def create_app() -> FastAPI:
@@ -50,6 +94,10 @@ def create_app() -> FastAPI:
             "name": "triggers",
             "description": "Managing triggers that start a workflow.",
         },
+        {
+            "name": "execution-logs",
+            "description": "Execution history, DLQ inspection and re-drive.",
+        },
         {
             "name": "auth",
             "description": "API Key authentication",
@@ -86,6 +134,8 @@ def create_app() -> FastAPI:
 
     app.include_router(workflows_router)
     app.include_router(trigger_router)
+    app.include_router(execution_logs_router)
+    app.mount("/metrics", make_asgi_app())
     app.add_exception_handler(WorkflowResolutionError, app_exception_handler)
 
     return app
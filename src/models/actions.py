@@ -1,4 +1,5 @@
 from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -13,6 +14,8 @@ class ActionResult(BaseModel):
     retryable: bool = False
     duration: float | None = None
     queued_to_dlq: bool = False
+    retry_after: float | None = None
+    attempts: int | None = None
 
 
 class ExecutionContext(BaseModel):
@@ -20,4 +23,23 @@ class ExecutionContext(BaseModel):
 
     event: EventEnvelope
     workflow: Workflow
-    trace_id: str
\ No newline at end of file
+    trace_id: str
+    config: dict[str, Any] = {}
+
+    def portable(self) -> "PortableContext":
+        return PortableContext(
+            event=self.event,
+            workflow_id=self.workflow.id,
+            workflow_name=self.workflow.name,
+            trace_id=self.trace_id,
+            config=self.config,
+        )
+
+
+class PortableContext(BaseModel):
+    """Picklable subset of ``ExecutionContext``, free of ORM objects, handed to thread/process actions."""
+    event: EventEnvelope
+    workflow_id: UUID
+    workflow_name: str
+    trace_id: str
+    config: dict[str, Any] = {}
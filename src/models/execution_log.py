@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExecutionLogItem(BaseModel):
@@ -28,4 +28,26 @@ class ExecutionLogItem(BaseModel):
 
 class ExecutionLogListResponse(BaseModel):
     items: list[ExecutionLogItem]
-    count: int
+    count: int = Field(description="Number of items on this page")
+    next_cursor: str | None = Field(None, description="Cursor of the next page; null on the last page")
+
+
+class DlqRedriveRequest(BaseModel):
+    workflow_id: UUID | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    error: str | None = None
+    dry_run: bool = False
+
+
+class DlqRedriveStatus(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID | None = None
+    total: int
+    published: int = 0
+    failed: int = 0
+    done: bool = False
+    error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
@@ -6,6 +6,7 @@ class BaseTask(BaseModel):
     name: str = Field(..., description="Name of the task")
     type: str = Field(..., description="Type of the task (http_call, email, delay)")
     config: dict = Field(default_factory=dict, description="Task configuration")
+    depends_on: list[str] = Field(default_factory=list, description="Names of tasks that must succeed first")
 
 
 class TaskCreate(BaseTask):
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import Boolean, Interval, select, delete, update, func, bindparam, case
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import EventOutbox
+from src.events.schema import EventEnvelope
+
+
+class EventOutboxRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _row(event: EventEnvelope) -> dict:
+        return {
+            "event_id": event.event_id,
+            "event_type": event.event_type,
+            "envelope": event.model_dump(mode="json"),
+        }
+
+    async def add(self, event: EventEnvelope) -> None:
+        await self.add_many([event])
+
+    async def add_many(self, events: Sequence[EventEnvelope]) -> None:
+        stmt = (
+            insert(EventOutbox)
+            .values([self._row(event) for event in events])
+            .on_conflict_do_nothing(index_elements=["event_id"])
+        )
+        await self.session.execute(stmt)
+
+    async def claim_batch(self, limit: int, lease_seconds: float) -> list[EventOutbox]:
+        """Take the rows that are due and hide them from other relays for ``lease_seconds``."""
+        due = (
+            select(EventOutbox.id)
+            .where(
+                EventOutbox.dead_lettered_at.is_(None),
+                EventOutbox.next_attempt_at <= func.now(),
+            )
+            .order_by(EventOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EventOutbox)
+            .where(EventOutbox.id.in_(due.scalar_subquery()))
+            .values(next_attempt_at=func.now() + timedelta(seconds=lease_seconds))
+            .returning(EventOutbox)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete(self, ids: Sequence[UUID]) -> None:
+        if not ids:
+            return
+        await self.session.execute(
+            delete(EventOutbox).where(EventOutbox.id.in_(ids))
+        )
+
+    async def record_failures(self, failures: Sequence[dict]) -> None:
+        """Each failure is ``{"id", "error", "delay", "dead"}``; ``delay`` is a timedelta."""
+        if not failures:
+            return
+        table = EventOutbox.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                attempts=table.c.attempts + 1,
+                last_error=bindparam("b_error"),
+                next_attempt_at=func.now() + bindparam("b_delay", type_=Interval()),
+                dead_lettered_at=case((bindparam("b_dead", type_=Boolean()), func.now()), else_=None),
+            )
+        )
+        await self.session.execute(
+            stmt,
+            [
+                {
+                    "b_id": failure["id"],
+                    "b_error": failure["error"],
+                    "b_delay": failure["delay"],
+                    "b_dead": failure["dead"],
+                }
+                for failure in failures
+            ],
+        )
+
+    async def stats(self) -> tuple[int, datetime | None]:
+        """Return the backlog size and the creation time of its oldest row."""
+        result = await self.session.execute(
+            select(func.count(), func.min(EventOutbox.created_at)).where(
+                EventOutbox.dead_lettered_at.is_(None)
+            )
+        )
+        count, oldest = result.one()
+        return count, oldest
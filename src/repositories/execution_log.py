@@ -1,29 +1,143 @@
-from sqlalchemy import select
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Protocol, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import bindparam, case, delete, exists, select, update, func, literal, literal_column, or_, tuple_
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ClauseElement
+
+from src.db.models import ExecutionLog, ExecutionLogKey
+
+# Statuses that may be re-attempted on redelivery once no live lease is held.
+# A "pending" row without a live lease belongs to a worker that died
+# mid-action; "success"/"skipped" are terminal.
+RECLAIMABLE_STATUSES = ("failed", "pending")
+
+
+def encode_cursor(created_at: datetime, log_id: UUID) -> str:
+    """Opaque page token for the ``(created_at, id)`` position of a row."""
+    raw = json.dumps([created_at.isoformat(), str(log_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, log_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), UUID(log_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+@dataclass(frozen=True)
+class ExecutionClaim:
+    """Result of ``ExecutionLogRepository.claim``; ``claimed`` is False when the delivery must be skipped."""
+    id: UUID | None
+    attempts: int
+    status: str | None  # before this claim
+    queued_to_dlq: bool
+    claimed: bool
+    is_new: bool = False
+    lease_owner: str | None = None
+    lease_expires_at: datetime | None = None
+    created_at: datetime | None = None
+    # The event's key exists without a row to claim; retry the delivery.
+    conflict: bool = False
+
+    @property
+    def reclaimed(self) -> bool:
+        """A pending row taken over after its previous lease expired."""
+        return self.claimed and not self.is_new and self.status == "pending"
 
-from src.db.models import ExecutionLog
+
+class FinishBuffer(Protocol):
+    def add(
+        self,
+        log_id: UUID,
+        lease_owner: str,
+        values: dict,
+        created_at: datetime | None = None,
+    ) -> None: ...
+
+
+def _with_identity(payload: dict) -> dict:
+    return {"id": uuid4(), "created_at": datetime.now(timezone.utc), **payload}
+
+
+def _key_of(values: dict) -> dict:
+    return {
+        "log_id": values["id"],
+        "event_id": values["event_id"],
+        "workflow_id": values["workflow_id"],
+        "task_id": values.get("task_id"),
+        "created_at": values["created_at"],
+    }
 
 
 class ExecutionLogRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, write_behind: FinishBuffer | None = None):
         self.session = session
+        self.write_behind = write_behind
 
     async def create(self, payload: dict) -> ExecutionLog:
-        log = ExecutionLog(**payload)
-        self.session.add(log)
+        values = _with_identity(payload)
+        log = ExecutionLog(**values)
+        self.session.add_all([ExecutionLogKey(**_key_of(values)), log])
         await self.session.flush()
         return log
 
-    async def create_pending(self, payload: dict) -> tuple[ExecutionLog, bool]:
-        stmt = (
-            insert(ExecutionLog)
-            .values(**payload)
+    @staticmethod
+    def _insert_if_new_key(values: dict):
+        """INSERT of an event-level row that only happens if its key is new."""
+        # A data-modifying CTE: a conflicting delivery waits for the first
+        # one's transaction and then inserts nothing, as a unique index would.
+        key = (
+            insert(ExecutionLogKey)
+            .values(**_key_of(values))
             .on_conflict_do_nothing(
-                index_elements=["event_id", "workflow_id"]
+                index_elements=["event_id", "workflow_id"],
+                index_where=ExecutionLogKey.task_id.is_(None),
             )
-            .returning(ExecutionLog)
+            .returning(ExecutionLogKey.log_id)
+            .cte("new_key")
         )
+        columns = ExecutionLog.__table__.c
+        values = {
+            **{
+                column.name: column.default.arg
+                for column in columns
+                if column.default is not None and column.default.is_scalar
+            },
+            **values,
+        }
+        row = select(
+            *(
+                value if isinstance(value, ClauseElement) else literal(value, columns[name].type)
+                for name, value in values.items()
+            )
+        ).select_from(key)
+        return (
+            insert(ExecutionLog)
+            .from_select(list(values), row, include_defaults=False)
+            .add_cte(key)
+        )
+
+    def _by_key(self, event_id, workflow_id) -> list:
+        """Join conditions from ``execution_logs`` to its event-level key."""
+        return [
+            ExecutionLog.id == ExecutionLogKey.log_id,
+            ExecutionLog.created_at == ExecutionLogKey.created_at,
+            ExecutionLogKey.event_id == event_id,
+            ExecutionLogKey.workflow_id == workflow_id,
+            ExecutionLogKey.task_id.is_(None),
+        ]
+
+    async def create_pending(self, payload: dict) -> tuple[ExecutionLog, bool]:
+        stmt = self._insert_if_new_key(_with_identity(payload)).returning(ExecutionLog)
         result = await self.session.execute(stmt)
         log = result.scalar_one_or_none()
         if log:
@@ -32,6 +146,303 @@ class ExecutionLogRepository:
         existing = await self.get_by_event(payload["event_id"], payload["workflow_id"])
         return existing, False
 
+    async def _delete_orphaned_key(self, event_id, workflow_id) -> bool:
+        stmt = delete(ExecutionLogKey).where(
+            ExecutionLogKey.event_id == event_id,
+            ExecutionLogKey.workflow_id == workflow_id,
+            ExecutionLogKey.task_id.is_(None),
+            ~exists().where(
+                ExecutionLog.id == ExecutionLogKey.log_id,
+                ExecutionLog.created_at == ExecutionLogKey.created_at,
+            ),
+        )
+        return (await self.session.execute(stmt)).rowcount > 0
+
+    async def claim(
+        self,
+        payload: dict,
+        lease_owner: str,
+        lease_seconds: float,
+        _retry: bool = True,
+    ) -> ExecutionClaim:
+        """Insert the log row, or take over a failed or lease-expired one, under a fresh lease."""
+        lease_expires_at = func.now() + timedelta(seconds=lease_seconds)
+        returned = (
+            ExecutionLog.id,
+            ExecutionLog.attempts,
+            ExecutionLog.status,
+            ExecutionLog.lease_expires_at,
+            ExecutionLog.created_at,
+        )
+        values = {
+            **_with_identity(payload),
+            "attempts": 1,
+            "lease_owner": lease_owner,
+            "lease_expires_at": lease_expires_at,
+        }
+        row = (
+            await self.session.execute(self._insert_if_new_key(values).returning(*returned))
+        ).one_or_none()
+        is_new = row is not None
+
+        if row is None:
+            stmt = (
+                update(ExecutionLog)
+                .where(
+                    *self._by_key(payload["event_id"], payload["workflow_id"]),
+                    ExecutionLog.status.in_(RECLAIMABLE_STATUSES),
+                    ExecutionLog.queued_to_dlq.is_(False),
+                    or_(
+                        ExecutionLog.lease_expires_at.is_(None),
+                        ExecutionLog.lease_expires_at <= func.now(),
+                    ),
+                )
+                .values(
+                    attempts=ExecutionLog.attempts + 1,
+                    lease_owner=lease_owner,
+                    lease_expires_at=lease_expires_at,
+                )
+                .returning(*returned)
+                .execution_options(synchronize_session=False)
+            )
+            row = (await self.session.execute(stmt)).one_or_none()
+
+        if row is not None:
+            return ExecutionClaim(
+                id=row.id,
+                attempts=row.attempts,
+                status=row.status,
+                queued_to_dlq=False,
+                claimed=True,
+                is_new=is_new,
+                lease_owner=lease_owner,
+                lease_expires_at=row.lease_expires_at,
+                created_at=row.created_at,
+            )
+
+        # Finished, DLQ-flagged or leased: read the row only to report why.
+        existing = await self.get_by_event(payload["event_id"], payload["workflow_id"])
+        if existing is None:
+            # The key outlived its row (archived, or a dropped partition whose
+            # keys were not cleaned up yet): remove it and insert afresh once.
+            if _retry and await self._delete_orphaned_key(payload["event_id"], payload["workflow_id"]):
+                return await self.claim(payload, lease_owner, lease_seconds, _retry=False)
+            return ExecutionClaim(
+                id=None, attempts=0, status=None, queued_to_dlq=False, claimed=False, conflict=True
+            )
+        return ExecutionClaim(
+            id=existing.id,
+            attempts=existing.attempts,
+            status=existing.status,
+            queued_to_dlq=existing.queued_to_dlq,
+            claimed=False,
+            lease_owner=existing.lease_owner,
+            lease_expires_at=existing.lease_expires_at,
+            created_at=existing.created_at,
+        )
+
+    async def finish(
+        self,
+        log_id: UUID,
+        values: dict,
+        lease_owner: str | None = None,
+        created_at: datetime | None = None,
+    ) -> None:
+        """Write the final state of a claimed row and release its lease, or hand it to ``write_behind``."""
+        if self.write_behind is not None and lease_owner is not None:
+            self.write_behind.add(log_id, lease_owner, values, created_at)
+            return
+        stmt = (
+            update(ExecutionLog)
+            .where(ExecutionLog.id == log_id)
+            .values(**values, lease_owner=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        if created_at is not None:
+            stmt = stmt.where(ExecutionLog.created_at == created_at)
+        await self.session.execute(stmt)
+
+    async def finish_many(self, rows: Sequence[dict]) -> None:
+        """Apply buffered ``finish`` writes (``{"id", "lease_owner", "values"[, "created_at"]}``) in bulk."""
+        table = ExecutionLog.__table__
+        groups: dict[tuple[bool, tuple[str, ...]], list[dict]] = {}
+        for row in rows:
+            values = row["values"]
+            created_at = row.get("created_at")
+            groups.setdefault((created_at is not None, tuple(sorted(values))), []).append(
+                {
+                    "b_id": row["id"],
+                    "b_lease_owner": row["lease_owner"],
+                    "b_created_at": created_at,
+                    **{f"b_{column}": value for column, value in values.items()},
+                }
+            )
+
+        for (by_created_at, columns), params in groups.items():
+            # Replaying a row already written (lease released) or since
+            # reclaimed by another worker matches nothing.
+            conditions = [
+                table.c.id == bindparam("b_id"),
+                table.c.lease_owner == bindparam("b_lease_owner"),
+            ]
+            if by_created_at:
+                conditions.append(table.c.created_at == bindparam("b_created_at"))
+            stmt = (
+                update(table)
+                .where(*conditions)
+                .values(
+                    **{column: bindparam(f"b_{column}") for column in columns},
+                    lease_owner=None,
+                    lease_expires_at=None,
+                )
+            )
+            await self.session.execute(stmt, params)
+
+    async def record_steps(self, rows: Sequence[dict]) -> None:
+        """Upsert the per-task rows of a DAG run; a re-run step is overwritten and its ``attempts`` bumped."""
+        if not rows:
+            return
+        keys = insert(ExecutionLogKey).values(
+            [_key_of(_with_identity(row)) for row in rows]
+        )
+        keys = keys.on_conflict_do_update(
+            index_elements=["event_id", "workflow_id", "task_id"],
+            index_where=ExecutionLogKey.task_id.isnot(None),
+            set_={"task_id": keys.excluded.task_id},
+        ).returning(
+            ExecutionLogKey.task_id,
+            ExecutionLogKey.log_id,
+            ExecutionLogKey.created_at,
+            literal_column("(xmax = 0)").label("inserted"),
+        )
+        by_task = {key.task_id: key for key in (await self.session.execute(keys)).all()}
+
+        overwritten = ("status", "result", "error", "retryable", "duration", "action_duration_ms", "last_error")
+        new, rerun = [], []
+        for row in rows:
+            key = by_task[row["task_id"]]
+            if key.inserted:
+                new.append({**row, "id": key.log_id, "created_at": key.created_at, "attempts": 1})
+            else:
+                rerun.append(
+                    {
+                        "b_id": key.log_id,
+                        "b_created_at": key.created_at,
+                        **{f"b_{column}": row.get(column) for column in overwritten},
+                    }
+                )
+        if new:
+            await self.session.execute(insert(ExecutionLog).values(new))
+        if rerun:
+            table = ExecutionLog.__table__
+            stmt = (
+                update(table)
+                .where(
+                    table.c.id == bindparam("b_id"),
+                    table.c.created_at == bindparam("b_created_at"),
+                )
+                .values(
+                    **{column: bindparam(f"b_{column}") for column in overwritten},
+                    attempts=table.c.attempts + 1,
+                )
+            )
+            await self.session.execute(stmt, rerun)
+
+    async def expired_leases(self) -> tuple[int, datetime | None]:
+        """Count pending rows whose lease has run out, and the oldest expiry."""
+        stmt = select(func.count(), func.min(ExecutionLog.lease_expires_at)).where(
+            ExecutionLog.status == "pending",
+            ExecutionLog.lease_expires_at <= func.now(),
+        )
+        count, oldest = (await self.session.execute(stmt)).one()
+        return count, oldest
+
+    @staticmethod
+    def _dlq_filters(
+        workflow_id: UUID | None,
+        since: datetime | None,
+        until: datetime | None,
+        error: str | None,
+    ) -> list:
+        filters = [
+            ExecutionLog.queued_to_dlq.is_(True),
+            ExecutionLog.task_id.is_(None),
+            ExecutionLog.payload_snapshot.isnot(None),
+        ]
+        if workflow_id is not None:
+            filters.append(ExecutionLog.workflow_id == workflow_id)
+        if since is not None:
+            filters.append(ExecutionLog.created_at >= since)
+        if until is not None:
+            filters.append(ExecutionLog.created_at < until)
+        if error:
+            filters.append(ExecutionLog.last_error.ilike(f"%{error}%"))
+        return filters
+
+    async def count_dlq(
+        self,
+        workflow_id: UUID | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        error: str | None = None,
+    ) -> int:
+        stmt = select(func.count()).where(*self._dlq_filters(workflow_id, since, until, error))
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def claim_dlq_batch(
+        self,
+        limit: int,
+        after_id: UUID | None = None,
+        workflow_id: UUID | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        error: str | None = None,
+    ) -> Sequence:
+        """Lock the next DLQ rows with a re-drivable envelope, in ``id`` order after ``after_id``."""
+        stmt = (
+            select(ExecutionLog.id, ExecutionLog.payload_snapshot)
+            .where(*self._dlq_filters(workflow_id, since, until, error))
+            .order_by(ExecutionLog.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if after_id is not None:
+            stmt = stmt.where(ExecutionLog.id > after_id)
+        return (await self.session.execute(stmt)).all()
+
+    async def reset_for_redrive(self, ids: Sequence[UUID]) -> None:
+        """Make DLQ rows claimable again with a fresh attempt budget."""
+        if not ids:
+            return
+        await self.session.execute(
+            update(ExecutionLog)
+            .where(ExecutionLog.id.in_(ids))
+            .values(
+                queued_to_dlq=False,
+                status="failed",
+                retryable=True,
+                attempts=0,
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def return_to_dlq(self, errors: dict[UUID, str]) -> None:
+        """Flag rows whose re-drive could not be published as DLQ again, recording why in ``last_error``."""
+        if not errors:
+            return
+        await self.session.execute(
+            update(ExecutionLog)
+            .where(ExecutionLog.id.in_(list(errors)))
+            .values(
+                queued_to_dlq=True,
+                retryable=False,
+                last_error=case(errors, value=ExecutionLog.id),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     async def increment_attempts(self, log: ExecutionLog, error: str | None = None) -> ExecutionLog:
         log.attempts += 1
         if error:
@@ -41,10 +452,7 @@ class ExecutionLogRepository:
         return log
 
     async def get_by_event(self, event_id, workflow_id) -> ExecutionLog | None:
-        stmt = select(ExecutionLog).where(
-            ExecutionLog.event_id == event_id,
-            ExecutionLog.workflow_id == workflow_id,
-        )
+        stmt = select(ExecutionLog).where(*self._by_key(event_id, workflow_id))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -63,15 +471,30 @@ class ExecutionLogRepository:
         status=None,
         trace_id=None,
         queued_to_dlq: bool | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[ExecutionLog]:
+        """Newest first. ``cursor`` (from ``list_page``) resumes after a row."""
+        if cursor and offset:
+            raise ValueError("cursor and offset cannot be combined")
         stmt = (
             select(ExecutionLog)
-            .order_by(ExecutionLog.created_at.desc())
+            .order_by(ExecutionLog.created_at.desc(), ExecutionLog.id.desc())
             .offset(offset)
             .limit(limit)
         )
+        if cursor:
+            created_at, log_id = decode_cursor(cursor)
+            # Written so the ``created_at`` range can use the
+            # ``(workflow_id[, status], created_at)`` indexes and prune
+            # partitions; only rows sharing a timestamp are compared by id.
+            stmt = stmt.where(
+                ExecutionLog.created_at <= created_at,
+                or_(ExecutionLog.created_at < created_at, ExecutionLog.id < log_id),
+            )
 
         if workflow_id:
             stmt = stmt.where(ExecutionLog.workflow_id == workflow_id)
@@ -83,6 +506,53 @@ class ExecutionLogRepository:
             stmt = stmt.where(ExecutionLog.trace_id == trace_id)
         if queued_to_dlq is not None:
             stmt = stmt.where(ExecutionLog.queued_to_dlq == queued_to_dlq)
+        if since is not None:
+            stmt = stmt.where(ExecutionLog.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(ExecutionLog.created_at < until)
 
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def list_page(self, *, limit: int = 50, **filters) -> tuple[Sequence[ExecutionLog], str | None]:
+        """One page of ``list`` plus the cursor of the next page (None on the last)."""
+        logs = await self.list(limit=limit + 1, **filters)
+        if len(logs) <= limit:
+            return logs, None
+        last = logs[limit - 1]
+        return logs[:limit], encode_cursor(last.created_at, last.id)
+
+    async def stream_older_than(
+        self,
+        cutoff: datetime,
+        batch_size: int,
+        workflow_id: UUID | None = None,
+    ) -> AsyncIterator[Sequence]:
+        """Rows created before ``cutoff``, ordered by ``(workflow_id, created_at, id)``, ``batch_size`` at a time."""
+        table = ExecutionLog.__table__
+        stmt = (
+            select(table)
+            .where(table.c.created_at < cutoff)
+            .order_by(table.c.workflow_id, table.c.created_at, table.c.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if workflow_id is not None:
+            stmt = stmt.where(table.c.workflow_id == workflow_id)
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def delete_archived(self, rows: Sequence[tuple[UUID, datetime]]) -> None:
+        """Delete rows (and their keys) by ``(id, created_at)``."""
+        if not rows:
+            return
+        await self.session.execute(
+            delete(ExecutionLog)
+            .where(tuple_(ExecutionLog.id, ExecutionLog.created_at).in_(rows))
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(
+            delete(ExecutionLogKey)
+            .where(ExecutionLogKey.log_id.in_([log_id for log_id, _ in rows]))
+            .execution_options(synchronize_session=False)
+        )
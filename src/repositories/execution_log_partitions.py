@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import delete, exists, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import ExecutionLog, ExecutionLogKey
+
+PARENT = ExecutionLog.__tablename__
+
+# Bounds are read back through ``timestamptz`` so they do not depend on the
+# session's TimeZone/DateStyle. MINVALUE and DEFAULT yield NULLs.
+PARTITIONS_QUERY = text(
+    """
+    SELECT c.relname AS name,
+           pg_get_expr(c.relpartbound, c.oid) = 'DEFAULT' AS is_default,
+           (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'FROM \\(''([^'']+)''\\)'))[1]::timestamptz AS lower,
+           (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'TO \\(''([^'']+)''\\)'))[1]::timestamptz AS upper
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = CAST(:parent AS regclass)
+    ORDER BY upper NULLS FIRST
+    """
+)
+
+
+@dataclass(frozen=True)
+class Partition:
+    name: str
+    lower: datetime | None
+    upper: datetime | None
+    is_default: bool = False
+
+
+def partition_name(start: datetime) -> str:
+    return f"{PARENT}_p{start:%Y%m%d}"
+
+
+class ExecutionLogPartitionRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def try_lock(self) -> bool:
+        """Transaction-scoped lock so one worker at a time changes partitions."""
+        stmt = select(text("pg_try_advisory_xact_lock(hashtext(:parent))"))
+        return (await self.session.execute(stmt, {"parent": PARENT})).scalar_one()
+
+    async def list(self) -> list[Partition]:
+        rows = (await self.session.execute(PARTITIONS_QUERY, {"parent": PARENT})).all()
+        return [
+            Partition(name=row.name, lower=row.lower, upper=row.upper, is_default=row.is_default)
+            for row in rows
+        ]
+
+    def _quote(self, name: str) -> str:
+        return self.session.bind.dialect.identifier_preparer.quote(name)
+
+    async def create(self, start: datetime, end: datetime) -> str:
+        name = partition_name(start)
+        await self.session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {self._quote(name)} PARTITION OF {PARENT} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+        return name
+
+    async def move_default_rows(self, start: datetime, end: datetime, default: str) -> int:
+        """Create the ``[start, end)`` partition and move its rows out of ``default``; returns how many."""
+        # The range cannot be attached while the default partition holds rows
+        # that belong to it, so the default partition is detached for the move.
+        default = self._quote(default)
+        in_range = f"created_at >= '{start.isoformat()}' AND created_at < '{end.isoformat()}'"
+        await self.session.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {default}"))
+        await self.create(start, end)
+        result = await self.session.execute(
+            text(f"INSERT INTO {PARENT} SELECT * FROM {default} WHERE {in_range}")
+        )
+        await self.session.execute(text(f"DELETE FROM {default} WHERE {in_range}"))
+        await self.session.execute(text(f"ALTER TABLE {PARENT} ATTACH PARTITION {default} DEFAULT"))
+        return result.rowcount
+
+    async def has_rows(self, name: str, start: datetime, end: datetime) -> bool:
+        stmt = text(
+            f"SELECT EXISTS (SELECT 1 FROM {self._quote(name)} "
+            "WHERE created_at >= :start AND created_at < :end)"
+        )
+        return (await self.session.execute(stmt, {"start": start, "end": end})).scalar_one()
+
+    async def drop(self, name: str) -> None:
+        await self.session.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {self._quote(name)}"))
+        await self.session.execute(text(f"DROP TABLE {self._quote(name)}"))
+
+    async def delete_orphaned_keys(self, before: datetime, limit: int, after: datetime | None = None) -> int:
+        """Delete up to ``limit`` keys created in ``[after, before)`` whose log row no longer exists."""
+        batch = (
+            select(ExecutionLogKey.log_id)
+            .where(
+                ExecutionLogKey.created_at < before,
+                ~exists().where(
+                    ExecutionLog.id == ExecutionLogKey.log_id,
+                    ExecutionLog.created_at == ExecutionLogKey.created_at,
+                ),
+            )
+            .limit(limit)
+        )
+        if after is not None:
+            batch = batch.where(ExecutionLogKey.created_at >= after)
+        result = await self.session.execute(
+            delete(ExecutionLogKey)
+            .where(ExecutionLogKey.log_id.in_(batch.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
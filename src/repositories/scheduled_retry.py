@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import select, delete, update, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import ScheduledRetry
+from src.events.schema import EventEnvelope
+
+
+class ScheduledRetryRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def schedule(
+        self,
+        event: EventEnvelope,
+        workflow_id: UUID,
+        attempts: int,
+        delay: float,
+        error: str | None = None,
+    ) -> None:
+        """Record (or move) the next attempt for an event ``delay`` seconds from now."""
+        next_attempt_at = func.now() + timedelta(seconds=delay)
+        stmt = insert(ScheduledRetry).values(
+            event_id=event.event_id,
+            workflow_id=workflow_id,
+            envelope=event.model_dump(mode="json"),
+            attempts=attempts,
+            next_attempt_at=next_attempt_at,
+            last_error=error,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["event_id", "workflow_id"],
+            set_={
+                "attempts": stmt.excluded.attempts,
+                "next_attempt_at": stmt.excluded.next_attempt_at,
+                "last_error": stmt.excluded.last_error,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def claim_due(self, limit: int, lease_seconds: float) -> list[ScheduledRetry]:
+        """Take up to ``limit`` due retries and hide them from other schedulers for ``lease_seconds``."""
+        due = (
+            select(ScheduledRetry.id)
+            .where(ScheduledRetry.next_attempt_at <= func.now())
+            .order_by(ScheduledRetry.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(ScheduledRetry)
+            .where(ScheduledRetry.id.in_(due.scalar_subquery()))
+            .values(next_attempt_at=func.now() + timedelta(seconds=lease_seconds))
+            .returning(ScheduledRetry)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _still_leased(rows: Sequence[ScheduledRetry]):
+        # A retry rescheduled while its lease was out has a new
+        # ``next_attempt_at`` and must be left alone.
+        return tuple_(ScheduledRetry.id, ScheduledRetry.next_attempt_at).in_(
+            [(row.id, row.next_attempt_at) for row in rows]
+        )
+
+    async def delete(self, rows: Sequence[ScheduledRetry]) -> None:
+        if not rows:
+            return
+        await self.session.execute(
+            delete(ScheduledRetry)
+            .where(self._still_leased(rows))
+            .execution_options(synchronize_session=False)
+        )
+
+    async def postpone(self, rows: Sequence[ScheduledRetry], delay: float) -> None:
+        if not rows:
+            return
+        await self.session.execute(
+            update(ScheduledRetry)
+            .where(self._still_leased(rows))
+            .values(next_attempt_at=func.now() + timedelta(seconds=delay))
+            .execution_options(synchronize_session=False)
+        )
+
+    async def stats(self) -> tuple[int, datetime | None]:
+        """Return the number of scheduled retries and the earliest due time among them."""
+        result = await self.session.execute(
+            select(func.count(), func.min(ScheduledRetry.next_attempt_at))
+        )
+        count, earliest = result.one()
+        return count, earliest
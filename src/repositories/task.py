@@ -2,7 +2,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, Sequence
 
-from src.db.models import Task
+from src.db.models import ExecutionLog, ExecutionLogKey, Task
 from src.core.exceptions import WorkflowNotFound
 
 
@@ -27,6 +27,28 @@ class TaskRepository:
         )
         return result.scalars().all()
 
+    async def list_for_event(self, workflow_id: UUID, event_id: UUID) -> list[tuple[Task, str | None]]:
+        """Workflow tasks paired with their step status for ``event_id``, if already run."""
+        # Through the step keys, so each log row is fetched by its primary key
+        # in one partition instead of scanning every partition of the workflow.
+        result = await self.session.execute(
+            select(Task, ExecutionLog.status)
+            .outerjoin(
+                ExecutionLogKey,
+                (ExecutionLogKey.task_id == Task.id)
+                & (ExecutionLogKey.event_id == event_id)
+                & (ExecutionLogKey.workflow_id == workflow_id),
+            )
+            .outerjoin(
+                ExecutionLog,
+                (ExecutionLog.id == ExecutionLogKey.log_id)
+                & (ExecutionLog.created_at == ExecutionLogKey.created_at),
+            )
+            .where(Task.workflow_id == workflow_id)
+            .order_by(Task.created_at)
+        )
+        return [(task, status) for task, status in result.all()]
+
     async def update_status(self, task: Task, status: str) -> Task:
         task.status = status
         await self.session.flush()
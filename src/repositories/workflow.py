@@ -1,10 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, Sequence
+from sqlalchemy import select, Sequence, func
 from sqlalchemy.exc import IntegrityError
 
 from src.db.models import Workflow
 from src.core.exceptions import WorkflowNotFound, WorkflowAlreadyExists
 
+WORKFLOW_CHANGED_CHANNEL = "workflow_changed"
+
 
 class WorkflowRepository:
     def __init__(self, session: AsyncSession):
@@ -44,3 +46,9 @@ class WorkflowRepository:
     async def delete(self, workflow: Workflow) -> None:
         await self.session.delete(workflow)
         await self.session.flush()
+
+    async def notify_changed(self, workflow_id) -> None:
+        """Queue a NOTIFY for workers' caches; Postgres delivers it on commit."""
+        await self.session.execute(
+            select(func.pg_notify(WORKFLOW_CHANGED_CHANNEL, str(workflow_id)))
+        )
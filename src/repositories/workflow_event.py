@@ -0,0 +1,78 @@
+from datetime import timedelta
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import WorkflowEvent
+from src.events.schema import EventEnvelope
+
+
+class WorkflowEventRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, events: Sequence[EventEnvelope]) -> dict[UUID, UUID]:
+        """Insert events in one statement; map event_id to message id for the rows inserted."""
+        stmt = (
+            insert(WorkflowEvent)
+            .values([{"event_id": event.event_id, "envelope": event.model_dump(mode="json")} for event in events])
+            .on_conflict_do_nothing(index_elements=["event_id"])
+            .returning(WorkflowEvent.event_id, WorkflowEvent.id)
+        )
+        result = await self.session.execute(stmt)
+        return dict(result.all())
+
+    async def claim(self, limit: int, visibility_timeout: float) -> list[WorkflowEvent]:
+        """Lease up to ``limit`` visible messages for ``visibility_timeout`` seconds, skipping locked rows."""
+        claimable = (
+            select(WorkflowEvent.id)
+            .where(
+                WorkflowEvent.dead_lettered_at.is_(None),
+                WorkflowEvent.visible_at <= func.now(),
+            )
+            .order_by(WorkflowEvent.visible_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(WorkflowEvent)
+            .where(WorkflowEvent.id.in_(claimable.scalar_subquery()))
+            .values(
+                visible_at=func.now() + timedelta(seconds=visibility_timeout),
+                deliveries=WorkflowEvent.deliveries + 1,
+            )
+            .returning(WorkflowEvent)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def ack(self, ids: Sequence[UUID]) -> None:
+        if not ids:
+            return
+        await self.session.execute(
+            delete(WorkflowEvent).where(WorkflowEvent.id.in_(ids))
+        )
+
+    async def nack(self, ids: Sequence[UUID], delay: float = 0.0) -> None:
+        if not ids:
+            return
+        await self.session.execute(
+            update(WorkflowEvent)
+            .where(WorkflowEvent.id.in_(ids))
+            .values(visible_at=func.now() + timedelta(seconds=delay))
+            .execution_options(synchronize_session=False)
+        )
+
+    async def dead_letter(self, ids: Sequence[UUID]) -> None:
+        if not ids:
+            return
+        await self.session.execute(
+            update(WorkflowEvent)
+            .where(WorkflowEvent.id.in_(ids))
+            .values(dead_lettered_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
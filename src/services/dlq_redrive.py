@@ -0,0 +1,198 @@
+"""Re-drive DLQ'd executions by re-publishing their original envelopes."""
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.core.config import settings
+from src.events.schema import EventEnvelope
+from src.infrastructure.messaging.base import EventProducer
+from src.repositories.execution_log import ExecutionLogRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DlqFilter:
+    workflow_id: UUID | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    error: str | None = None
+
+
+@dataclass
+class RedriveProgress:
+    id: UUID = field(default_factory=uuid4)
+    total: int = 0
+    published: int = 0
+    failed: int = 0
+    done: bool = False
+    error: str | None = None
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+
+
+class DlqRedrive:
+    """Moves matching DLQ rows back into the pipeline, ``batch_size`` at a time, paced to ``rate``/s."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        producer: EventProducer,
+        batch_size: int = 500,
+        rate: float = 1000.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._producer = producer
+        self._batch_size = batch_size
+        self._rate = rate
+
+    async def count(self, dlq_filter: DlqFilter) -> int:
+        async with self._session_factory() as session:
+            return await ExecutionLogRepository(session).count_dlq(**asdict(dlq_filter))
+
+    async def _reset_batch(self, dlq_filter: DlqFilter, after_id: UUID | None):
+        # Committed before publishing: a worker that saw the event while its row
+        # was still flagged as DLQ would ack it as a duplicate.
+        async with self._session_factory() as session:
+            async with session.begin():
+                repo = ExecutionLogRepository(session)
+                rows = await repo.claim_dlq_batch(
+                    self._batch_size, after_id=after_id, **asdict(dlq_filter)
+                )
+                redrivable: list[tuple[UUID, EventEnvelope]] = []
+                for row in rows:
+                    try:
+                        redrivable.append((row.id, EventEnvelope.model_validate(row.payload_snapshot)))
+                    except ValidationError:
+                        logger.warning("Skipping DLQ row with invalid envelope", extra={"log_id": str(row.id)})
+                await repo.reset_for_redrive([log_id for log_id, _ in redrivable])
+        return rows, redrivable
+
+    async def run(self, dlq_filter: DlqFilter, progress: RedriveProgress | None = None) -> RedriveProgress:
+        progress = progress or RedriveProgress()
+        progress.total = await self.count(dlq_filter)
+        started = time.monotonic()
+        after_id: UUID | None = None
+
+        while True:
+            rows, redrivable = await self._reset_batch(dlq_filter, after_id)
+            if not rows:
+                break
+            after_id = rows[-1].id
+            progress.failed += len(rows) - len(redrivable)
+
+            results = await self._producer.publish_batch_async([event for _, event in redrivable])
+            errors = {
+                log_id: f"Re-drive publish failed: {result}"
+                for (log_id, _), result in zip(redrivable, results)
+                if isinstance(result, BaseException)
+            }
+            if errors:
+                async with self._session_factory() as session:
+                    async with session.begin():
+                        await ExecutionLogRepository(session).return_to_dlq(errors)
+
+            published = len(redrivable) - len(errors)
+            progress.published += published
+            progress.failed += len(errors)
+            metrics.record_dlq_redriven(published, len(rows) - published)
+            logger.info(
+                "DLQ re-drive progress",
+                extra={
+                    "redrive_id": str(progress.id),
+                    "published": progress.published,
+                    "failed": progress.failed,
+                    "total": progress.total,
+                },
+            )
+
+            ahead = (progress.published + progress.failed) / self._rate - (time.monotonic() - started)
+            if ahead > 0:
+                await asyncio.sleep(ahead)
+
+        progress.done = True
+        progress.finished_at = datetime.now(timezone.utc)
+        return progress
+
+
+class RedriveJobs:
+    """Re-drive runs started from the API, tracked in this process only; other instances do not see them."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[UUID, tuple[RedriveProgress, asyncio.Task]] = {}
+
+    def start(self, redrive: DlqRedrive, dlq_filter: DlqFilter) -> RedriveProgress:
+        progress = RedriveProgress()
+        task = asyncio.create_task(self._run(redrive, dlq_filter, progress))
+        self._jobs[progress.id] = (progress, task)
+        return progress
+
+    @staticmethod
+    async def _run(redrive: DlqRedrive, dlq_filter: DlqFilter, progress: RedriveProgress) -> None:
+        try:
+            await redrive.run(dlq_filter, progress)
+        except Exception as e:
+            logger.exception("DLQ re-drive failed", extra={"redrive_id": str(progress.id)})
+            progress.error = str(e)
+            progress.done = True
+            progress.finished_at = datetime.now(timezone.utc)
+
+    def get(self, job_id: UUID) -> RedriveProgress | None:
+        job = self._jobs.get(job_id)
+        return job[0] if job else None
+
+    async def cancel_all(self) -> None:
+        jobs, self._jobs = self._jobs, {}
+        for _, task in jobs.values():
+            task.cancel()
+        await asyncio.gather(*(task for _, task in jobs.values()), return_exceptions=True)
+
+
+redrive_jobs = RedriveJobs()
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from src.db.session import async_session_factory
+    from src.infrastructure.messaging.factory import build_event_producer
+
+    dlq_filter = DlqFilter(
+        workflow_id=args.workflow_id,
+        since=args.since,
+        until=args.until,
+        error=args.error,
+    )
+    producer = build_event_producer()
+    try:
+        redrive = DlqRedrive(async_session_factory, producer, batch_size=args.batch_size, rate=args.rate)
+        if args.dry_run:
+            print(f"{await redrive.count(dlq_filter)} DLQ rows match")
+            return
+        progress = await redrive.run(dlq_filter)
+        print(f"published {progress.published} of {progress.total}, {progress.failed} failed")
+    finally:
+        producer.close()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflow-id", type=UUID)
+    parser.add_argument("--since", type=datetime.fromisoformat)
+    parser.add_argument("--until", type=datetime.fromisoformat)
+    parser.add_argument("--error", help="substring of last_error")
+    parser.add_argument("--batch-size", type=int, default=settings.DLQ_REDRIVE_BATCH_SIZE)
+    parser.add_argument("--rate", type=float, default=settings.DLQ_REDRIVE_RATE_PER_SECOND)
+    parser.add_argument("--dry-run", action="store_true")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
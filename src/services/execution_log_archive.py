@@ -0,0 +1,343 @@
+"""Archive old execution logs to zstd-compressed Parquet and read them back."""
+import argparse
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from itertools import groupby
+from typing import Iterator, Sequence
+from uuid import UUID, uuid4
+
+import orjson
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.core.config import settings
+from src.repositories.execution_log import ExecutionLogRepository, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+JSON_COLUMNS = ("result", "payload_snapshot")
+
+# ``workflow_id`` and the UTC ``date`` of ``created_at`` live in the path.
+ARCHIVE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("event_id", pa.string()),
+        ("task_id", pa.string()),
+        ("trace_id", pa.string()),
+        ("action", pa.string()),
+        ("status", pa.string()),
+        ("result", pa.string()),
+        ("payload_snapshot", pa.string()),
+        ("error", pa.string()),
+        ("last_error", pa.string()),
+        ("retryable", pa.bool_()),
+        ("attempts", pa.int32()),
+        ("queued_to_dlq", pa.bool_()),
+        ("duration", pa.float64()),
+        ("action_duration_ms", pa.float64()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("lease_owner", pa.string()),
+        ("lease_expires_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+# <uri>/workflow_id=<uuid>/date=<YYYY-MM-DD>/part-*.parquet, so reads filtered
+# by workflow and time only open the matching directories.
+PARTITIONING = ds.partitioning(
+    pa.schema([("workflow_id", pa.string()), ("date", pa.string())]),
+    flavor="hive",
+)
+
+
+def _filesystem(uri: str) -> tuple[pafs.FileSystem, str]:
+    """Resolve ``uri``; local archives are read through memory maps."""
+    if "://" not in uri:
+        return pafs.LocalFileSystem(use_mmap=True), os.path.abspath(uri)
+    filesystem, path = pafs.FileSystem.from_uri(uri)
+    if isinstance(filesystem, pafs.LocalFileSystem):
+        filesystem = pafs.LocalFileSystem(use_mmap=True)
+    return filesystem, path
+
+
+def _archived_value(name: str, value):
+    if value is None:
+        return None
+    if name in JSON_COLUMNS:
+        return orjson.dumps(value).decode()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _to_table(rows: Sequence) -> pa.Table:
+    return pa.Table.from_pydict(
+        {
+            name: [_archived_value(name, row._mapping[name]) for row in rows]
+            for name in ARCHIVE_SCHEMA.names
+        },
+        schema=ARCHIVE_SCHEMA,
+    )
+
+
+def _group_of(row) -> tuple[UUID, str]:
+    return row.workflow_id, row.created_at.astimezone(timezone.utc).date().isoformat()
+
+
+class ExecutionLogArchiver:
+    """Moves execution logs older than a cutoff from Postgres to Parquet."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        uri: str,
+        batch_size: int = 10000,
+        delete_batch_size: int = 1000,
+        file_rows: int = 1_000_000,
+    ) -> None:
+        self._session_factory = session_factory
+        self._filesystem, self._root = _filesystem(uri)
+        self._batch_size = batch_size
+        self._delete_batch_size = delete_batch_size
+        self._file_rows = file_rows
+
+    def _open(self, group: tuple[UUID, str], name: str) -> pq.ParquetWriter:
+        workflow_id, day = group
+        directory = f"{self._root}/workflow_id={workflow_id}/date={day}"
+        self._filesystem.create_dir(directory, recursive=True)
+        return pq.ParquetWriter(
+            f"{directory}/{name}.parquet",
+            ARCHIVE_SCHEMA,
+            filesystem=self._filesystem,
+            compression="zstd",
+        )
+
+    async def _close(self, writer: pq.ParquetWriter | None, written: list[tuple[UUID, datetime]]) -> int:
+        if writer is None:
+            return 0
+        await asyncio.to_thread(writer.close)
+        # Rows are deleted only once their file is closed; a crash before that
+        # archives them again on the next run.
+        for start in range(0, len(written), self._delete_batch_size):
+            async with self._session_factory() as session:
+                async with session.begin():
+                    await ExecutionLogRepository(session).delete_archived(
+                        written[start:start + self._delete_batch_size]
+                    )
+        metrics.record_execution_logs_archived(len(written))
+        return len(written)
+
+    async def run(
+        self,
+        older_than: timedelta,
+        workflow_id: UUID | None = None,
+        now: datetime | None = None,
+    ) -> int:
+        """Archive rows created more than ``older_than`` ago; returns how many."""
+        cutoff = (now or datetime.now(timezone.utc)) - older_than
+        run_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid4().hex[:8]}"
+        group = writer = None
+        written: list[tuple[UUID, datetime]] = []
+        archived = files = 0
+
+        async with self._session_factory() as session:
+            batches = ExecutionLogRepository(session).stream_older_than(
+                cutoff, self._batch_size, workflow_id=workflow_id
+            )
+            async for rows in batches:
+                for key, run in groupby(rows, key=_group_of):
+                    run = list(run)
+                    if key != group or len(written) >= self._file_rows:
+                        archived += await self._close(writer, written)
+                        writer, written, group = self._open(key, f"part-{run_id}-{files:05d}"), [], key
+                        files += 1
+                    await asyncio.to_thread(writer.write_table, _to_table(run))
+                    written.extend((row.id, row.created_at) for row in run)
+        archived += await self._close(writer, written)
+
+        logger.info(
+            "Execution logs archived",
+            extra={"rows": archived, "files": files, "cutoff": cutoff.isoformat()},
+        )
+        return archived
+
+
+class ExecutionLogArchive:
+    """Reads archived execution logs in ``list_execution_logs`` order."""
+
+    def __init__(self, uri: str, archive_after: timedelta) -> None:
+        self._filesystem, self._root = _filesystem(uri)
+        self._archive_after = archive_after
+
+    def horizon(self, now: datetime | None = None) -> datetime:
+        return (now or datetime.now(timezone.utc)) - self._archive_after
+
+    def _dataset(self) -> ds.Dataset | None:
+        try:
+            return ds.dataset(
+                self._root,
+                schema=pa.unify_schemas([ARCHIVE_SCHEMA, PARTITIONING.schema]),
+                format="parquet",
+                filesystem=self._filesystem,
+                partitioning=PARTITIONING,
+            )
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _days(dataset: ds.Dataset, expression: ds.Expression | None) -> list[str]:
+        fragments = dataset.get_fragments(filter=expression) if expression is not None else dataset.get_fragments()
+        days = {ds.get_partition_keys(fragment.partition_expression).get("date") for fragment in fragments}
+        return sorted((day for day in days if day is not None), reverse=True)
+
+    @staticmethod
+    def _read_day(dataset: ds.Dataset, expression: ds.Expression | None, day: str) -> pa.Table:
+        condition = ds.field("date") == day
+        table = dataset.to_table(filter=condition if expression is None else expression & condition)
+        return table.sort_by([("created_at", "descending"), ("id", "descending")])
+
+    def _rows(self, dataset: ds.Dataset, expression: ds.Expression | None) -> Iterator[dict]:
+        # One ``date=`` directory at a time, newest first, so a page stops reading once full.
+        for day in self._days(dataset, expression):
+            for batch in self._read_day(dataset, expression, day).to_batches():
+                yield from batch.to_pylist()
+
+    def list_page(
+        self,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        workflow_id: UUID | None = None,
+        event_id: UUID | None = None,
+        status: str | None = None,
+        trace_id: str | None = None,
+        queued_to_dlq: bool | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Newest first, with the same filters and cursors as ``ExecutionLogRepository.list_page``."""
+        dataset = self._dataset()
+        if dataset is None:
+            return [], None
+
+        conditions = []
+        if workflow_id:
+            conditions.append(ds.field("workflow_id") == str(workflow_id))
+        if event_id:
+            conditions.append(ds.field("event_id") == str(event_id))
+        if status:
+            conditions.append(ds.field("status") == status)
+        if trace_id:
+            conditions.append(ds.field("trace_id") == trace_id)
+        if queued_to_dlq is not None:
+            conditions.append(ds.field("queued_to_dlq") == queued_to_dlq)
+        if since is not None:
+            conditions.append(ds.field("date") >= since.astimezone(timezone.utc).date().isoformat())
+            conditions.append(ds.field("created_at") >= since)
+        if until is not None:
+            conditions.append(ds.field("date") <= until.astimezone(timezone.utc).date().isoformat())
+            conditions.append(ds.field("created_at") < until)
+        if cursor:
+            created_at, log_id = decode_cursor(cursor)
+            conditions.append(ds.field("date") <= created_at.astimezone(timezone.utc).date().isoformat())
+            conditions.append(
+                (ds.field("created_at") < created_at)
+                | ((ds.field("created_at") == created_at) & (ds.field("id") < str(log_id)))
+            )
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        # A crashed archiver run can leave the same row in two files.
+        logs, seen = [], set()
+        for row in self._rows(dataset, expression):
+            if row["id"] in seen:
+                continue
+            seen.add(row["id"])
+            for name in JSON_COLUMNS:
+                if row[name] is not None:
+                    row[name] = orjson.loads(row[name])
+            logs.append(row)
+            if len(logs) > limit:
+                break
+
+        if len(logs) <= limit:
+            return logs, None
+        last = logs[limit - 1] if limit else None
+        next_cursor = encode_cursor(last["created_at"], UUID(last["id"])) if last else cursor
+        return logs[:limit], next_cursor
+
+
+async def list_page_with_archive(
+    repo: ExecutionLogRepository,
+    archive: ExecutionLogArchive | None,
+    *,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: str | None = None,
+    since: datetime | None = None,
+    **filters,
+) -> tuple[list, str | None]:
+    """``repo.list_page``, continued into the archive once Postgres runs out."""
+    logs, next_cursor = await repo.list_page(
+        limit=limit, offset=offset, cursor=cursor, since=since, **filters
+    )
+    # Archived rows are all older than those in Postgres, so they follow them in
+    # cursor order; only cursor pages whose ``since`` is past the horizon need them.
+    if archive is None or next_cursor is not None or offset or since is None or since >= archive.horizon():
+        return list(logs), next_cursor
+
+    if logs:
+        cursor = encode_cursor(logs[-1].created_at, logs[-1].id)
+    archived, next_cursor = await asyncio.to_thread(
+        archive.list_page, limit=limit - len(logs), cursor=cursor, since=since, **filters
+    )
+    return [*logs, *archived], next_cursor
+
+
+execution_log_archive = (
+    ExecutionLogArchive(
+        settings.EXECUTION_LOG_ARCHIVE_URI,
+        archive_after=timedelta(days=settings.EXECUTION_LOG_ARCHIVE_AFTER_DAYS),
+    )
+    if settings.EXECUTION_LOG_ARCHIVE_URI
+    else None
+)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from src.db.session import async_session_factory
+
+    archiver = ExecutionLogArchiver(
+        async_session_factory,
+        args.uri,
+        batch_size=args.batch_size,
+        delete_batch_size=args.delete_batch_size,
+        file_rows=args.file_rows,
+    )
+    archived = await archiver.run(timedelta(days=args.older_than_days), workflow_id=args.workflow_id)
+    print(f"archived {archived} execution logs to {args.uri}")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uri", default=settings.EXECUTION_LOG_ARCHIVE_URI, required=not settings.EXECUTION_LOG_ARCHIVE_URI)
+    parser.add_argument("--older-than-days", type=int, default=settings.EXECUTION_LOG_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--workflow-id", type=UUID)
+    parser.add_argument("--batch-size", type=int, default=settings.EXECUTION_LOG_ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--delete-batch-size", type=int, default=settings.EXECUTION_LOG_ARCHIVE_DELETE_BATCH_SIZE)
+    parser.add_argument("--file-rows", type=int, default=settings.EXECUTION_LOG_ARCHIVE_FILE_ROWS)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
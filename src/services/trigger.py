@@ -0,0 +1,40 @@
+from typing import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.events.schema import EventEnvelope
+from src.infrastructure.messaging.base import EventProducer
+from src.repositories.event_outbox import EventOutboxRepository
+
+
+class TriggerService:
+    def __init__(
+        self,
+        producer: EventProducer,
+        outbox_repo: EventOutboxRepository,
+        session: AsyncSession,
+        use_outbox: bool = False,
+    ):
+        self.producer = producer
+        self.outbox_repo = outbox_repo
+        self.session = session
+        self.use_outbox = use_outbox
+
+    async def dispatch(self, event: EventEnvelope) -> None:
+        if self.use_outbox:
+            async with self.session.begin():
+                await self.outbox_repo.add(event)
+            return
+
+        await self.producer.publish_async(event)
+
+    async def dispatch_batch(
+        self, events: Sequence[EventEnvelope]
+    ) -> list[str | BaseException | None]:
+        """Return one outcome per event: an exception marks a failed item."""
+        if self.use_outbox:
+            async with self.session.begin():
+                await self.outbox_repo.add_many(events)
+            return [None] * len(events)
+
+        return await self.producer.publish_batch_async(events)
@@ -25,11 +25,14 @@ class WorkflowService:
         async with self.session.begin():
             workflow = await self.workflow_repo.get_by_id(workflow_id)
             updated_workflow = await self.workflow_repo.update(workflow, payload)
+            await self.workflow_repo.notify_changed(workflow_id)
         return updated_workflow
 
     async def delete_workflow(self, workflow_id: UUID) -> None:
-        workflow = await self.workflow_repo.get_by_id(workflow_id)
-        await self.workflow_repo.delete(workflow)
+        async with self.session.begin():
+            workflow = await self.workflow_repo.get_by_id(workflow_id)
+            await self.workflow_repo.delete(workflow)
+            await self.workflow_repo.notify_changed(workflow_id)
 
     async def create_workflow(self, payload: Dict) -> Workflow:
         async with self.session.begin():
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.infrastructure.messaging.base import EventConsumer
+from src.infrastructure.messaging.in_process import QueuedEvent
+from src.worker.services.event_handler import handle_event
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessConsumer(EventConsumer):
+    """Runs the worker pipeline on a pool of tasks inside the API process, redelivering nacked events."""
+
+    def __init__(
+        self,
+        queue: asyncio.Queue[QueuedEvent],
+        session_factory: async_sessionmaker[AsyncSession],
+        concurrency: int = 8,
+        redelivery_delay: float = 1.0,
+        max_deliveries: int = 10,
+        drain_timeout: float = 10.0,
+    ) -> None:
+        self._queue = queue
+        self._session_factory = session_factory
+        self._concurrency = concurrency
+        self._redelivery_delay = redelivery_delay
+        self._max_deliveries = max_deliveries
+        self._drain_timeout = drain_timeout
+        self._tasks: list[asyncio.Task] = []
+        self._redeliveries: set[asyncio.Task] = set()
+
+    async def _redeliver(self, item: QueuedEvent, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queue.put(item)
+        metrics.record_inprocess_queue_depth(self._queue.qsize())
+
+    async def _handle(self, item: QueuedEvent) -> None:
+        item.deliveries += 1
+        async with self._session_factory() as session:
+            outcome = await handle_event(session, item.event)
+        if outcome.ack:
+            return
+
+        if item.deliveries >= self._max_deliveries:
+            logger.error(
+                "Dropping event after max deliveries",
+                extra={
+                    "event_id": str(item.event.event_id),
+                    "trace_id": item.event.trace_id,
+                    "deliveries": item.deliveries,
+                },
+            )
+            return
+
+        delay = outcome.retry_after if outcome.retry_after is not None else self._redelivery_delay
+        task = asyncio.create_task(self._redeliver(item, delay))
+        self._redeliveries.add(task)
+        task.add_done_callback(self._redeliveries.discard)
+
+    async def _run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            metrics.record_inprocess_queue_depth(self._queue.qsize())
+            try:
+                await self._handle(item)
+            except Exception:
+                logger.exception(
+                    "In-process consumer failed",
+                    extra={"event_id": str(item.event.event_id)},
+                )
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._run()) for _ in range(self._concurrency)
+        ]
+        logger.info(
+            "In-process consumers started",
+            extra={"consumers": self._concurrency, "queue_size": self._queue.maxsize},
+        )
+
+    async def stop(self) -> None:
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self._drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "In-process queue not drained before shutdown",
+                extra={"pending": self._queue.qsize()},
+            )
+
+        for task in [*self._tasks, *self._redeliveries]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._redeliveries, return_exceptions=True)
+        self._tasks = []
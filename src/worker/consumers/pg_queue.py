@@ -0,0 +1,134 @@
+import asyncio
+import logging
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.db.models import WorkflowEvent
+from src.events.schema import EventEnvelope
+from src.infrastructure.messaging.base import EventConsumer
+from src.repositories.workflow_event import WorkflowEventRepository
+from src.worker.services.drain import in_flight
+from src.worker.services.event_handler import ACK, NACK, EventOutcome, handle_event
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresQueueConsumer(EventConsumer):
+    """Polls ``workflow_events`` with N concurrent consumer tasks until the worker drains."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 10,
+        concurrency: int = 4,
+        visibility_timeout: float = 30.0,
+        poll_interval: float = 0.5,
+        max_deliveries: int = 10,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._visibility_timeout = visibility_timeout
+        self._poll_interval = poll_interval
+        self._max_deliveries = max_deliveries
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def _handle(self, message: WorkflowEvent) -> EventOutcome:
+        try:
+            event = EventEnvelope.model_validate(message.envelope)
+        except ValidationError:
+            logger.error(
+                "Invalid Envelope in queue",
+                exc_info=True,
+                extra={"message_id": str(message.id)},
+            )
+            return ACK
+
+        async with self._session_factory() as session:
+            return await handle_event(session, event)
+
+    async def consume_once(self) -> int:
+        async with self._session_factory() as session:
+            async with session.begin():
+                messages = await WorkflowEventRepository(session).claim(
+                    self._batch_size, self._visibility_timeout
+                )
+        if not messages:
+            return 0
+
+        # A message past its last delivery was claimed again because a worker
+        # died while handling it, so it is not handled once more.
+        dead = [message for message in messages if message.deliveries > self._max_deliveries]
+        handled = [message for message in messages if message.deliveries <= self._max_deliveries]
+        outcomes = await asyncio.gather(
+            *(self._handle(message) for message in handled), return_exceptions=True
+        )
+
+        acked = []
+        nacked: dict[float, list] = {}
+        for message, outcome in zip(handled, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Queue message handling failed",
+                    exc_info=outcome,
+                    extra={"message_id": str(message.id)},
+                )
+                outcome = NACK
+            if outcome.ack:
+                acked.append(message.id)
+            elif message.deliveries >= self._max_deliveries:
+                dead.append(message)
+            elif outcome.retry_after is not None:
+                nacked.setdefault(outcome.retry_after, []).append(message.id)
+            # Otherwise the message reappears once its visibility timeout ends.
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                repo = WorkflowEventRepository(session)
+                await repo.ack(acked)
+                for delay, ids in nacked.items():
+                    await repo.nack(ids, delay=delay)
+                await repo.dead_letter([message.id for message in dead])
+
+        if dead:
+            metrics.record_pg_queue_dead_lettered(len(dead))
+            logger.error(
+                "Dead-lettering queue messages after max deliveries",
+                extra={
+                    "message_ids": [str(message.id) for message in dead],
+                    "max_deliveries": self._max_deliveries,
+                },
+            )
+        return len(messages)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set() and not in_flight.draining:
+            claimed = 0
+            try:
+                claimed = await self.consume_once()
+            except Exception:
+                logger.exception("Queue consumer iteration failed")
+
+            if claimed < self._batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._run()) for _ in range(self._concurrency)
+        ]
+        logger.info(
+            "Queue consumers started",
+            extra={"consumers": self._concurrency, "batch_size": self._batch_size},
+        )
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
@@ -1,10 +1,54 @@
+import asyncio
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from prometheus_client import make_asgi_app
 
+from src.core.config import settings
+from src.core.http_client import close_http_client
+from src.db.session import async_session_factory
+from src.worker.consumers.pg_queue import PostgresQueueConsumer
 from src.worker.routers.pubsub import router as pubsub_router
+from src.worker.services.action_pools import action_pools
+from src.worker.services.background import WorkerBackgroundServices
+from src.worker.services.drain import in_flight, install_sigterm_drain
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    restore_sigterm = install_sigterm_drain(in_flight, settings.WORKER_DRAIN_TIMEOUT_SECONDS)
+    background = WorkerBackgroundServices(async_session_factory)
+    background.start()
+
+    consumer = None
+    if settings.EVENT_TRANSPORT == "postgres":
+        consumer = PostgresQueueConsumer(
+            async_session_factory,
+            batch_size=settings.PG_QUEUE_BATCH_SIZE,
+            concurrency=settings.PG_QUEUE_CONSUMERS,
+            visibility_timeout=settings.PG_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+            poll_interval=settings.PG_QUEUE_POLL_INTERVAL_SECONDS,
+            max_deliveries=settings.PG_QUEUE_MAX_DELIVERIES,
+        )
+        consumer.start()
+
+    try:
+        yield
+    finally:
+        in_flight.start_drain()
+        if consumer is not None:
+            await consumer.stop()
+        # A SIGTERM drain may already have used part of the budget.
+        await in_flight.wait_idle(in_flight.drain_remaining(settings.WORKER_DRAIN_TIMEOUT_SECONDS))
+        # Stops the write-behind buffer last, after its final flush.
+        await background.stop()
+        await close_http_client()
+        await asyncio.to_thread(action_pools.shutdown)
+        restore_sigterm()
 
 
 def create_app() -> FastAPI:
@@ -13,8 +57,10 @@ def create_app() -> FastAPI:
         docs_url=None,
         redoc_url=None,
         openapi_url=None,
+        lifespan=lifespan,
     )
     app.include_router(pubsub_router)
+    app.mount("/metrics", make_asgi_app())
     return app
 
 
@@ -0,0 +1,180 @@
+"""Streaming-pull worker: ``python -m src.worker.pull``, an alternative to the Pub/Sub push endpoint."""
+import asyncio
+import logging
+import signal
+
+from google.cloud import pubsub_v1
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.core.http_client import close_http_client
+from src.worker.services.action_pools import action_pools
+from src.worker.services.background import WorkerBackgroundServices
+from src.worker.services.event_handler import handle_event
+from src.worker.services.pubsub_decoder import decode_event_data
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingPullWorker:
+    """Bridges a Pub/Sub streaming pull subscription into asyncio."""
+
+    def __init__(
+        self,
+        subscriber,
+        subscription_path: str,
+        session_factory: async_sessionmaker[AsyncSession],
+        concurrency: int = 20,
+        max_messages: int = 100,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_lease_duration: int = 600,
+        drain_timeout: float = 8.0,
+    ) -> None:
+        self._subscriber = subscriber
+        self._subscription_path = subscription_path
+        self._session_factory = session_factory
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # The client's lease manager extends outstanding messages' ack deadlines
+        # up to ``max_lease_duration``, so long actions need no manual modack.
+        self._flow_control = pubsub_v1.types.FlowControl(
+            max_messages=max_messages,
+            max_bytes=max_bytes,
+            max_lease_duration=max_lease_duration,
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._drain_timeout = drain_timeout
+        self._stopping = asyncio.Event()
+        self._in_flight: set[asyncio.Future] = set()
+
+    async def _handle(self, message) -> None:
+        async with self._semaphore:
+            try:
+                event = decode_event_data(message.data)
+            except ValueError:
+                logger.error(
+                    "Payload validation error",
+                    exc_info=True,
+                    extra={"message_id": message.message_id},
+                )
+                message.ack()
+                return
+
+            try:
+                async with self._session_factory() as session:
+                    outcome = await handle_event(session, event)
+            except Exception:
+                logger.exception(
+                    "Unexpected error",
+                    extra={"message_id": message.message_id},
+                )
+                message.nack()
+                return
+
+            if outcome.ack:
+                message.ack()
+            else:
+                message.nack()
+
+    def _on_message(self, message) -> None:
+        # Runs on the subscriber's callback thread pool.
+        self._loop.call_soon_threadsafe(self._start, message)
+
+    def _start(self, message) -> None:
+        # Registered in the same loop callback that creates it, so a drain
+        # never misses a message that is already running.
+        task = self._loop.create_task(self._handle(message))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> BaseException | None:
+        """Pull until stopped; returns the error if the stream itself failed."""
+        self._loop = asyncio.get_running_loop()
+        streaming_future = self._subscriber.subscribe(
+            self._subscription_path,
+            callback=self._on_message,
+            flow_control=self._flow_control,
+        )
+        streaming_future.add_done_callback(
+            lambda _: self._loop.call_soon_threadsafe(self._stopping.set)
+        )
+        logger.info(
+            "Streaming pull started",
+            extra={"subscription": self._subscription_path},
+        )
+
+        await self._stopping.wait()
+
+        failure = None
+        if streaming_future.done() and not streaming_future.cancelled():
+            failure = streaming_future.exception()
+        if failure is not None:
+            logger.error(
+                "Streaming pull failed",
+                exc_info=failure,
+                extra={"subscription": self._subscription_path},
+            )
+        streaming_future.cancel()
+        if self._in_flight:
+            # Unfinished messages are not acked, so Pub/Sub redelivers them.
+            _, pending = await asyncio.wait(self._in_flight, timeout=self._drain_timeout)
+            if pending:
+                logger.warning(
+                    "Drain deadline reached",
+                    extra={"subscription": self._subscription_path, "in_flight": len(pending)},
+                )
+        logger.info(
+            "Streaming pull stopped",
+            extra={"subscription": self._subscription_path},
+        )
+        return failure
+
+
+async def _main() -> None:
+    from src.db.session import async_session_factory
+
+    if not settings.PUBSUB_SUBSCRIPTION_WORKFLOW_EVENTS:
+        raise SystemExit("PUBSUB_SUBSCRIPTION_WORKFLOW_EVENTS is not set")
+
+    subscriber = pubsub_v1.SubscriberClient()
+    worker = StreamingPullWorker(
+        subscriber,
+        subscriber.subscription_path(
+            settings.GCP_PROJECT_ID, settings.PUBSUB_SUBSCRIPTION_WORKFLOW_EVENTS
+        ),
+        async_session_factory,
+        concurrency=settings.PULL_CONCURRENCY,
+        max_messages=settings.PULL_MAX_MESSAGES,
+        max_bytes=settings.PULL_MAX_BYTES,
+        max_lease_duration=settings.PULL_MAX_LEASE_DURATION_SECONDS,
+        drain_timeout=settings.WORKER_DRAIN_TIMEOUT_SECONDS,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+
+    background = WorkerBackgroundServices(async_session_factory)
+    background.start()
+
+    try:
+        failure = await worker.run()
+    finally:
+        subscriber.close()
+        await background.stop()
+        await close_http_client()
+        await asyncio.to_thread(action_pools.shutdown)
+
+    if failure is not None:
+        raise SystemExit(1)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
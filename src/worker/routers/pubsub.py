@@ -2,28 +2,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-from uuid import uuid4
-
-from fastapi import APIRouter, Response, status, Depends
+from fastapi import APIRouter, Request, Response, status, Depends
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import OperationalError
 
-from src.actions.log import LogAction
+from src.core import metrics
 from src.db.session import get_session
-from src.core.exceptions import (
-    WorkflowResolutionError,
-    WorkflowNotFound,
-    WorkflowInactive,
-    WorkerRetryError,
-    WorkerFatalError
-)
-from src.models.actions import ExecutionContext
-from src.repositories.execution_log import ExecutionLogRepository
-from src.worker.services.executor import Executor
-from src.worker.services.workflow_resolver import WorkflowResolver
-from src.worker.models.pubsub_push import PubSubPushBody
-from src.worker.services.pubsub_decoder import decode_pubsub_message
+from src.worker.services.drain import in_flight
+from src.worker.services.event_handler import handle_event
+from src.worker.services.pubsub_decoder import decode_push_body
 
 router = APIRouter(
     prefix="/worker",
@@ -32,70 +19,31 @@ router = APIRouter(
 
 
 @router.get("/health", status_code=status.HTTP_200_OK)
-async def healthcheck():
+async def healthcheck(response: Response):
+    if in_flight.draining:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "draining"}
     return {"status": "ok"}
 
 
 @router.post("/pubsub/push")
-async def pubsub_push(body: PubSubPushBody, session: AsyncSession = Depends(get_session)):
+async def pubsub_push(request: Request, session: AsyncSession = Depends(get_session)):
+    if in_flight.draining:
+        # Shutting down: refuse fast so Pub/Sub redelivers to another instance.
+        metrics.record_drain_rejected()
+        return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
     logger.info("Received PubSub Push message", extra={})
     try:
-        event = decode_pubsub_message(body)
-        resolver = WorkflowResolver(session)
-        workflow = await resolver.resolve(event)
-        logger.info(
-            "Worker handling event",
-            extra={
-                "trace_id": event.trace_id,
-                "event_id": str(event.event_id),
-                "workflow_id": str(workflow.id)
-            }
-        )
-        executor = Executor(session, ExecutionLogRepository(session))
-        context = ExecutionContext(
-            event=event,
-            workflow=workflow,
-            trace_id=event.trace_id or str(uuid4())
-        )
-        action = LogAction()
-        result = await executor.execute(action, context)
-        if result.queued_to_dlq:
-            logger.warning(
-                "Message moved to DLQ",
-                extra={
-                    "trace_id": event.trace_id,
-                    "event_id": str(event.event_id),
-                    "workflow_id": str(workflow.id),
-                },
-            )
-            return Response(status_code=status.HTTP_200_OK)
-
-        if result.retryable:
-            raise WorkerRetryError("Action failed with retryable error")
-    except (WorkflowNotFound, WorkflowInactive):
-        logger.error("Workflow resolution error", exc_info=True)
-        return Response(status_code=status.HTTP_200_OK)
+        event = decode_push_body(await request.body())
     except (ValidationError, ValueError):
         logger.error("Payload validation error", exc_info=True)
         return Response(status_code=status.HTTP_200_OK)
-    except OperationalError:
-        logger.error("Database error", exc_info=True)
-        return Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    except WorkerRetryError:
-        logger.error("Retryable error", exc_info=True)
-        return Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    except WorkerFatalError:
-        logger.error("Fatal error", exc_info=True)
-        return Response(status_code=status.HTTP_200_OK)
     except Exception:
         logger.exception("Unexpected error")
         return Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    logger.info(
-        "Resolved workflow",
-        extra={
-            "workflow_id": str(workflow.id),
-            "event_id": str(event.event_id),
-        },
-    )
-    return Response(status_code=status.HTTP_200_OK)
+    outcome = await handle_event(session, event)
+    if outcome.ack:
+        return Response(status_code=status.HTTP_200_OK)
+    return Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
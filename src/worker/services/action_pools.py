@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.actions.base import PROCESS, THREAD, SyncAction
+from src.core import metrics
+from src.core.config import settings
+from src.models.actions import ActionResult, PortableContext
+
+logger = logging.getLogger(__name__)
+
+
+def _run_sync(action: SyncAction, context: PortableContext) -> ActionResult:
+    return action.run_sync(context)
+
+
+class ActionPools:
+    """Shared thread and process pools for ``SyncAction`` runs, started on first use."""
+
+    def __init__(
+        self,
+        thread_workers: int = 8,
+        process_workers: int | None = None,
+        start_method: str = "spawn",
+    ) -> None:
+        self._workers = {
+            THREAD: thread_workers,
+            PROCESS: process_workers or multiprocessing.cpu_count(),
+        }
+        self._start_method = start_method
+        self._pools: dict[str, Executor] = {}
+        self._pending = {THREAD: 0, PROCESS: 0}
+
+    def _pool(self, mode: str) -> Executor:
+        pool = self._pools.get(mode)
+        if pool is None:
+            if mode == THREAD:
+                pool = ThreadPoolExecutor(self._workers[THREAD], thread_name_prefix="action")
+            elif mode == PROCESS:
+                pool = ProcessPoolExecutor(
+                    self._workers[PROCESS],
+                    mp_context=multiprocessing.get_context(self._start_method),
+                )
+            else:
+                raise ValueError(f"Unknown execution mode: {mode}")
+            self._pools[mode] = pool
+        return pool
+
+    def _set_pending(self, mode: str, delta: int) -> None:
+        pending = self._pending[mode] = self._pending[mode] + delta
+        metrics.record_action_pool_depth(mode, pending, max(pending - self._workers[mode], 0))
+
+    async def run(self, action: SyncAction, context: PortableContext) -> ActionResult:
+        mode = action.execution_mode
+        pool = self._pool(mode)
+        self._set_pending(mode, 1)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, _run_sync, action, context)
+        except BrokenExecutor as e:
+            logger.error("Action pool broken, replacing it", extra={"mode": mode})
+            if self._pools.get(mode) is pool:
+                del self._pools[mode]
+                pool.shutdown(wait=False, cancel_futures=True)
+            return ActionResult(status="failed", error=f"{e.__class__.__name__}: {e}", retryable=True)
+        finally:
+            self._set_pending(mode, -1)
+
+    def shutdown(self, wait: bool = True) -> None:
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+action_pools = ActionPools(
+    thread_workers=settings.ACTION_THREAD_POOL_SIZE,
+    process_workers=settings.ACTION_PROCESS_POOL_SIZE,
+    start_method=settings.ACTION_PROCESS_START_METHOD,
+)
@@ -0,0 +1,93 @@
+import logging
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.infrastructure.messaging.base import EventProducer
+from src.infrastructure.messaging.factory import build_event_producer
+from src.worker.services.execution_log_writer import execution_log_writer
+from src.worker.services.lease_sweeper import LeaseSweeper
+from src.worker.services.partition_maintainer import PartitionMaintainer
+from src.worker.services.retry_scheduler import RetryScheduler
+from src.worker.services.workflow_cache import build_workflow_change_listener
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerBackgroundServices:
+    """Housekeeping tasks that run next to every worker consumer."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        producer: EventProducer | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._producer = producer
+        self._owned_producer: EventProducer | None = None
+        self._services: list = []
+
+    def start(self) -> None:
+        if settings.EXECUTION_LOG_WRITE_BEHIND_ENABLED:
+            if not settings.EXECUTION_LOG_SPOOL_DIR:
+                # Without a spool, updates buffered when the process dies are
+                # lost and their rows stay ``pending``.
+                raise ValueError("EXECUTION_LOG_WRITE_BEHIND_ENABLED requires EXECUTION_LOG_SPOOL_DIR")
+            # First in, last out: flushed after everything that produces rows.
+            self._services.append(execution_log_writer)
+
+        if settings.WORKFLOW_CACHE_ENABLED:
+            self._services.append(build_workflow_change_listener())
+
+        self._services.append(
+            LeaseSweeper(
+                self._session_factory,
+                interval=settings.LEASE_SWEEPER_INTERVAL_SECONDS,
+            )
+        )
+
+        retention_days = settings.EXECUTION_LOG_RETENTION_DAYS
+        self._services.append(
+            PartitionMaintainer(
+                self._session_factory,
+                period=timedelta(days=settings.EXECUTION_LOG_PARTITION_DAYS),
+                ahead=settings.EXECUTION_LOG_PARTITIONS_AHEAD,
+                retention=timedelta(days=retention_days) if retention_days is not None else None,
+                interval=settings.EXECUTION_LOG_PARTITION_CHECK_INTERVAL_SECONDS,
+                key_batch_size=settings.EXECUTION_LOG_KEY_DELETE_BATCH_SIZE,
+            )
+        )
+
+        if settings.DELAYED_RETRIES_ENABLED:
+            # Publish through the API's in-process transport when given one.
+            producer = self._producer
+            if producer is None:
+                producer = self._owned_producer = build_event_producer()
+            self._services.append(
+                RetryScheduler(
+                    self._session_factory,
+                    producer,
+                    batch_size=settings.RETRY_SCHEDULER_BATCH_SIZE,
+                    poll_interval=settings.RETRY_SCHEDULER_POLL_INTERVAL_SECONDS,
+                    lease_seconds=settings.RETRY_SCHEDULER_LEASE_SECONDS,
+                )
+            )
+
+        for service in self._services:
+            service.start()
+
+    async def stop(self) -> None:
+        for service in reversed(self._services):
+            try:
+                await service.stop()
+            except Exception:
+                logger.exception(
+                    "Background service failed to stop",
+                    extra={"service": service.__class__.__name__},
+                )
+        self._services = []
+
+        if self._owned_producer is not None:
+            self._owned_producer.close()
+            self._owned_producer = None
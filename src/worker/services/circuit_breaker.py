@@ -0,0 +1,123 @@
+import logging
+import time
+from collections import deque
+
+from src.core import metrics
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure-rate breaker over the last ``window`` calls, probing again after ``open_seconds``."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+        clock=time.monotonic,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._min_calls = min_calls
+        self._open_seconds = open_seconds
+        self._half_open_probes = half_open_probes
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self._open_seconds:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker will admit probes."""
+        if self.state != OPEN:
+            return 0.0
+        return max(self._opened_at + self._open_seconds - self._clock(), 0.0)
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes_started < self._half_open_probes:
+            self._probes_started += 1
+            return True
+        metrics.record_circuit_rejected(self.name)
+        return False
+
+    def release(self) -> None:
+        """Give back a half-open probe whose call ended without an outcome (e.g. cancelled)."""
+        if self._state == HALF_OPEN and self._probes_started > self._probes_succeeded:
+            self._probes_started -= 1
+
+    def record(self, success: bool) -> None:
+        if self._state == HALF_OPEN:
+            if not success:
+                self._open()
+                return
+            self._probes_succeeded += 1
+            if self._probes_succeeded >= self._half_open_probes:
+                self._outcomes.clear()
+                self._transition(CLOSED)
+            return
+
+        if self._state == OPEN:
+            # A call admitted before the breaker opened; its outcome is stale.
+            return
+
+        self._outcomes.append(success)
+        if len(self._outcomes) >= self._min_calls:
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self._failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._transition(OPEN)
+        logger.warning(
+            "Circuit breaker opened",
+            extra={"breaker": self.name, "open_seconds": self._open_seconds},
+        )
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        metrics.record_circuit_transition(self.name, state)
+
+
+class CircuitBreakerRegistry:
+    """Per-process breakers, created on first use for each key."""
+
+    def __init__(self, **breaker_options) -> None:
+        self._options = breaker_options
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(key, **self._options)
+        return breaker
+
+
+circuit_breakers = CircuitBreakerRegistry(
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    window=settings.CIRCUIT_BREAKER_WINDOW,
+    min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+    open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+    half_open_probes=settings.CIRCUIT_BREAKER_HALF_OPEN_PROBES,
+)
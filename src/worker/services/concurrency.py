@@ -0,0 +1,124 @@
+import asyncio
+from collections import deque
+
+from src.core import metrics
+from src.core.config import settings
+
+
+class WorkflowConcurrencyLimiter:
+    """Caps in-flight executions per workflow and process, handing freed slots out round-robin."""
+
+    def __init__(
+        self,
+        per_workflow_limit: int = 10,
+        global_limit: int = 100,
+        max_waiting: int = 100,
+        max_wait: float = 2.0,
+        overrides: dict[str, int] | None = None,
+    ) -> None:
+        self._per_workflow_limit = per_workflow_limit
+        self._global_limit = global_limit
+        self._max_waiting = max_waiting
+        self._max_wait = max_wait
+        self._overrides = overrides or {}
+        self._in_flight: dict[str, int] = {}
+        self._total = 0
+        self._waiters: dict[str, deque[asyncio.Future]] = {}
+        # One waiting event per workflow per turn, so a noisy workflow cannot starve others.
+        self._ring: deque[str] = deque()
+
+    def limit_for(self, key: str) -> int:
+        return self._overrides.get(key, self._per_workflow_limit)
+
+    def in_flight(self, key: str) -> int:
+        return self._in_flight.get(key, 0)
+
+    def _grant(self, key: str) -> None:
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        self._total += 1
+        metrics.record_workflow_admitted(key)
+
+    def _can_run(self, key: str) -> bool:
+        return self._total < self._global_limit and self.in_flight(key) < self.limit_for(key)
+
+    async def acquire(self, key: str) -> bool:
+        """Take a slot for ``key``; returns False when the event should be deferred."""
+        if self._can_run(key) and not self._waiters.get(key):
+            self._grant(key)
+            return True
+
+        queue = self._waiters.get(key)
+        if self._max_wait <= 0 or (queue is not None and len(queue) >= self._max_waiting):
+            metrics.record_workflow_deferred(key)
+            return False
+
+        if queue is None:
+            queue = self._waiters[key] = deque()
+            self._ring.append(key)
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        metrics.record_workflow_waiting(key, len(queue))
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self._max_wait)
+            return True
+        except asyncio.TimeoutError:
+            if future.done():
+                return True
+            future.cancel()
+            metrics.record_workflow_deferred(key)
+            return False
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(key)
+            future.cancel()
+            raise
+        finally:
+            self._discard_done(key)
+
+    def release(self, key: str) -> None:
+        remaining = self._in_flight.get(key, 0) - 1
+        if remaining > 0:
+            self._in_flight[key] = remaining
+        else:
+            self._in_flight.pop(key, None)
+        self._total -= 1
+        self._dispatch()
+
+    def _discard_done(self, key: str) -> None:
+        queue = self._waiters.get(key)
+        if queue is None:
+            return
+        while queue and queue[0].done():
+            queue.popleft()
+        metrics.record_workflow_waiting(key, len(queue))
+
+    def _dispatch(self) -> None:
+        idle = 0
+        while self._ring and self._total < self._global_limit and idle < len(self._ring):
+            key = self._ring.popleft()
+            queue = self._waiters[key]
+            while queue and queue[0].done():
+                queue.popleft()
+
+            if queue and self.in_flight(key) < self.limit_for(key):
+                queue.popleft().set_result(None)
+                self._grant(key)
+                idle = 0
+            else:
+                idle += 1
+
+            metrics.record_workflow_waiting(key, len(queue))
+            if queue:
+                self._ring.append(key)
+            else:
+                del self._waiters[key]
+
+
+workflow_limiter = WorkflowConcurrencyLimiter(
+    per_workflow_limit=settings.WORKFLOW_MAX_CONCURRENCY,
+    global_limit=settings.WORKER_MAX_CONCURRENCY,
+    max_waiting=settings.WORKFLOW_MAX_WAITING,
+    max_wait=settings.WORKFLOW_MAX_WAIT_SECONDS,
+    overrides=settings.WORKFLOW_CONCURRENCY_OVERRIDES,
+)
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import signal
+import threading
+import time
+from collections.abc import Callable
+
+from src.core import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class InFlightTracker:
+    """Counts events being handled so a drain can stop new deliveries and wait for the rest."""
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._draining = False
+        self._drain_started: float | None = None
+        self._idle_waiters: list[asyncio.Future] = []
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    def start_drain(self) -> None:
+        if not self._draining:
+            logger.info("Draining worker", extra={"in_flight": self._count})
+            self._drain_started = time.monotonic()
+        self._draining = True
+
+    def drain_remaining(self, timeout: float) -> float:
+        """Seconds left of a ``timeout``-long drain counted from ``start_drain``."""
+        if self._drain_started is None:
+            return timeout
+        return max(timeout - (time.monotonic() - self._drain_started), 0.0)
+
+    def __enter__(self) -> "InFlightTracker":
+        self._count += 1
+        metrics.record_in_flight(self._count)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._count -= 1
+        metrics.record_in_flight(self._count)
+        if self._count == 0:
+            waiters, self._idle_waiters = self._idle_waiters, []
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """Wait until nothing is in flight; False if ``timeout`` ran out first."""
+        if self._count == 0:
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._idle_waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning("Drain deadline reached", extra={"in_flight": self._count})
+            return False
+
+
+in_flight = InFlightTracker()
+
+
+def install_sigterm_drain(tracker: InFlightTracker, timeout: float) -> Callable[[], None]:
+    """Drain ``tracker`` on SIGTERM, then re-raise it; returns a function restoring the old handler."""
+    # Signal handlers can only be set from the main thread.
+    if threading.current_thread() is not threading.main_thread():
+        return lambda: None
+
+    loop = asyncio.get_running_loop()
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def restore() -> None:
+        signal.signal(signal.SIGTERM, previous)
+
+    async def drain() -> None:
+        tracker.start_drain()
+        await tracker.wait_idle(timeout)
+        restore()
+        signal.raise_signal(signal.SIGTERM)
+
+    def on_sigterm(signum, frame) -> None:
+        # A second SIGTERM skips the wait.
+        if tracker.draining:
+            restore()
+            signal.raise_signal(signal.SIGTERM)
+            return
+        loop.call_soon_threadsafe(lambda: asyncio.ensure_future(drain()))
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+    return restore
@@ -0,0 +1,186 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import OperationalError
+
+from src.core import metrics
+from src.core.config import settings
+from src.core.exceptions import (
+    WorkflowNotFound,
+    WorkflowInactive,
+    WorkerRetryError,
+    WorkerFatalError
+)
+from src.events.schema import EventEnvelope
+from src.models.actions import ExecutionContext
+from src.repositories.execution_log import ExecutionLogRepository
+from src.repositories.scheduled_retry import ScheduledRetryRepository
+from src.worker.services.concurrency import workflow_limiter
+from src.worker.services.drain import in_flight
+from src.worker.services.execution_log_writer import execution_log_writer
+from src.worker.services.executor import Executor
+from src.worker.services.workflow_cache import workflow_cache
+from src.worker.services.workflow_engine import WorkflowEngine
+from src.worker.services.workflow_resolver import WorkflowResolver
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EventOutcome:
+    """Transport-neutral verdict for a delivered event; a nack is redelivered after ``retry_after``."""
+    ack: bool
+    retry_after: float | None = None
+
+
+ACK = EventOutcome(ack=True)
+NACK = EventOutcome(ack=False)
+
+
+async def handle_event(session: AsyncSession, event: EventEnvelope) -> EventOutcome:
+    """Resolve and execute one decoded event; shared by every transport (see docs/pubsub/ACK_NACK_RULES.md)."""
+    with in_flight:
+        created_at = event.timestamp
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        metrics.record_delivery_lag((datetime.now(timezone.utc) - created_at).total_seconds())
+
+        if not settings.WORKFLOW_CONCURRENCY_LIMITS_ENABLED:
+            return await _execute_event(session, event)
+
+        # Taken before the resolver touches the session, so a waiting event
+        # does not hold a database connection.
+        workflow_key = str(event.payload.get("workflow_id") or "")
+        if not await workflow_limiter.acquire(workflow_key):
+            logger.info(
+                "Workflow concurrency limit reached, deferring event",
+                extra={
+                    "trace_id": event.trace_id,
+                    "event_id": str(event.event_id),
+                    "workflow_id": workflow_key,
+                    "retry_after": settings.WORKFLOW_DEFER_SECONDS,
+                },
+            )
+            return EventOutcome(ack=False, retry_after=settings.WORKFLOW_DEFER_SECONDS)
+        try:
+            return await _execute_event(session, event)
+        finally:
+            workflow_limiter.release(workflow_key)
+
+
+async def _execute_event(session: AsyncSession, event: EventEnvelope) -> EventOutcome:
+    try:
+        resolver = WorkflowResolver(
+            session,
+            cache=workflow_cache if settings.WORKFLOW_CACHE_ENABLED else None,
+        )
+        workflow = await resolver.resolve(event)
+        logger.info(
+            "Worker handling event",
+            extra={
+                "trace_id": event.trace_id,
+                "event_id": str(event.event_id),
+                "workflow_id": str(workflow.id)
+            }
+        )
+        log_repo = ExecutionLogRepository(
+            session,
+            write_behind=execution_log_writer if execution_log_writer.running else None,
+        )
+        executor = Executor(session, log_repo, commit_claim=True)
+        context = ExecutionContext(
+            event=event,
+            workflow=workflow,
+            trace_id=event.trace_id or str(uuid4())
+        )
+        result = await WorkflowEngine(session, executor).run(context)
+        if result.status == "skipped" and result.retryable:
+            # Another delivery holds the execution lease; come back when it ends.
+            await session.commit()
+            logger.info(
+                "Deferring event",
+                extra={
+                    "trace_id": event.trace_id,
+                    "event_id": str(event.event_id),
+                    "workflow_id": str(workflow.id),
+                    "retry_after": result.retry_after,
+                },
+            )
+            return EventOutcome(ack=False, retry_after=result.retry_after)
+
+        if result.retryable and settings.DELAYED_RETRIES_ENABLED:
+            await ScheduledRetryRepository(session).schedule(
+                event,
+                workflow.id,
+                attempts=result.attempts or 0,
+                delay=result.retry_after or 0.0,
+                error=result.error,
+            )
+            await session.commit()
+            metrics.record_retry_scheduled()
+            logger.warning(
+                "Retry scheduled",
+                extra={
+                    "trace_id": event.trace_id,
+                    "event_id": str(event.event_id),
+                    "workflow_id": str(workflow.id),
+                    "retry_after": result.retry_after,
+                },
+            )
+            return ACK
+
+        await session.commit()
+        if result.queued_to_dlq:
+            logger.warning(
+                "Message moved to DLQ",
+                extra={
+                    "trace_id": event.trace_id,
+                    "event_id": str(event.event_id),
+                    "workflow_id": str(workflow.id),
+                },
+            )
+            return ACK
+
+        if result.retryable:
+            logger.error(
+                "Retryable error",
+                extra={
+                    "trace_id": event.trace_id,
+                    "event_id": str(event.event_id),
+                    "workflow_id": str(workflow.id),
+                    "error": result.error,
+                    "retry_after": result.retry_after,
+                },
+            )
+            return EventOutcome(ack=False, retry_after=result.retry_after)
+    except (WorkflowNotFound, WorkflowInactive):
+        logger.error("Workflow resolution error", exc_info=True)
+        return ACK
+    except (ValidationError, ValueError):
+        logger.error("Payload validation error", exc_info=True)
+        return ACK
+    except OperationalError:
+        logger.error("Database error", exc_info=True)
+        return NACK
+    except WorkerRetryError:
+        logger.error("Retryable error", exc_info=True)
+        return NACK
+    except WorkerFatalError:
+        logger.error("Fatal error", exc_info=True)
+        return ACK
+    except Exception:
+        logger.exception("Unexpected error")
+        return NACK
+
+    logger.info(
+        "Resolved workflow",
+        extra={
+            "workflow_id": str(workflow.id),
+            "event_id": str(event.event_id),
+        },
+    )
+    return ACK
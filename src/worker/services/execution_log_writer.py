@@ -0,0 +1,223 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import socket
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.core.config import settings
+from src.db.session import async_session_factory
+from src.repositories.execution_log import ExecutionLogRepository
+
+logger = logging.getLogger(__name__)
+
+SPOOL_SUFFIX = ".spool"
+FLUSHING_SUFFIX = ".flushing"
+
+
+class ExecutionLogWriter:
+    """Write-behind buffer for the final ``execution_logs`` update, optionally spooled to disk."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval: float = 0.05,
+        max_rows: int = 500,
+        spool_dir: str | None = None,
+        max_attempts: int = 5,
+        max_retry_delay: float = 5.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._flush_interval = flush_interval
+        self._max_rows = max_rows
+        self._max_attempts = max_attempts
+        self._max_retry_delay = max_retry_delay
+        self._failed_flushes = 0
+        self._spool_dir = Path(spool_dir) if spool_dir else None
+        self._spool_path: Path | None = None
+        self._spool = None
+        self._buffer: list[dict] = []
+        self._wake = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def add(
+        self,
+        log_id: UUID,
+        lease_owner: str,
+        values: dict,
+        created_at: datetime | None = None,
+    ) -> None:
+        row = {
+            "id": str(log_id),
+            "lease_owner": lease_owner,
+            "created_at": created_at.isoformat() if created_at else None,
+            "values": values,
+        }
+        self._append_to_spool([row])
+        self._buffer.append(row)
+        metrics.record_execution_log_buffered(len(self._buffer))
+        if len(self._buffer) >= self._max_rows:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        if not self._buffer:
+            return 0
+        rows, self._buffer = self._buffer, []
+        rotated = self._rotate_spool()
+        failed = []
+        try:
+            await self._write(rows)
+        except Exception:
+            logger.exception("Execution log flush failed", extra={"rows": len(rows)})
+            failed = await self._write_each(rows) if len(rows) > 1 else rows
+        self._failed_flushes = self._failed_flushes + 1 if failed else 0
+
+        retry = self._requeue(failed)
+        self._buffer = retry + self._buffer
+        self._append_to_spool(retry)
+        if rotated is not None:
+            rotated.unlink(missing_ok=True)
+        flushed = len(rows) - len(failed)
+        metrics.record_execution_log_buffered(len(self._buffer))
+        metrics.record_execution_log_flushed(flushed)
+        return flushed
+
+    async def _write_each(self, rows: list[dict]) -> list[dict]:
+        failed = []
+        for row in rows:
+            try:
+                await self._write([row])
+            except Exception:
+                failed.append(row)
+        return failed
+
+    def _requeue(self, rows: list[dict]) -> list[dict]:
+        retry, dropped = [], []
+        for row in rows:
+            row["failures"] = row.get("failures", 0) + 1
+            (dropped if row["failures"] >= self._max_attempts else retry).append(row)
+        if dropped:
+            logger.error(
+                "Dropping execution log updates after repeated flush failures",
+                extra={"log_ids": [str(row["id"]) for row in dropped], "attempts": self._max_attempts},
+            )
+            metrics.record_execution_log_dropped(len(dropped))
+        return retry
+
+    async def _write(self, rows: list[dict]) -> None:
+        parsed = [
+            {
+                **row,
+                "id": UUID(str(row["id"])),
+                "created_at": datetime.fromisoformat(str(row["created_at"])) if row.get("created_at") else None,
+            }
+            for row in rows
+        ]
+        async with self._session_factory() as session:
+            await ExecutionLogRepository(session).finish_many(parsed)
+            await session.commit()
+
+    async def replay_spools(self) -> int:
+        if self._spool_dir is None:
+            return 0
+        replayed = 0
+        for path in sorted(self._spool_dir.iterdir()):
+            if path == self._spool_path or path.suffix not in (SPOOL_SUFFIX, FLUSHING_SUFFIX):
+                continue
+            with path.open("r+") as spool:
+                try:
+                    fcntl.flock(spool, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue  # owned by a live process
+                rows = []
+                for line in spool:
+                    try:
+                        rows.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # torn final write
+                if rows:
+                    await self._write(rows)
+                path.unlink()
+            replayed += len(rows)
+        if replayed:
+            logger.warning("Replayed spooled execution log updates", extra={"rows": replayed})
+        return replayed
+
+    def _open_spool(self) -> None:
+        self._spool = self._spool_path.open("a")
+        fcntl.flock(self._spool, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _append_to_spool(self, rows: list[dict]) -> None:
+        if self._spool is None:
+            return
+        for row in rows:
+            self._spool.write(json.dumps(row, default=str) + "\n")
+        # Flushed to the OS but not fsynced: survives a process crash, not a host crash.
+        self._spool.flush()
+
+    def _rotate_spool(self) -> Path | None:
+        if self._spool is None:
+            return None
+        rotated = self._spool_path.with_suffix(FLUSHING_SUFFIX)
+        self._spool_path.rename(rotated)
+        self._spool.close()
+        self._open_spool()
+        return rotated
+
+    async def run(self) -> None:
+        try:
+            await self.replay_spools()
+        except Exception:
+            logger.exception("Execution log spool replay failed")
+
+        while not self._stopping.is_set():
+            delay = self._flush_interval
+            if self._failed_flushes:
+                delay = max(min(delay * 2 ** min(self._failed_flushes, 16), self._max_retry_delay), delay)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._spool_dir is not None:
+            self._spool_dir.mkdir(parents=True, exist_ok=True)
+            self._spool_path = self._spool_dir / f"{socket.gethostname()}-{os.getpid()}{SPOOL_SUFFIX}"
+            self._open_spool()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+            if not self._buffer:
+                self._spool_path.unlink(missing_ok=True)
+
+
+execution_log_writer = ExecutionLogWriter(
+    async_session_factory,
+    flush_interval=settings.EXECUTION_LOG_FLUSH_INTERVAL_MS / 1000,
+    max_rows=settings.EXECUTION_LOG_FLUSH_MAX_ROWS,
+    spool_dir=settings.EXECUTION_LOG_SPOOL_DIR,
+    max_attempts=settings.EXECUTION_LOG_FLUSH_MAX_ATTEMPTS,
+)
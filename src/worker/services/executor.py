@@ -1,26 +1,96 @@
+import os
 import time
+import socket
 import asyncio
 import logging
-
-from src.db.models import ExecutionLog
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.actions.base import BaseAction, ExecutionContext, ActionResult
-from src.repositories.execution_log import ExecutionLogRepository
+from src.actions.base import ASYNC, BaseAction, ExecutionContext, ActionResult
+from src.repositories.execution_log import ExecutionClaim, ExecutionLogRepository
 from src.core import metrics as worker_metrics
+from src.core.config import settings
+from src.worker.services.action_pools import action_pools
+from src.worker.services.circuit_breaker import CircuitBreakerRegistry, circuit_breakers
+
+# Identifies this process in ``execution_logs.lease_owner``.
+LEASE_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def run_action(
+    action: BaseAction,
+    context: ExecutionContext,
+    timeout: float,
+    breakers: CircuitBreakerRegistry | None = None,
+) -> ActionResult:
+    """Run one action, mapping timeouts, exceptions and open breakers to failed results."""
+    key = action.breaker_key(context) if breakers is not None else None
+    breaker = breakers.get(key) if key is not None else None
+    if breaker is not None and not breaker.allow():
+        return ActionResult(
+            status="failed",
+            error=f"Circuit open: {key}",
+            retryable=True,
+            retry_after=breaker.retry_after(),
+        )
 
-MAX_ATTEMPTS = 3
+    try:
+        if action.execution_mode == ASYNC:
+            call = action.run(context)
+        else:
+            call = action_pools.run(action, context.portable())
+        result = await asyncio.wait_for(call, timeout=timeout)
+    except asyncio.CancelledError:
+        # No outcome to record, but a half-open probe must not stay taken.
+        if breaker is not None:
+            breaker.release()
+        raise
+    except asyncio.TimeoutError:
+        result = ActionResult(
+            status="failed",
+            error="Action timed out",
+            retryable=True,
+        )
+    except Exception as e:
+        result = ActionResult(
+            status="failed",
+            error=str(e),
+            retryable=False,
+        )
+
+    # Only retryable failures (timeouts, unavailable downstreams) trip the breaker.
+    if breaker is not None:
+        breaker.record(not (result.status == "failed" and result.retryable))
+    return result
 
 
 class Executor:
-    def __init__(self, session: AsyncSession, log_repo: ExecutionLogRepository):
+    def __init__(
+        self,
+        session: AsyncSession,
+        log_repo: ExecutionLogRepository,
+        breakers: CircuitBreakerRegistry | None = None,
+        commit_claim: bool = False,
+    ):
         self.session = session
         self.log_repo = log_repo
+        self.breakers = breakers or (circuit_breakers if settings.CIRCUIT_BREAKER_ENABLED else None)
+        self.commit_claim = commit_claim
 
-    async def _persist_log(self, log: ExecutionLog, result: ActionResult) -> None:
+    async def _claim(self, payload: dict, lease_seconds: float) -> ExecutionClaim:
+        claim = await self.log_repo.claim(payload, lease_owner=LEASE_OWNER, lease_seconds=lease_seconds)
+        if self.commit_claim:
+            # Committed before the action runs, so concurrent deliveries see the
+            # lease instead of blocking on the row, and a crash leaves it to
+            # expire. It stays on the session's own connection, which is
+            # returned to the pool while the action runs.
+            await self.session.commit()
+        return claim
+
+    async def _persist_log(self, log: ExecutionClaim, result: ActionResult) -> None:
         payload = {
             "status": result.status,
             "result": result.result,
@@ -31,32 +101,21 @@ class Executor:
             "last_error": result.error,
             "action_duration_ms": (result.duration * 1000) if result.duration is not None else None,
         }
-        await self.log_repo.mark_finished(log, payload)
+        await self.log_repo.finish(
+            log.id, payload, lease_owner=log.lease_owner, created_at=log.created_at
+        )
 
     async def _run_action(self, action: BaseAction, context: ExecutionContext, timeout: float):
-        try:
-            return await asyncio.wait_for(action.run(context), timeout=timeout)
-        except asyncio.TimeoutError:
-            return ActionResult(
-                status="failed",
-                error="Action timed out",
-                retryable=True,
-            )
-        except Exception as e:
-            return ActionResult(
-                status="failed",
-                error=str(e),
-                retryable=False,
-            )
+        return await run_action(action, context, timeout, self.breakers)
 
     async def check_attempts(
         self,
-        log_entry: ExecutionLog,
+        log_entry: ExecutionClaim,
         context: ExecutionContext,
         action: BaseAction,
     ) -> ActionResult | None:
-        await self.log_repo.increment_attempts(log_entry)
-        if log_entry.attempts > MAX_ATTEMPTS:
+        # ``attempts`` was already incremented by the claim.
+        if log_entry.attempts > action.retry_policy.max_attempts:
             logger.warning(
                 "Max attempts exceeded; flagging for DLQ",
                 extra={
@@ -79,11 +138,12 @@ class Executor:
 
     def _update_retryable_and_queued_to_dlq(
             self, result: ActionResult,
-            log_entry: ExecutionLog,
+            log_entry: ExecutionClaim,
             context: ExecutionContext,
             action: BaseAction
     ) -> ActionResult:
-        if result.retryable and log_entry.attempts >= MAX_ATTEMPTS:
+        result.attempts = log_entry.attempts
+        if result.retryable and log_entry.attempts >= action.retry_policy.max_attempts:
             result.retryable = False
             result.queued_to_dlq = True
             logger.warning(
@@ -98,6 +158,11 @@ class Executor:
             )
         else:
             result.queued_to_dlq = False
+            if result.retryable:
+                result.retry_after = max(
+                    result.retry_after or 0.0,
+                    action.retry_policy.delay(log_entry.attempts),
+                )
         return result
 
     async def execute(self, action: BaseAction, context: ExecutionContext, timeout: float = 10.0) -> ActionResult:
@@ -110,9 +175,30 @@ class Executor:
             "action": action.__class__.__name__,
             "status": "pending",
             "retryable": False,
+            # Kept for DLQ re-drive, which re-publishes the original envelope.
+            "payload_snapshot": context.event.model_dump(mode="json"),
         }
-        log_entry, is_new = await self.log_repo.create_pending(payload)
-        if not is_new:
+        # The lease outlives the action timeout so a healthy worker always
+        # finishes first; after a crash the row is reclaimable once it lapses.
+        log_entry = await self._claim(payload, timeout + settings.EXECUTION_LEASE_GRACE_SECONDS)
+        if log_entry.conflict:
+            logger.warning(
+                "Execution claim conflict; retrying delivery",
+                extra={
+                    "trace_id": context.trace_id,
+                    "workflow_id": str(context.workflow.id),
+                    "event_id": str(context.event.event_id),
+                    "action": action.__class__.__name__,
+                    "retry_after": settings.EXECUTION_CLAIM_CONFLICT_RETRY_SECONDS,
+                },
+            )
+            return ActionResult(
+                status="skipped",
+                retryable=True,
+                retry_after=settings.EXECUTION_CLAIM_CONFLICT_RETRY_SECONDS,
+            )
+
+        if not log_entry.claimed:
             if log_entry.queued_to_dlq or log_entry.status in {"success", "skipped"}:
                 logger.info(
                     "Duplicate event detected",
@@ -127,19 +213,38 @@ class Executor:
                 )
                 return ActionResult(status="skipped")
 
-            if log_entry.status == "pending":
-                logger.info(
-                    "Execution in progress; skipping duplicate delivery",
-                    extra={
-                        "trace_id": context.trace_id,
-                        "workflow_id": str(context.workflow.id),
-                        "event_id": str(context.event.event_id),
-                        "action": action.__class__.__name__,
-                        "status": log_entry.status,
-                        "queued_to_dlq": log_entry.queued_to_dlq,
-                    },
+            retry_after = None
+            if log_entry.lease_expires_at is not None:
+                retry_after = max(
+                    (log_entry.lease_expires_at - datetime.now(timezone.utc)).total_seconds(),
+                    0.0,
                 )
-                return ActionResult(status="skipped")
+            logger.info(
+                "Execution in progress; deferring duplicate delivery",
+                extra={
+                    "trace_id": context.trace_id,
+                    "workflow_id": str(context.workflow.id),
+                    "event_id": str(context.event.event_id),
+                    "action": action.__class__.__name__,
+                    "status": log_entry.status,
+                    "lease_owner": log_entry.lease_owner,
+                    "retry_after": retry_after,
+                },
+            )
+            return ActionResult(status="skipped", retryable=True, retry_after=retry_after)
+
+        if log_entry.reclaimed:
+            worker_metrics.record_lease_reclaim()
+            logger.warning(
+                "Reclaimed execution after lease expiry",
+                extra={
+                    "trace_id": context.trace_id,
+                    "workflow_id": str(context.workflow.id),
+                    "event_id": str(context.event.event_id),
+                    "action": action.__class__.__name__,
+                    "attempts": log_entry.attempts,
+                },
+            )
 
         worker_metrics.record_attempt(context.workflow.id)
 
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.repositories.execution_log import ExecutionLogRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseSweeper:
+    """Periodically reports expired leases; rows are reclaimed by the next redelivery, not here."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval: float = 60.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._interval = interval
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def sweep_once(self) -> int:
+        async with self._session_factory() as session:
+            count, oldest = await ExecutionLogRepository(session).expired_leases()
+
+        oldest_seconds = 0.0
+        if oldest is not None:
+            oldest_seconds = max((datetime.now(timezone.utc) - oldest).total_seconds(), 0.0)
+        metrics.record_expired_leases(count, oldest_seconds)
+        if count:
+            logger.warning(
+                "Pending executions with expired leases",
+                extra={"count": count, "oldest_expired_seconds": oldest_seconds},
+            )
+        return count
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.sweep_once()
+            except Exception:
+                logger.exception("Lease sweep failed")
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
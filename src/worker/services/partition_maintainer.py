@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from datetime import datetime, time, timedelta, timezone
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.repositories.execution_log_partitions import ExecutionLogPartitionRepository, Partition, partition_name
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionMaintainer:
+    """Keeps ``execution_logs`` range partitions created ahead and drops expired ones."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        period: timedelta = timedelta(days=1),
+        ahead: int = 7,
+        retention: timedelta | None = None,
+        interval: float = 3600.0,
+        key_batch_size: int = 5000,
+    ) -> None:
+        self._session_factory = session_factory
+        self._period = period
+        self._ahead = ahead
+        self._retention = retention
+        self._interval = interval
+        self._key_batch_size = key_batch_size
+        # Keys created before this were checked by an earlier pass.
+        self._keys_checked_before: datetime | None = None
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def maintain_once(self, now: datetime | None = None) -> tuple[int, int]:
+        """Create and drop partitions once; returns how many of each."""
+        now = now or datetime.now(timezone.utc)
+        created: list[str] = []
+        dropped: list[Partition] = []
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                repo = ExecutionLogPartitionRepository(session)
+                if not await repo.try_lock():
+                    return 0, 0
+                partitions = await repo.list()
+                ranged = [p for p in partitions if not p.is_default]
+                default = next((p.name for p in partitions if p.is_default), None)
+
+                uppers = [p.upper for p in ranged if p.upper is not None]
+                start = max(uppers) if uppers else datetime.combine(now.date(), time(), timezone.utc)
+                while start < now + self._ahead * self._period:
+                    end = start + self._period
+                    try:
+                        async with session.begin_nested():
+                            if default is not None and await repo.has_rows(default, start, end):
+                                moved = await repo.move_default_rows(start, end, default)
+                                logger.warning(
+                                    "Moved execution logs out of the default partition",
+                                    extra={"start": start.isoformat(), "end": end.isoformat(), "rows": moved},
+                                )
+                            else:
+                                await repo.create(start, end)
+                            created.append(partition_name(start))
+                    except DBAPIError:
+                        logger.exception(
+                            "Could not create execution log partition",
+                            extra={"start": start.isoformat(), "end": end.isoformat()},
+                        )
+                    else:
+                        uppers.append(end)
+                    start = end
+
+                if self._retention is not None:
+                    cutoff = now - self._retention
+                    for partition in ranged:
+                        if partition.upper is not None and partition.upper <= cutoff:
+                            await repo.drop(partition.name)
+                            dropped.append(partition)
+
+                # Keys below the oldest bounded partition may have lost their
+                # rows; a MINVALUE partition's live rows keep theirs.
+                lowers = [p.lower for p in await repo.list() if p.lower is not None]
+                oldest = min(lowers) if lowers else None
+
+        if dropped:
+            self._keys_checked_before = None
+        # Also catches keys left behind by a pass that crashed after dropping.
+        if oldest is not None:
+            await self._delete_orphaned_keys(oldest)
+
+        if created or dropped:
+            logger.info(
+                "Execution log partitions maintained",
+                extra={"partitions_created": created, "partitions_dropped": [p.name for p in dropped]},
+            )
+        ahead_seconds = (max(uppers) - now).total_seconds() if uppers else 0.0
+        metrics.record_execution_log_partitions(ahead_seconds, len(created), len(dropped))
+        return len(created), len(dropped)
+
+    async def _delete_orphaned_keys(self, before: datetime) -> None:
+        after = self._keys_checked_before
+        if after is not None and after >= before:
+            return
+        while True:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    deleted = await ExecutionLogPartitionRepository(session).delete_orphaned_keys(
+                        before, self._key_batch_size, after=after
+                    )
+            if deleted < self._key_batch_size:
+                self._keys_checked_before = before
+                return
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.maintain_once()
+            except Exception:
+                logger.exception("Execution log partition maintenance failed")
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
@@ -1,7 +1,10 @@
 import base64
-import json
+import binascii
 import logging
 
+import orjson
+from pydantic import ValidationError
+
 from src.worker.models.pubsub_push import PubSubPushBody
 from src.events.schema import EventEnvelope
 
@@ -12,15 +15,41 @@ def decode_pubsub_message(push_body: PubSubPushBody) -> EventEnvelope:
     if not push_body.message.data:
         raise ValueError("Empty Pub/Sub message data")
 
+    return decode_event_data(_b64decode(push_body.message.data))
+
+
+def decode_push_body(body: bytes) -> EventEnvelope:
+    """Decode a Pub/Sub push request from its raw body, reading only ``message.data``."""
+    try:
+        data = orjson.loads(body)["message"].get("data")
+    except (orjson.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+        logger.warning("Failed to decode Pub/Sub push body", exc_info=e)
+        raise ValueError("Malformed Pub/Sub push body")
+
+    if not data:
+        raise ValueError("Empty Pub/Sub message data")
+
+    return decode_event_data(_b64decode(data))
+
+
+def _b64decode(data: str) -> bytes:
     try:
-        raw_bytes = base64.b64decode(push_body.message.data)
-        payload = json.loads(raw_bytes.decode("utf-8"))
-    except Exception as e:
+        return base64.b64decode(data)
+    except (binascii.Error, TypeError, ValueError) as e:
         logger.warning("Failed to decode Pub/Sub payload", exc_info=e)
         raise ValueError("Malformed Pub/Sub payload")
 
+
+def decode_event_data(data: bytes) -> EventEnvelope:
+    """Decode raw message bytes in one pydantic validation pass, as delivered by a pull subscriber."""
+    if not data:
+        raise ValueError("Empty Pub/Sub message data")
+
     try:
-        return EventEnvelope.model_validate(payload)
-    except Exception as e:
+        return EventEnvelope.model_validate_json(data)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            logger.warning("Failed to decode Pub/Sub payload", exc_info=e)
+            raise ValueError("Malformed Pub/Sub payload")
         logger.warning("Invalid Envelope", exc_info=e)
         raise ValueError("Invalid Envelope")
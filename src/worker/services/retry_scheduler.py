@@ -0,0 +1,99 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import metrics
+from src.events.schema import EventEnvelope
+from src.infrastructure.messaging.base import EventProducer
+from src.repositories.scheduled_retry import ScheduledRetryRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RetryScheduler:
+    """Re-publishes due ``scheduled_retries`` rows, keeping their ``event_id``, to the event transport."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        producer: EventProducer,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        failure_delay: float = 5.0,
+        lease_seconds: float = 30.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._producer = producer
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._failure_delay = failure_delay
+        self._lease_seconds = lease_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def reinject_once(self) -> int:
+        # Rows are leased in a short transaction, so no lock is held while
+        # publishing and a crashed scheduler's rows come back after the lease.
+        async with self._session_factory() as session:
+            async with session.begin():
+                rows = await ScheduledRetryRepository(session).claim_due(
+                    self._batch_size, self._lease_seconds
+                )
+        if not rows:
+            return 0
+
+        events = [EventEnvelope.model_validate(row.envelope) for row in rows]
+        results = await self._producer.publish_batch_async(events)
+
+        published = []
+        failed = []
+        for row, result in zip(rows, results):
+            if isinstance(result, BaseException):
+                failed.append(row)
+            else:
+                published.append(row)
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                repo = ScheduledRetryRepository(session)
+                await repo.delete(published)
+                await repo.postpone(failed, self._failure_delay)
+
+        metrics.record_retries_reinjected(len(published), len(failed))
+        if failed:
+            logger.warning(
+                "Retry scheduler failed to publish events",
+                extra={"published": len(published), "failed": len(failed)},
+            )
+        return len(rows)
+
+    async def report_backlog(self) -> None:
+        async with self._session_factory() as session:
+            size, _ = await ScheduledRetryRepository(session).stats()
+        metrics.record_retry_backlog(size)
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            claimed = 0
+            try:
+                claimed = await self.reinject_once()
+                await self.report_backlog()
+            except Exception:
+                logger.exception("Retry scheduler iteration failed")
+
+            if claimed < self._batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+import asyncpg
+
+from src.core import metrics
+from src.core.config import settings
+from src.db.models import Workflow
+from src.repositories.workflow import WORKFLOW_CHANGED_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WorkflowSnapshot:
+    id: UUID
+    name: str
+    status: str
+    is_active: bool
+
+    @classmethod
+    def from_workflow(cls, workflow: Workflow) -> "WorkflowSnapshot":
+        return cls(
+            id=workflow.id,
+            name=workflow.name,
+            status=workflow.status,
+            is_active=workflow.is_active,
+        )
+
+    def to_workflow(self) -> Workflow:
+        # Transient instance: never attached to a session, safe to share.
+        return Workflow(
+            id=self.id,
+            name=self.name,
+            status=self.status,
+            is_active=self.is_active,
+        )
+
+
+class WorkflowCache:
+    """Per-process LRU of workflow snapshots; the TTL bounds staleness when a NOTIFY is missed."""
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 30.0) -> None:
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[UUID, tuple[float, WorkflowSnapshot]] = OrderedDict()
+
+    def get(self, workflow_id: UUID) -> WorkflowSnapshot | None:
+        entry = self._entries.get(workflow_id)
+        if entry is None:
+            metrics.record_workflow_cache_miss()
+            return None
+
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            del self._entries[workflow_id]
+            metrics.record_workflow_cache_miss()
+            return None
+
+        self._entries.move_to_end(workflow_id)
+        metrics.record_workflow_cache_hit()
+        return snapshot
+
+    def put(self, snapshot: WorkflowSnapshot) -> None:
+        self._entries[snapshot.id] = (time.monotonic() + self._ttl, snapshot)
+        self._entries.move_to_end(snapshot.id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, workflow_id: UUID) -> None:
+        if self._entries.pop(workflow_id, None) is not None:
+            metrics.record_workflow_cache_invalidation()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+workflow_cache = WorkflowCache(
+    max_size=settings.WORKFLOW_CACHE_MAX_SIZE,
+    ttl_seconds=settings.WORKFLOW_CACHE_TTL_SECONDS,
+)
+
+
+class WorkflowChangeListener:
+    """LISTENs on ``workflow_changed`` over a dedicated asyncpg connection and evicts notified ids."""
+
+    def __init__(self, cache: WorkflowCache, dsn: str, reconnect_delay: float = 5.0) -> None:
+        self._cache = cache
+        self._dsn = dsn
+        self._reconnect_delay = reconnect_delay
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            self._cache.invalidate(UUID(payload))
+        except ValueError:
+            logger.warning("Ignoring malformed workflow notification", extra={"payload": payload})
+
+    async def _listen_once(self) -> None:
+        connection = await asyncpg.connect(self._dsn)
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        try:
+            await connection.add_listener(WORKFLOW_CHANGED_CHANNEL, self._on_notify)
+            # Notifications sent while disconnected are lost.
+            self._cache.clear()
+            logger.info("Listening for workflow changes")
+
+            stop = asyncio.create_task(self._stopping.wait())
+            lost = asyncio.create_task(closed.wait())
+            await asyncio.wait({stop, lost}, return_when=asyncio.FIRST_COMPLETED)
+            stop.cancel()
+            lost.cancel()
+        finally:
+            if not connection.is_closed():
+                await connection.close()
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self._listen_once()
+            except Exception:
+                logger.exception("Workflow change listener failed; reconnecting")
+                self._cache.clear()
+
+            if not self._stopping.is_set():
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._reconnect_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+
+def build_workflow_change_listener() -> WorkflowChangeListener:
+    url = settings.DB_DIRECT_URL
+    if url is None:
+        if settings.DB_PGBOUNCER_MODE:
+            # Transaction pooling drops LISTEN registrations, so the cache
+            # would never be invalidated.
+            raise ValueError("WORKFLOW_CACHE_ENABLED with DB_PGBOUNCER_MODE requires DB_DIRECT_URL")
+        url = settings.DATABASE_URL
+    dsn = url.replace("postgresql+asyncpg://", "postgresql://", 1)
+    return WorkflowChangeListener(workflow_cache, dsn)
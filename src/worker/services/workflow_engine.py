@@ -0,0 +1,281 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.actions.base import BaseAction, ExecutionContext, ActionResult, RetryPolicy
+from src.actions.registry import ActionRegistry, action_registry
+from src.core.config import settings
+from src.db.models import Task
+from src.repositories.execution_log import ExecutionLogRepository
+from src.repositories.task import TaskRepository
+from src.worker.services.circuit_breaker import CircuitBreakerRegistry
+from src.worker.services.executor import Executor, run_action
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class WorkflowStep:
+    task_id: UUID
+    name: str
+    type: str
+    config: dict
+    depends_on: tuple[str, ...]
+    completed: bool = False
+
+    @classmethod
+    def from_task(cls, task: Task, status: str | None = None) -> "WorkflowStep":
+        payload = task.payload or {}
+        return cls(
+            task_id=task.id,
+            name=payload.get("name") or str(task.id),
+            type=payload.get("type", ""),
+            config=payload.get("config") or {},
+            depends_on=tuple(payload.get("depends_on") or ()),
+            completed=status == "success",
+        )
+
+
+@dataclass
+class StepOutcome:
+    step: WorkflowStep
+    action: str
+    result: ActionResult
+    retry_policy: RetryPolicy | None = None
+
+
+def _most_patient(policies: list[RetryPolicy]) -> RetryPolicy:
+    if not policies:
+        return RetryPolicy()
+    return RetryPolicy(
+        max_attempts=max(p.max_attempts for p in policies),
+        base_delay=max(p.base_delay for p in policies),
+        multiplier=max(p.multiplier for p in policies),
+        max_delay=max(p.max_delay for p in policies),
+    )
+
+
+class WorkflowPlan:
+    """Tasks of a workflow ordered so that every step follows its dependencies."""
+
+    def __init__(self, steps: list[WorkflowStep]) -> None:
+        self.steps = steps
+
+    @classmethod
+    def build(cls, steps: list[WorkflowStep]) -> "WorkflowPlan":
+        by_name: dict[str, WorkflowStep] = {}
+        for step in steps:
+            if step.name in by_name:
+                raise ValueError(f"Duplicate task name: {step.name}")
+            by_name[step.name] = step
+
+        for step in steps:
+            missing = [name for name in step.depends_on if name not in by_name]
+            if missing:
+                raise ValueError(f"Task {step.name} depends on unknown tasks: {', '.join(missing)}")
+
+        ordered: list[WorkflowStep] = []
+        state: dict[str, str] = {}
+
+        def visit(step: WorkflowStep) -> None:
+            if state.get(step.name) == "done":
+                return
+            if state.get(step.name) == "visiting":
+                raise ValueError(f"Dependency cycle through task {step.name}")
+            state[step.name] = "visiting"
+            for name in step.depends_on:
+                visit(by_name[name])
+            state[step.name] = "done"
+            ordered.append(step)
+
+        for step in steps:
+            visit(step)
+        return cls(ordered)
+
+
+class DagAction(BaseAction):
+    """Runs workflow steps concurrently as soon as their dependencies have succeeded."""
+
+    def __init__(
+        self,
+        steps: list[WorkflowStep],
+        concurrency: int = 10,
+        step_timeout: float = 10.0,
+        registry: ActionRegistry | None = None,
+        breakers: CircuitBreakerRegistry | None = None,
+    ) -> None:
+        self._steps = steps
+        self._concurrency = concurrency
+        self._step_timeout = step_timeout
+        self._registry = registry or action_registry
+        self._breakers = breakers
+        self.outcomes: list[StepOutcome] = []
+
+    async def _run_step(
+        self,
+        step: WorkflowStep,
+        context: ExecutionContext,
+        upstream: list[asyncio.Task],
+        semaphore: asyncio.Semaphore,
+    ) -> bool:
+        if step.completed:
+            return True
+
+        if upstream and not all(await asyncio.gather(*upstream)):
+            self.outcomes.append(
+                StepOutcome(
+                    step=step,
+                    action=step.type,
+                    result=ActionResult(status="blocked", error="Upstream task did not succeed"),
+                )
+            )
+            return False
+
+        try:
+            action = self._registry.get(step.type)
+        except Exception as e:
+            logger.error(
+                "Cannot load action",
+                exc_info=True,
+                extra={"task_type": step.type, "task": step.name},
+            )
+            result = ActionResult(status="failed", error=str(e), retryable=False)
+            self.outcomes.append(StepOutcome(step=step, action=step.type, result=result))
+            return False
+
+        step_context = context.model_copy(update={"config": step.config})
+        timeout = float(step.config.get("timeout_seconds", self._step_timeout))
+        async with semaphore:
+            start = time.perf_counter()
+            result = await run_action(action, step_context, timeout, self._breakers)
+            result.duration = time.perf_counter() - start
+
+        self.outcomes.append(
+            StepOutcome(
+                step=step,
+                action=action.__class__.__name__,
+                result=result,
+                retry_policy=action.retry_policy,
+            )
+        )
+        return result.status == "success"
+
+    def breaker_key(self, context: ExecutionContext) -> str | None:
+        # Steps report to their own breakers; the composite has none.
+        return None
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        # The run is retried as a whole, so it follows the most patient policy
+        # of the steps that failed, or before it runs, of the steps left to run.
+        failed = [
+            o.retry_policy
+            for o in self.outcomes
+            if o.result.status == "failed" and o.retry_policy is not None
+        ]
+        if failed:
+            return _most_patient(failed)
+
+        pending = []
+        for step in self._steps:
+            if step.completed:
+                continue
+            try:
+                pending.append(self._registry.get(step.type).retry_policy)
+            except Exception:
+                continue
+        return _most_patient(pending)
+
+    async def run(self, context: ExecutionContext) -> ActionResult:
+        try:
+            plan = WorkflowPlan.build(self._steps)
+        except ValueError as e:
+            return ActionResult(status="failed", error=str(e), retryable=False)
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+        tasks: dict[str, asyncio.Task] = {}
+        for step in plan.steps:
+            upstream = [tasks[name] for name in step.depends_on]
+            tasks[step.name] = asyncio.create_task(
+                self._run_step(step, context, upstream, semaphore)
+            )
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        statuses = {outcome.step.name: outcome.result.status for outcome in self.outcomes}
+        failed = [o for o in self.outcomes if o.result.status == "failed"]
+        if not failed:
+            return ActionResult(status="success", result={"steps": statuses})
+
+        return ActionResult(
+            status="failed",
+            result={"steps": statuses},
+            error="; ".join(f"{o.step.name}: {o.result.error}" for o in failed),
+            retryable=all(o.result.retryable for o in failed),
+            retry_after=max((o.result.retry_after or 0.0 for o in failed), default=None) or None,
+        )
+
+
+class WorkflowEngine:
+    """Executes a workflow for one event, as a single ``log`` action or a ``DagAction`` of its tasks."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        executor: Executor,
+        concurrency: int | None = None,
+        step_timeout: float | None = None,
+        timeout: float | None = None,
+        registry: ActionRegistry | None = None,
+    ) -> None:
+        self._tasks = TaskRepository(session)
+        self._logs = ExecutionLogRepository(session)
+        self._executor = executor
+        self._concurrency = concurrency or settings.WORKFLOW_MAX_PARALLEL_STEPS
+        self._step_timeout = step_timeout or settings.WORKFLOW_STEP_TIMEOUT_SECONDS
+        self._timeout = timeout or settings.WORKFLOW_TIMEOUT_SECONDS
+        self._registry = registry or action_registry
+
+    async def run(self, context: ExecutionContext) -> ActionResult:
+        rows = await self._tasks.list_for_event(context.workflow.id, context.event.event_id)
+        if not rows:
+            return await self._executor.execute(
+                self._registry.get("log"), context, timeout=self._step_timeout
+            )
+
+        dag = DagAction(
+            [WorkflowStep.from_task(task, status) for task, status in rows],
+            concurrency=self._concurrency,
+            step_timeout=self._step_timeout,
+            registry=self._registry,
+            breakers=self._executor.breakers,
+        )
+        result = await self._executor.execute(dag, context, timeout=self._timeout)
+        await self._logs.record_steps(
+            [self._step_row(outcome, context) for outcome in dag.outcomes]
+        )
+        return result
+
+    @staticmethod
+    def _step_row(outcome: StepOutcome, context: ExecutionContext) -> dict:
+        result = outcome.result
+        return {
+            "workflow_id": context.workflow.id,
+            "event_id": context.event.event_id,
+            "task_id": outcome.step.task_id,
+            "trace_id": context.trace_id,
+            "action": outcome.action[:100],
+            "status": result.status,
+            "result": result.result,
+            "error": result.error,
+            "retryable": result.retryable,
+            "duration": result.duration,
+            "action_duration_ms": (result.duration * 1000) if result.duration is not None else None,
+            "last_error": result.error,
+        }
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.events.schema import EventEnvelope
@@ -7,23 +9,35 @@ from src.core.exceptions import (
     WorkflowNotFound,
     WorkflowInactive,
 )
+from src.worker.services.workflow_cache import WorkflowCache, WorkflowSnapshot
 
 
 class WorkflowResolver:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: WorkflowCache | None = None):
         self._repo = WorkflowRepository(session)
+        self._cache = cache
 
     async def resolve(self, event: EventEnvelope) -> Workflow:
         workflow_id = event.payload.get("workflow_id")
         if not workflow_id:
             raise WorkflowNotFound("workflow_id missing in event payload")
 
+        if self._cache is not None:
+            snapshot = self._cache.get(UUID(str(workflow_id)))
+            if snapshot is not None:
+                if not snapshot.is_active:
+                    raise WorkflowInactive(f"Workflow {workflow_id} is inactive")
+                return snapshot.to_workflow()
+
         workflow = await self._repo.get_by_id(workflow_id)
 
         if not workflow:
             raise WorkflowNotFound(f"Workflow {workflow_id} not found")
 
+        if self._cache is not None:
+            self._cache.put(WorkflowSnapshot.from_workflow(workflow))
+
         if not workflow.is_active:
             raise WorkflowInactive(f"Workflow {workflow_id} is inactive")
 
-        return workflow
\ No newline at end of file
+        return workflow
@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.actions.http_call import HttpCallAction
+from src.core.http_client import HostLimiter
+from tests.conftest import make_context
+
+
+def make_action(handler, limit=20):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return HttpCallAction(client=client, limiter=HostLimiter(limit))
+
+
+@pytest.mark.asyncio
+async def test_http_call_posts_event_by_default():
+    seen = {}
+
+    def handler(request):
+        seen["method"] = request.method
+        seen["body"] = request.content
+        return httpx.Response(200, text="ok")
+
+    context = make_context(config={"url": "http://hooks.test/endpoint"})
+    result = await make_action(handler).run(context)
+
+    assert result.status == "success"
+    assert result.result == {"status_code": 200, "body": "ok", "truncated": False}
+    assert seen["method"] == "POST"
+    assert str(context.event.event_id).encode() in seen["body"]
+
+
+@pytest.mark.asyncio
+async def test_http_call_truncates_large_bodies():
+    def handler(request):
+        return httpx.Response(200, content=b"x" * 10_000)
+
+    context = make_context(config={"url": "http://hooks.test/", "max_response_bytes": 100})
+    result = await make_action(handler).run(context)
+
+    assert result.result["truncated"] is True
+    assert len(result.result["body"]) == 100
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code, retryable", [(503, True), (429, True), (400, False)])
+async def test_http_call_classifies_error_statuses(status_code, retryable):
+    def handler(request):
+        return httpx.Response(status_code)
+
+    result = await make_action(handler).run(make_context(config={"url": "http://hooks.test/"}))
+
+    assert result.status == "failed"
+    assert result.retryable is retryable
+
+
+@pytest.mark.asyncio
+async def test_http_call_transport_errors_are_retryable():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    result = await make_action(handler).run(make_context(config={"url": "http://hooks.test/"}))
+
+    assert result.status == "failed"
+    assert result.retryable is True
+
+
+@pytest.mark.asyncio
+async def test_http_call_limits_concurrency_per_host():
+    active = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(204)
+
+    action = make_action(handler, limit=2)
+    context = make_context(config={"url": "http://hooks.test/"})
+    results = await asyncio.gather(*(action.run(context) for _ in range(6)))
+
+    assert all(result.status == "success" for result in results)
+    assert peak == 2
+
+
+def test_http_call_breaker_is_keyed_by_host():
+    action = HttpCallAction(client=None, limiter=HostLimiter(1))
+
+    assert action.breaker_key(make_context(config={"url": "https://a.example/x"})) == "HttpCallAction:a.example"
+    assert action.breaker_key(make_context(config={"url": "https://b.example/y"})) == "HttpCallAction:b.example"
@@ -0,0 +1,53 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.actions import registry as registry_module
+from src.actions.log import LogAction
+from src.actions.registry import ActionRegistry
+from src.core.exceptions import UnknownActionType
+
+
+def test_registry_imports_lazily_and_caches_instances():
+    sys.modules.pop("src.actions.delay", None)
+    registry = ActionRegistry(group=None)
+
+    assert "src.actions.delay" not in sys.modules
+
+    first = registry.get("delay")
+    second = registry.get("delay")
+
+    assert "src.actions.delay" in sys.modules
+    assert first is second
+    assert first.__class__.__name__ == "DelayAction"
+
+
+def test_registry_unknown_type():
+    registry = ActionRegistry(group=None)
+
+    with pytest.raises(UnknownActionType):
+        registry.get("email")
+
+
+def test_registry_loads_entry_points(monkeypatch):
+    def fake_entry_points(group):
+        assert group == "workflows.actions"
+        return [
+            SimpleNamespace(name="custom_log", value="src.actions.log:LogAction"),
+            SimpleNamespace(name="log", value="somewhere.else:Other"),
+        ]
+
+    monkeypatch.setattr(registry_module, "entry_points", fake_entry_points)
+    registry = ActionRegistry()
+
+    assert isinstance(registry.get("custom_log"), LogAction)
+    # Built-ins are not overridden by plugins.
+    assert isinstance(registry.get("log"), LogAction)
+
+
+def test_registry_rejects_non_actions():
+    registry = ActionRegistry(builtins={"bad": "src.actions.registry:ActionRegistry"}, group=None)
+
+    with pytest.raises(TypeError):
+        registry.get("bad")
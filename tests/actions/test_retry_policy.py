@@ -0,0 +1,16 @@
+from src.actions.base import MAX_ATTEMPTS, BaseAction, RetryPolicy
+from src.actions.http_call import HttpCallAction
+from src.actions.log import LogAction
+
+
+def test_retry_policy_backoff_is_bounded():
+    policy = RetryPolicy(base_delay=1.0, multiplier=2.0, max_delay=10.0)
+
+    for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (10, 10.0)]:
+        delays = [policy.delay(attempt) for _ in range(200)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+
+
+def test_retry_policy_is_per_action():
+    assert LogAction.retry_policy.max_attempts == MAX_ATTEMPTS
+    assert HttpCallAction.retry_policy.max_attempts > BaseAction.retry_policy.max_attempts
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from src.api.dependencies.execution_logs import get_execution_log_read_repo
+from src.core.config import settings
+from src.main import create_app
+from src.repositories.execution_log import ExecutionLogRepository, encode_cursor
+
+
+def test_list_rejects_invalid_cursor():
+    app = create_app()
+    # The cursor is decoded before any query runs.
+    app.dependency_overrides[get_execution_log_read_repo] = lambda: ExecutionLogRepository(None)
+
+    client = TestClient(app)
+    response = client.get(
+        "/execution-logs",
+        params={"cursor": "not-a-cursor", "status": "failed"},
+        headers={"X-API-Key": settings.API_KEY},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_list_rejects_cursor_with_offset():
+    app = create_app()
+    app.dependency_overrides[get_execution_log_read_repo] = lambda: ExecutionLogRepository(None)
+
+    client = TestClient(app)
+    response = client.get(
+        "/execution-logs",
+        params={"cursor": encode_cursor(datetime.now(timezone.utc), uuid4()), "offset": 50},
+        headers={"X-API-Key": settings.API_KEY},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "cursor and offset cannot be combined"
@@ -1,5 +1,5 @@
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 from src.main import create_app
@@ -9,6 +9,7 @@ def test_webhook_triggers_publish():
     app = create_app()
 
     mock_producer = MagicMock()
+    mock_producer.publish_async = AsyncMock(return_value="message-id-123")
     app.state.event_producer = mock_producer
 
     client = TestClient(app)
@@ -21,4 +22,75 @@ def test_webhook_triggers_publish():
     )
 
     assert response.status_code == 202
-    mock_producer.publish.assert_called_once()
+    mock_producer.publish_async.assert_awaited_once()
+    mock_producer.publish.assert_not_called()
+
+
+def test_webhook_batch_reports_per_item_results():
+    app = create_app()
+
+    mock_producer = MagicMock()
+    mock_producer.publish_batch_async = AsyncMock(
+        return_value=["message-id-1", RuntimeError("boom")]
+    )
+    app.state.event_producer = mock_producer
+
+    client = TestClient(app)
+
+    items = [{"workflow_id": str(uuid4())}, {"workflow_id": str(uuid4())}]
+    response = client.post("/triggers/webhook/batch", json={"items": items})
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["status"] == "partial"
+    assert body["accepted"] == 1
+    assert body["failed"] == 1
+    assert [item["status"] for item in body["items"]] == ["accepted", "failed"]
+    assert body["items"][1]["error"] == "boom"
+
+    envelopes = mock_producer.publish_batch_async.await_args.args[0]
+    assert len(envelopes) == 2
+    assert str(envelopes[0].payload["workflow_id"]) == items[0]["workflow_id"]
+
+
+def test_webhook_batch_unavailable_when_all_fail():
+    app = create_app()
+
+    mock_producer = MagicMock()
+    mock_producer.publish_batch_async = AsyncMock(return_value=[RuntimeError("down")])
+    app.state.event_producer = mock_producer
+
+    client = TestClient(app)
+
+    response = client.post(
+        "/triggers/webhook/batch",
+        json={"items": [{"workflow_id": str(uuid4())}]},
+    )
+
+    assert response.status_code == 503
+
+
+def test_webhook_writes_to_outbox_when_enabled(monkeypatch):
+    monkeypatch.setattr("src.api.dependencies.triggers.settings.EVENT_OUTBOX_ENABLED", True)
+    add = AsyncMock()
+    monkeypatch.setattr(
+        "src.repositories.event_outbox.EventOutboxRepository.add",
+        add,
+    )
+
+    app = create_app()
+    mock_producer = MagicMock()
+    mock_producer.publish_async = AsyncMock()
+    app.state.event_producer = mock_producer
+
+    client = TestClient(app)
+
+    workflow_id = str(uuid4())
+    response = client.post(
+        f"/triggers/webhook/{workflow_id}",
+        json={"workflow_id": workflow_id},
+    )
+
+    assert response.status_code == 202
+    add.assert_awaited_once()
+    mock_producer.publish_async.assert_not_awaited()
@@ -6,8 +6,10 @@ import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 
+from src.db.models import Workflow
 from src.db.session import get_session
 from src.events.schema import EventEnvelope
+from src.models.actions import ExecutionContext
 from src.worker.main import create_app
 
 pytest_plugins = [
@@ -59,14 +61,43 @@ async def async_session():
     await engine.dispose()
 
 
-@pytest.fixture
-def envelope():
+@pytest_asyncio.fixture
+async def session_factory():
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+    from src.core.config import settings
+
+    engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    yield async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    await engine.dispose()
+
+
+def make_envelope(workflow_id=None, trace_id: str = "test") -> EventEnvelope:
     return EventEnvelope(
         event_id=uuid4(),
         event_type="workflow.triggered",
         version=1,
         timestamp=datetime.now(timezone.utc),
         source="api",
-        payload={"workflow_id": uuid4()},
-        trace_id="test",
-    ).model_dump(mode="json")
+        payload={"workflow_id": str(workflow_id or uuid4())},
+        trace_id=trace_id,
+    )
+
+
+def make_context(workflow=None, config: dict | None = None, trace_id: str = "test") -> ExecutionContext:
+    workflow = workflow or Workflow(id=uuid4(), name="wf", status="published", is_active=True)
+    return ExecutionContext(
+        event=make_envelope(workflow.id, trace_id),
+        workflow=workflow,
+        trace_id=trace_id,
+        config=config or {},
+    )
+
+
+@pytest.fixture
+def envelope():
+    return make_envelope().model_dump(mode="json")
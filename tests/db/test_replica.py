@@ -0,0 +1,82 @@
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from src.db import session as db_session
+from src.db.replica import ReplicaLagMonitor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_monitor_measures_lag_at_most_once_per_interval(session_factory):
+    clock = FakeClock()
+    calls = []
+
+    def counting_factory():
+        calls.append(1)
+        return session_factory()
+
+    monitor = ReplicaLagMonitor(counting_factory, max_lag=5, check_interval=10, clock=clock)
+
+    # Run against the primary, which reports no replay lag.
+    assert await monitor.is_fresh()
+    assert await monitor.is_fresh()
+    assert len(calls) == 1
+
+    clock.now += 10
+    assert await monitor.is_fresh()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_counts_as_stale():
+    def broken_factory():
+        raise ConnectionError("replica down")
+
+    monitor = ReplicaLagMonitor(broken_factory, max_lag=5)
+
+    assert not await monitor.is_fresh()
+    assert monitor.lag == math.inf
+
+
+@pytest.mark.asyncio
+async def test_replica_without_wal_receiver_counts_as_stale():
+    class DisconnectedReplica:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def execute(self, statement):
+            return SimpleNamespace(scalar=lambda: None)
+
+    monitor = ReplicaLagMonitor(DisconnectedReplica, max_lag=5)
+
+    assert not await monitor.is_fresh()
+    assert monitor.lag == math.inf
+
+
+@pytest.mark.asyncio
+async def test_read_session_falls_back_to_primary_when_stale(monkeypatch, session_factory):
+    class StaleMonitor:
+        async def is_fresh(self):
+            return False
+
+    replica_factory = pytest.fail  # must not be used
+    monkeypatch.setattr(db_session, "replica_monitor", StaleMonitor())
+    monkeypatch.setattr(db_session, "read_session_factory", replica_factory)
+    monkeypatch.setattr(db_session, "async_session_factory", session_factory)
+
+    sessions = db_session.get_read_session()
+    session = await sessions.__anext__()
+    assert session.bind is session_factory.kw["bind"]
+    await sessions.aclose()
@@ -0,0 +1,45 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.core.config import settings
+from src.db import session as db_session
+
+
+def sample(name, engine):
+    return REGISTRY.get_sample_value(name, {"engine": engine}) or 0.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pgbouncer_mode", [False, True])
+async def test_engine_runs_queries_and_reports_pool_state(monkeypatch, pgbouncer_mode):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", pgbouncer_mode)
+    name = f"test-{pgbouncer_mode}"
+    engine = db_session.build_engine(settings.DATABASE_URL, name=name)
+    try:
+        async with engine.connect() as connection:
+            for _ in range(2):
+                assert (await connection.execute(text("SELECT 1"))).scalar() == 1
+            assert sample("db_pool_checked_out", name) == 1
+        assert sample("db_pool_checked_out", name) == 0
+        assert sample("db_pool_size", name) == settings.DB_POOL_SIZE
+        assert sample("db_pool_wait_seconds_count", name) >= 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_timeout_is_counted(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 0.05)
+    engine = db_session.build_engine(settings.DATABASE_URL, name="test-timeout")
+    try:
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+        assert sample("db_pool_timeouts_total", "test-timeout") == 1
+    finally:
+        await engine.dispose()
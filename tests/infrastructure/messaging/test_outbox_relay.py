@@ -0,0 +1,88 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from src.db.models import EventOutbox
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from src.repositories.event_outbox import EventOutboxRepository
+from tests.conftest import make_envelope
+
+
+async def outbox_rows(session_factory, event_ids):
+    async with session_factory() as session:
+        result = await session.execute(
+            select(EventOutbox).where(EventOutbox.event_id.in_(event_ids))
+        )
+        return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_claim_batch_leases_rows(session_factory):
+    events = [make_envelope(), make_envelope()]
+    async with session_factory() as session, session.begin():
+        await EventOutboxRepository(session).add_many(events)
+
+    async with session_factory() as first, first.begin():
+        claimed = await EventOutboxRepository(first).claim_batch(1000, lease_seconds=30)
+    claimed_ids = {row.event_id for row in claimed}
+    assert {e.event_id for e in events} <= claimed_ids
+
+    async with session_factory() as second, second.begin():
+        again = await EventOutboxRepository(second).claim_batch(1000, lease_seconds=30)
+        assert not claimed_ids & {row.event_id for row in again}
+        await EventOutboxRepository(second).delete([row.id for row in claimed])
+
+
+@pytest.mark.asyncio
+async def test_relay_deletes_published_and_keeps_failed(session_factory):
+    ok, failed = make_envelope(), make_envelope()
+    async with session_factory() as session, session.begin():
+        await EventOutboxRepository(session).add_many([ok, failed])
+
+    async def publish_batch(events):
+        return [
+            RuntimeError("boom") if event.event_id == failed.event_id else "message-id"
+            for event in events
+        ]
+
+    producer = MagicMock()
+    producer.publish_batch_async = AsyncMock(side_effect=publish_batch)
+    relay = OutboxRelay(session_factory, producer, batch_size=1000)
+
+    await relay.drain_once()
+
+    rows = await outbox_rows(session_factory, [ok.event_id, failed.event_id])
+    assert [row.event_id for row in rows] == [failed.event_id]
+    assert rows[0].attempts == 1
+    assert rows[0].last_error == "boom"
+    assert rows[0].dead_lettered_at is None
+
+    # The failed row backs off instead of blocking the next pass.
+    assert await relay.drain_once() == 0
+    assert producer.publish_batch_async.await_count == 1
+
+    async with session_factory() as session, session.begin():
+        await EventOutboxRepository(session).delete([rows[0].id])
+
+
+@pytest.mark.asyncio
+async def test_relay_dead_letters_after_max_attempts(session_factory):
+    failed = make_envelope()
+    async with session_factory() as session, session.begin():
+        await EventOutboxRepository(session).add_many([failed])
+
+    producer = MagicMock()
+    producer.publish_batch_async = AsyncMock(side_effect=lambda events: [RuntimeError("boom")] * len(events))
+    relay = OutboxRelay(session_factory, producer, batch_size=1000, max_attempts=1)
+
+    await relay.drain_once()
+
+    [row] = await outbox_rows(session_factory, [failed.event_id])
+    assert row.dead_lettered_at is not None
+    async with session_factory() as session:
+        count, _ = await EventOutboxRepository(session).stats()
+    assert count == 0
+
+    async with session_factory() as session, session.begin():
+        await EventOutboxRepository(session).delete([row.id])
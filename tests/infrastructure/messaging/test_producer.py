@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import Future
 from unittest.mock import MagicMock
 from uuid import uuid4
 from datetime import datetime, timezone
@@ -69,3 +71,105 @@ def test_pubsub_producer_publish_error(mocker):
 
     with pytest.raises(GoogleAPIError):
         producer.publish(event)
+
+
+@pytest.mark.asyncio
+async def test_pubsub_producer_publish_async_success(mocker):
+    mock_publisher = MagicMock()
+    future = Future()
+    future.set_result("message-id-456")
+    mock_publisher.publish.return_value = future
+
+    mocker.patch(
+        "src.infrastructure.messaging.producer.pubsub_v1.PublisherClient",
+        return_value=mock_publisher,
+    )
+
+    producer = PubSubProducer(
+        project_id="test-project",
+        topic_name="workflow-events",
+    )
+
+    event = EventEnvelope(
+        event_id=uuid4(),
+        event_type="workflow.triggered",
+        version=1,
+        timestamp=datetime.now(timezone.utc),
+        source="api",
+        trace_id="trace-123",
+        payload={"workflow_id": str(uuid4())},
+    )
+
+    message_id = await producer.publish_async(event)
+
+    assert message_id == "message-id-456"
+    mock_publisher.publish.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_pubsub_producer_publish_async_timeout(mocker):
+    mock_publisher = MagicMock()
+    mock_publisher.publish.return_value = Future()
+
+    mocker.patch(
+        "src.infrastructure.messaging.producer.pubsub_v1.PublisherClient",
+        return_value=mock_publisher,
+    )
+
+    producer = PubSubProducer(
+        project_id="test-project",
+        topic_name="workflow-events",
+    )
+
+    event = EventEnvelope(
+        event_id=uuid4(),
+        event_type="workflow.triggered",
+        version=1,
+        timestamp=datetime.now(timezone.utc),
+        source="api",
+        trace_id="trace-123",
+        payload={"workflow_id": "123"},
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await producer.publish_async(event, timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_pubsub_producer_publish_batch_async_partial_failure(mocker):
+    ok = Future()
+    ok.set_result("message-id-1")
+    failed = Future()
+    failed.set_exception(GoogleAPIError("boom"))
+
+    mock_publisher = MagicMock()
+    mock_publisher.publish.side_effect = [ok, failed]
+
+    mocker.patch(
+        "src.infrastructure.messaging.producer.pubsub_v1.PublisherClient",
+        return_value=mock_publisher,
+    )
+
+    producer = PubSubProducer(
+        project_id="test-project",
+        topic_name="workflow-events",
+    )
+
+    events = [
+        EventEnvelope(
+            event_id=uuid4(),
+            event_type="workflow.triggered",
+            version=1,
+            timestamp=datetime.now(timezone.utc),
+            source="api",
+            trace_id="trace-123",
+            payload={"workflow_id": str(uuid4())},
+        )
+        for _ in range(2)
+    ]
+
+    results = await producer.publish_batch_async(events)
+
+    assert results[0] == "message-id-1"
+    assert isinstance(results[1], GoogleAPIError)
+    assert mock_publisher.publish.call_count == 2
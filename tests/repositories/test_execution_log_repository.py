@@ -1,8 +1,11 @@
+from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import delete
 
+from src.db.models import ExecutionLog
 from src.repositories.execution_log import ExecutionLogRepository
 
 
@@ -31,4 +34,122 @@ async def test_create_pending_duplicate(repo, payload):
 
     dup, is_new_dup = await repo.create_pending(payload)
     assert is_new_dup is False
-    assert dup.id == log.id
\ No newline at end of file
+    assert dup.id == log.id
+
+@pytest.mark.asyncio
+async def test_claim_inserts_then_skips_leased(repo, payload):
+    first = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    assert first.claimed is True
+    assert first.is_new is True
+    assert first.attempts == 1
+
+    dup = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    assert dup.claimed is False
+    assert dup.status == "pending"
+    assert dup.id == first.id
+    assert dup.lease_owner == "test"
+    assert dup.lease_expires_at == first.lease_expires_at
+
+
+@pytest.mark.asyncio
+async def test_claim_increments_attempts_on_failed(repo, payload):
+    first = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    await repo.finish(first.id, {"status": "failed", "retryable": True})
+
+    retry = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    assert retry.claimed is True
+    assert retry.is_new is False
+    assert retry.id == first.id
+    assert retry.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_finished(repo, payload):
+    first = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    await repo.finish(first.id, {"status": "success"})
+
+    dup = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    assert dup.claimed is False
+    assert dup.status == "success"
+
+
+@pytest.mark.asyncio
+async def test_claim_replaces_an_orphaned_key(repo, payload):
+    first = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    # The row is gone but its key is left behind, as after a dropped partition.
+    await repo.session.execute(delete(ExecutionLog).where(ExecutionLog.id == first.id))
+
+    again = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    assert again.claimed is True
+    assert again.is_new is True
+    assert again.id != first.id
+
+
+@pytest.mark.asyncio
+async def test_claim_reclaims_pending_after_lease_expiry(repo, payload):
+    # now() is fixed within the transaction, so a zero-length lease is
+    # already expired for the next statement.
+    first = await repo.claim(payload, lease_owner="crashed", lease_seconds=0)
+
+    count, oldest = await repo.expired_leases()
+    assert count >= 1
+    assert oldest is not None
+
+    retry = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    assert retry.claimed is True
+    assert retry.reclaimed is True
+    assert retry.id == first.id
+    assert retry.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_list_page_walks_rows_sharing_created_at(repo, payload):
+    # Only the id tie-breaker keeps these pages apart.
+    created_at = datetime.now(timezone.utc)
+    ids = set()
+    for _ in range(5):
+        log, _ = await repo.create_pending({**payload, "event_id": uuid4(), "created_at": created_at})
+        ids.add(log.id)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = await repo.list_page(workflow_id=payload["workflow_id"], limit=2, cursor=cursor)
+        seen.extend(log.id for log in page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert set(seen) == ids
+    assert seen == sorted(seen, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_list_rejects_invalid_cursor(repo):
+    with pytest.raises(ValueError):
+        await repo.list(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_record_steps_overwrites_rerun_step(repo, payload):
+    task_id = uuid4()
+    step = {**payload, "task_id": task_id, "status": "failed", "error": "boom"}
+    await repo.record_steps([step])
+    await repo.record_steps([{**step, "status": "success", "error": None}])
+
+    logs = await repo.list(event_id=payload["event_id"])
+    assert len(logs) == 1
+    assert logs[0].task_id == task_id
+    assert logs[0].status == "success"
+    assert logs[0].attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_finish_targets_the_claimed_partition(repo, payload):
+    claim = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    assert claim.created_at is not None
+
+    await repo.finish(claim.id, {"status": "success"}, created_at=claim.created_at)
+
+    log = await repo.get_by_event(payload["event_id"], payload["workflow_id"])
+    assert log.status == "success"
+    assert log.lease_owner is None
@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from src.db.models import ExecutionLog
+from src.events.builder import build_event_envelope
+from src.services.dlq_redrive import DlqFilter, DlqRedrive
+
+
+async def add_dlq_row(session_factory, workflow_id, error):
+    event = build_event_envelope(
+        event_type="workflow.triggered",
+        payload={"workflow_id": str(workflow_id)},
+        trace_id="redrive-trace",
+    )
+    async with session_factory() as session, session.begin():
+        session.add(
+            ExecutionLog(
+                workflow_id=workflow_id,
+                event_id=event.event_id,
+                trace_id="redrive-trace",
+                action="LogAction",
+                status="failed",
+                attempts=3,
+                queued_to_dlq=True,
+                last_error=error,
+                payload_snapshot=event.model_dump(mode="json"),
+            )
+        )
+    return event
+
+
+async def load(session_factory, event_ids):
+    async with session_factory() as session:
+        result = await session.execute(select(ExecutionLog).where(ExecutionLog.event_id.in_(event_ids)))
+        return {log.event_id: log for log in result.scalars().all()}
+
+
+@pytest.mark.asyncio
+async def test_redrive_republishes_matching_rows(session_factory, active_workflow):
+    ok = await add_dlq_row(session_factory, active_workflow.id, "Action timed out")
+    failing = await add_dlq_row(session_factory, active_workflow.id, "Action timed out")
+    other = await add_dlq_row(session_factory, active_workflow.id, "HTTP 400")
+
+    async def publish_batch(events):
+        return [RuntimeError("boom") if e.event_id == failing.event_id else "id" for e in events]
+
+    producer = MagicMock()
+    producer.publish_batch_async = AsyncMock(side_effect=publish_batch)
+    redrive = DlqRedrive(session_factory, producer, batch_size=1, rate=10_000)
+    dlq_filter = DlqFilter(workflow_id=active_workflow.id, error="timed out")
+
+    assert await redrive.count(dlq_filter) == 2
+    progress = await redrive.run(dlq_filter)
+
+    assert (progress.total, progress.published, progress.failed, progress.done) == (2, 1, 1, True)
+    assert producer.publish_batch_async.await_count == 2
+
+    logs = await load(session_factory, [ok.event_id, failing.event_id, other.event_id])
+    assert not logs[ok.event_id].queued_to_dlq
+    assert logs[ok.event_id].attempts == 0
+    assert logs[failing.event_id].queued_to_dlq
+    assert logs[failing.event_id].last_error == "Re-drive publish failed: boom"
+    assert logs[other.event_id].queued_to_dlq
+    assert await redrive.count(DlqFilter(workflow_id=active_workflow.id, error="Re-drive")) == 1
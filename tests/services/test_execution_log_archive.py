@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from src.db.models import ExecutionLog, ExecutionLogKey
+from src.repositories.execution_log import ExecutionLogRepository
+from src.services.execution_log_archive import (
+    ExecutionLogArchive,
+    ExecutionLogArchiver,
+    list_page_with_archive,
+)
+
+NOW = datetime.now(timezone.utc)
+
+
+async def add_logs(session_factory, workflow_id, *ages_in_days):
+    async with session_factory() as session, session.begin():
+        repo = ExecutionLogRepository(session)
+        logs = [
+            await repo.create(
+                {
+                    "workflow_id": workflow_id,
+                    "event_id": uuid4(),
+                    "trace_id": "archive-trace",
+                    "action": "LogAction",
+                    "status": "success",
+                    "result": {"day": age},
+                    "created_at": NOW - timedelta(days=age),
+                }
+            )
+            for age in ages_in_days
+        ]
+    return [log.id for log in logs]
+
+
+@pytest.mark.asyncio
+async def test_archiver_moves_old_rows_to_parquet(session_factory, active_workflow, tmp_path):
+    old_a, old_b, recent = await add_logs(session_factory, active_workflow.id, 40, 41, 1)
+
+    archiver = ExecutionLogArchiver(session_factory, str(tmp_path), batch_size=1, delete_batch_size=1)
+    archived = await archiver.run(timedelta(days=30), workflow_id=active_workflow.id, now=NOW)
+
+    assert archived == 2
+    assert len(list(tmp_path.glob(f"workflow_id={active_workflow.id}/date=*/*.parquet"))) == 2
+    async with session_factory() as session:
+        remaining = (
+            await session.execute(select(ExecutionLog.id).where(ExecutionLog.workflow_id == active_workflow.id))
+        ).scalars().all()
+        keys = (
+            await session.execute(select(ExecutionLogKey.log_id).where(ExecutionLogKey.log_id.in_([old_a, old_b])))
+        ).scalars().all()
+    assert remaining == [recent]
+    assert keys == []
+
+    archive = ExecutionLogArchive(str(tmp_path), archive_after=timedelta(days=30))
+    logs, next_cursor = archive.list_page(workflow_id=active_workflow.id, since=NOW - timedelta(days=60))
+    assert [log["id"] for log in logs] == [str(old_a), str(old_b)]
+    assert logs[0]["result"] == {"day": 40}
+    assert logs[0]["created_at"] == NOW - timedelta(days=40)
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_listing_continues_into_the_archive(session_factory, active_workflow, tmp_path):
+    await add_logs(session_factory, active_workflow.id, 40, 41, 42, 1)
+    await ExecutionLogArchiver(session_factory, str(tmp_path)).run(
+        timedelta(days=30), workflow_id=active_workflow.id, now=NOW
+    )
+    archive = ExecutionLogArchive(str(tmp_path), archive_after=timedelta(days=30))
+    since = NOW - timedelta(days=60)
+
+    pages, cursor = [], None
+    async with session_factory() as session:
+        repo = ExecutionLogRepository(session)
+        while True:
+            logs, cursor = await list_page_with_archive(
+                repo, archive, workflow_id=active_workflow.id, since=since, limit=2, cursor=cursor
+            )
+            pages.append([log["result"] if isinstance(log, dict) else log.result for log in logs])
+            if cursor is None:
+                break
+
+        # Without a ``since`` past the horizon only Postgres is read.
+        recent, _ = await list_page_with_archive(repo, archive, workflow_id=active_workflow.id)
+
+    assert pages == [[{"day": 1}, {"day": 40}], [{"day": 41}, {"day": 42}]]
+    assert len(recent) == 1
+
+
+@pytest.mark.asyncio
+async def test_archive_page_reads_only_the_days_it_needs(session_factory, active_workflow, tmp_path, monkeypatch):
+    await add_logs(session_factory, active_workflow.id, 40, 41, 42)
+    await ExecutionLogArchiver(session_factory, str(tmp_path)).run(
+        timedelta(days=30), workflow_id=active_workflow.id, now=NOW
+    )
+    archive = ExecutionLogArchive(str(tmp_path), archive_after=timedelta(days=30))
+    read = []
+    read_day = ExecutionLogArchive._read_day
+
+    def spy(dataset, expression, day):
+        read.append(day)
+        return read_day(dataset, expression, day)
+
+    monkeypatch.setattr(ExecutionLogArchive, "_read_day", staticmethod(spy))
+
+    logs, next_cursor = archive.list_page(workflow_id=active_workflow.id, limit=1)
+
+    assert [log["result"] for log in logs] == [{"day": 40}]
+    assert next_cursor is not None
+    assert read == sorted(read, reverse=True) and len(read) == 2
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.infrastructure.messaging.in_process import EventQueueFull, InProcessProducer
+from src.worker.consumers.in_process import InProcessConsumer
+from src.worker.services.event_handler import ACK, NACK
+from tests.conftest import make_envelope
+
+
+@pytest.mark.asyncio
+async def test_producer_applies_backpressure_when_full():
+    producer = InProcessProducer(max_size=1, enqueue_timeout=0)
+
+    await producer.publish_async(make_envelope())
+    with pytest.raises(EventQueueFull):
+        await producer.publish_async(make_envelope())
+
+    results = await producer.publish_batch_async([make_envelope()])
+    assert isinstance(results[0], EventQueueFull)
+    assert REGISTRY.get_sample_value("inprocess_queue_depth") == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_redelivers_nacked_events(session_factory, monkeypatch):
+    deliveries = []
+
+    async def fake_handle_event(session, event):
+        deliveries.append(event.event_id)
+        return NACK if len(deliveries) == 1 else ACK
+
+    monkeypatch.setattr(
+        "src.worker.consumers.in_process.handle_event",
+        fake_handle_event,
+    )
+
+    producer = InProcessProducer(max_size=10)
+    consumer = InProcessConsumer(
+        producer.queue,
+        session_factory,
+        concurrency=2,
+        redelivery_delay=0.01,
+    )
+    consumer.start()
+
+    event = make_envelope()
+    await producer.publish_async(event)
+    for _ in range(100):
+        if len(deliveries) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    await consumer.stop()
+    assert deliveries == [event.event_id, event.event_id]
+
+
+@pytest.mark.asyncio
+async def test_consumer_drops_after_max_deliveries(session_factory, monkeypatch):
+    deliveries = []
+
+    async def fake_handle_event(session, event):
+        deliveries.append(event.event_id)
+        return NACK
+
+    monkeypatch.setattr(
+        "src.worker.consumers.in_process.handle_event",
+        fake_handle_event,
+    )
+
+    producer = InProcessProducer(max_size=10)
+    consumer = InProcessConsumer(
+        producer.queue,
+        session_factory,
+        concurrency=1,
+        redelivery_delay=0,
+        max_deliveries=3,
+    )
+    consumer.start()
+
+    await producer.publish_async(make_envelope())
+    await asyncio.sleep(0.1)
+    await consumer.stop()
+
+    assert len(deliveries) == 3
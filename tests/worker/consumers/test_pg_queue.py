@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select, delete, update
+
+from src.db.models import WorkflowEvent
+from src.infrastructure.messaging.pg_queue import PostgresQueueProducer
+from src.repositories.workflow_event import WorkflowEventRepository
+from src.worker.consumers.pg_queue import PostgresQueueConsumer
+from src.worker.services.drain import InFlightTracker
+from src.worker.services.event_handler import ACK, EventOutcome
+from tests.conftest import make_envelope
+
+
+async def queued(session_factory, event_ids):
+    async with session_factory() as session:
+        result = await session.execute(
+            select(WorkflowEvent).where(WorkflowEvent.event_id.in_(event_ids))
+        )
+        return {row.event_id: row for row in result.scalars().all()}
+
+
+async def purge(session_factory, event_ids):
+    async with session_factory() as session, session.begin():
+        await session.execute(
+            delete(WorkflowEvent).where(WorkflowEvent.event_id.in_(event_ids))
+        )
+
+
+@pytest.mark.asyncio
+async def test_claimed_messages_are_invisible_until_timeout(session_factory):
+    event = make_envelope()
+    producer = PostgresQueueProducer(session_factory)
+    message_id = await producer.publish_async(event)
+    assert await producer.publish_async(event) == str(event.event_id)
+
+    async with session_factory() as session, session.begin():
+        claimed = await WorkflowEventRepository(session).claim(1000, visibility_timeout=60)
+    assert [m.event_id for m in claimed].count(event.event_id) == 1
+
+    async with session_factory() as session, session.begin():
+        again = await WorkflowEventRepository(session).claim(1000, visibility_timeout=60)
+    assert event.event_id not in {m.event_id for m in again}
+
+    rows = await queued(session_factory, [event.event_id])
+    assert rows[event.event_id].deliveries == 1
+    assert str(rows[event.event_id].id) == message_id
+
+    await purge(session_factory, [event.event_id])
+
+
+@pytest.mark.asyncio
+async def test_consumer_acks_and_delays_nacks(session_factory, monkeypatch):
+    acked, nacked = make_envelope(), make_envelope()
+    producer = PostgresQueueProducer(session_factory)
+    await producer.publish_batch_async([acked, nacked])
+
+    async def fake_handle_event(session, event):
+        if event.event_id == nacked.event_id:
+            return EventOutcome(ack=False, retry_after=120)
+        return ACK
+
+    monkeypatch.setattr(
+        "src.worker.consumers.pg_queue.handle_event",
+        fake_handle_event,
+    )
+
+    consumer = PostgresQueueConsumer(session_factory, batch_size=1000, visibility_timeout=1)
+    await consumer.consume_once()
+
+    rows = await queued(session_factory, [acked.event_id, nacked.event_id])
+    assert acked.event_id not in rows
+    assert rows[nacked.event_id].deliveries == 1
+    delay = rows[nacked.event_id].visible_at - rows[nacked.event_id].created_at
+    assert delay.total_seconds() > 60
+
+    await purge(session_factory, [nacked.event_id])
+
+
+@pytest.mark.asyncio
+async def test_consumer_stops_claiming_while_draining(session_factory, monkeypatch):
+    tracker = InFlightTracker()
+    tracker.start_drain()
+    monkeypatch.setattr("src.worker.consumers.pg_queue.in_flight", tracker)
+    event = make_envelope()
+    await PostgresQueueProducer(session_factory).publish_async(event)
+
+    consumer = PostgresQueueConsumer(session_factory, poll_interval=0.01)
+    consumer.start()
+    await asyncio.wait_for(asyncio.gather(*consumer._tasks), timeout=1)
+
+    rows = await queued(session_factory, [event.event_id])
+    assert rows[event.event_id].deliveries == 0
+
+    await purge(session_factory, [event.event_id])
+
+
+@pytest.mark.asyncio
+async def test_consumer_dead_letters_after_max_deliveries(session_factory, monkeypatch):
+    retried, exhausted, crashed = make_envelope(), make_envelope(), make_envelope()
+    await PostgresQueueProducer(session_factory).publish_batch_async([retried, exhausted, crashed])
+    async with session_factory() as session, session.begin():
+        # ``crashed`` killed the worker on its last delivery and was claimed once more.
+        for event, deliveries in ((exhausted, 2), (crashed, 3)):
+            await session.execute(
+                update(WorkflowEvent)
+                .where(WorkflowEvent.event_id == event.event_id)
+                .values(deliveries=deliveries)
+            )
+
+    handled = []
+
+    async def fake_handle_event(session, event):
+        handled.append(event.event_id)
+        return EventOutcome(ack=False, retry_after=0)
+
+    monkeypatch.setattr("src.worker.consumers.pg_queue.handle_event", fake_handle_event)
+
+    consumer = PostgresQueueConsumer(session_factory, batch_size=1000, max_deliveries=3)
+    await consumer.consume_once()
+
+    assert crashed.event_id not in handled
+    rows = await queued(session_factory, [retried.event_id, exhausted.event_id, crashed.event_id])
+    assert rows[retried.event_id].dead_lettered_at is None
+    assert rows[exhausted.event_id].dead_lettered_at is not None
+    assert rows[crashed.event_id].dead_lettered_at is not None
+
+    async with session_factory() as session, session.begin():
+        again = await WorkflowEventRepository(session).claim(1000, visibility_timeout=60)
+    assert {m.event_id for m in again} & {exhausted.event_id, crashed.event_id} == set()
+
+    await purge(session_factory, [retried.event_id, exhausted.event_id, crashed.event_id])
+
+
+@pytest.mark.asyncio
+async def test_consumer_settles_the_batch_when_a_handler_raises(session_factory, monkeypatch):
+    acked, failing = make_envelope(), make_envelope()
+    await PostgresQueueProducer(session_factory).publish_batch_async([acked, failing])
+
+    async def fake_handle_event(session, event):
+        if event.event_id == failing.event_id:
+            raise RuntimeError("boom")
+        return ACK
+
+    monkeypatch.setattr("src.worker.consumers.pg_queue.handle_event", fake_handle_event)
+
+    consumer = PostgresQueueConsumer(session_factory, batch_size=1000, visibility_timeout=60)
+    await consumer.consume_once()
+
+    rows = await queued(session_factory, [acked.event_id, failing.event_id])
+    assert acked.event_id not in rows
+    # Left leased: redelivered when the visibility timeout ends.
+    assert (rows[failing.event_id].visible_at - rows[failing.event_id].created_at).total_seconds() > 30
+
+    await purge(session_factory, [failing.event_id])
@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+
+from src.actions.base import SyncAction
+from src.actions.hash import HashAction
+from src.models.actions import ActionResult
+from src.worker.services import executor
+from src.worker.services.action_pools import ActionPools
+from src.worker.services.executor import run_action
+from tests.conftest import make_context
+
+
+class ThreadNameAction(SyncAction):
+    def run_sync(self, context):
+        return ActionResult(status="success", result={"thread": threading.current_thread().name})
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    pools = ActionPools(thread_workers=2, process_workers=1)
+    monkeypatch.setattr(executor, "action_pools", pools)
+    yield pools
+    pools.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_runs_off_the_event_loop(pools):
+    result = await run_action(ThreadNameAction(), make_context(), timeout=5)
+
+    assert result.status == "success"
+    assert result.result["thread"].startswith("action")
+
+
+@pytest.mark.asyncio
+async def test_process_mode_runs_hash_action(pools):
+    context = make_context()
+
+    result = await run_action(HashAction(), context, timeout=30)
+
+    assert result.status == "success"
+    assert result.result["digest"] == HashAction().run_sync(context.portable()).result["digest"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_algorithm_is_not_retryable(pools):
+    result = await run_action(HashAction(), make_context(config={"algorithm": "nope"}), timeout=30)
+
+    assert result.status == "failed"
+    assert not result.retryable
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.actions.base import BaseAction
+from src.db.models import Workflow
+from src.events.schema import EventEnvelope
+from src.models.actions import ActionResult, ExecutionContext
+from src.worker.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
+from src.worker.services.executor import run_action
+from tests.conftest import make_context
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock):
+    return CircuitBreaker(
+        "test",
+        failure_threshold=0.5,
+        window=4,
+        min_calls=4,
+        open_seconds=30,
+        half_open_probes=1,
+        clock=clock,
+    )
+
+
+def test_breaker_opens_on_failure_rate_and_half_opens():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for success in (True, True, False, False):
+        assert breaker.allow()
+        breaker.record(success)
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 30
+
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # only one probe at a time
+
+    breaker.record(True)
+    assert breaker.state == CLOSED
+
+
+def test_breaker_reopens_when_probe_fails():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        breaker.record(False)
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record(False)
+
+    assert breaker.state == OPEN
+    assert breaker.retry_after() == 30
+
+
+def test_breaker_stays_closed_below_min_calls():
+    breaker = make_breaker(FakeClock())
+    for _ in range(3):
+        breaker.record(False)
+
+    assert breaker.state == CLOSED
+
+
+class TimingOutAction(BaseAction):
+    calls = 0
+
+    async def run(self, context):
+        type(self).calls += 1
+        return ActionResult(status="failed", error="Action timed out", retryable=True)
+
+
+@pytest.mark.asyncio
+async def test_run_action_short_circuits_open_breaker():
+    context = ExecutionContext(
+        event=EventEnvelope(
+            event_id=uuid4(),
+            event_type="workflow.triggered",
+            version=1,
+            timestamp=datetime.now(timezone.utc),
+            source="api",
+            payload={},
+            trace_id="breaker-trace",
+        ),
+        workflow=Workflow(id=uuid4(), name="wf", status="published", is_active=True),
+        trace_id="breaker-trace",
+    )
+    breakers = CircuitBreakerRegistry(window=2, min_calls=2, open_seconds=30)
+    action = TimingOutAction()
+
+    for _ in range(2):
+        await run_action(action, context, timeout=1, breakers=breakers)
+    result = await run_action(action, context, timeout=1, breakers=breakers)
+
+    assert TimingOutAction.calls == 2
+    assert result.status == "failed"
+    assert result.retryable is True
+    assert result.error == "Circuit open: TimingOutAction"
+    assert 0 < result.retry_after <= 30
+
+
+class BlockingAction(BaseAction):
+    def breaker_key(self, context):
+        return "blocking"
+
+    async def run(self, context):
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_is_released():
+    context = make_context(trace_id="breaker-trace")
+    clock = FakeClock()
+    breakers = CircuitBreakerRegistry(window=4, min_calls=4, open_seconds=30, clock=clock)
+    breaker = breakers.get("blocking")
+    for _ in range(4):
+        breaker.record(False)
+    clock.now += 30
+
+    probe = asyncio.create_task(run_action(BlockingAction(), context, timeout=60, breakers=breakers))
+    await asyncio.sleep(0)
+    assert not breaker.allow()
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
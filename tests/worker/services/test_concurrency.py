@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.events.schema import EventEnvelope
+from src.worker.services import event_handler
+from src.worker.services.concurrency import WorkflowConcurrencyLimiter
+
+
+@pytest.mark.asyncio
+async def test_limiter_defers_when_workflow_is_full():
+    limiter = WorkflowConcurrencyLimiter(per_workflow_limit=2, max_wait=0)
+
+    assert await limiter.acquire("a")
+    assert await limiter.acquire("a")
+    assert not await limiter.acquire("a")
+    assert await limiter.acquire("b")
+
+    limiter.release("a")
+    assert await limiter.acquire("a")
+
+
+@pytest.mark.asyncio
+async def test_limiter_override_and_wait_timeout():
+    limiter = WorkflowConcurrencyLimiter(per_workflow_limit=5, max_wait=0.05, overrides={"a": 1})
+
+    assert await limiter.acquire("a")
+    assert not await limiter.acquire("a")
+    assert limiter.in_flight("a") == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_hands_freed_slot_to_waiter():
+    limiter = WorkflowConcurrencyLimiter(per_workflow_limit=1, max_wait=1)
+    assert await limiter.acquire("a")
+
+    waiter = asyncio.create_task(limiter.acquire("a"))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release("a")
+    assert await waiter
+    assert limiter.in_flight("a") == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_shares_global_slots_round_robin():
+    limiter = WorkflowConcurrencyLimiter(per_workflow_limit=10, global_limit=1, max_wait=1)
+    assert await limiter.acquire("noisy")
+
+    admitted: list[str] = []
+
+    async def wait(key):
+        assert await limiter.acquire(key)
+        admitted.append(key)
+
+    tasks = [asyncio.create_task(wait("noisy")) for _ in range(3)]
+    tasks.append(asyncio.create_task(wait("quiet")))
+    await asyncio.sleep(0.01)
+
+    for key in ("noisy", "noisy", "quiet", "noisy"):
+        limiter.release(key)
+        await asyncio.sleep(0.01)
+
+    await asyncio.gather(*tasks)
+    assert admitted == ["noisy", "quiet", "noisy", "noisy"]
+
+
+@pytest.mark.asyncio
+async def test_handle_event_defers_over_limit(async_session, active_workflow, monkeypatch):
+    limiter = WorkflowConcurrencyLimiter(per_workflow_limit=1, max_wait=0)
+    monkeypatch.setattr(event_handler, "workflow_limiter", limiter)
+    monkeypatch.setattr(event_handler.settings, "WORKFLOW_CONCURRENCY_LIMITS_ENABLED", True)
+    monkeypatch.setattr(event_handler.settings, "WORKFLOW_DEFER_SECONDS", 3.0)
+    assert await limiter.acquire(str(active_workflow.id))
+
+    event = EventEnvelope(
+        event_id=uuid4(),
+        event_type="workflow.triggered",
+        version=1,
+        timestamp=datetime.now(timezone.utc),
+        source="test",
+        payload={"workflow_id": str(active_workflow.id)},
+        trace_id="trace",
+    )
+    outcome = await event_handler.handle_event(async_session, event)
+
+    assert outcome == event_handler.EventOutcome(ack=False, retry_after=3.0)
+    assert limiter.in_flight(str(active_workflow.id)) == 1
+
+    limiter.release(str(active_workflow.id))
+    outcome = await event_handler.handle_event(async_session, event)
+    assert outcome.ack
+    assert limiter.in_flight(str(active_workflow.id)) == 0
@@ -0,0 +1,67 @@
+import asyncio
+import signal
+
+import pytest
+
+from src.worker.routers import pubsub
+from src.worker.services.drain import InFlightTracker, install_sigterm_drain
+
+
+@pytest.mark.asyncio
+async def test_wait_idle_returns_when_last_event_finishes():
+    tracker = InFlightTracker()
+    assert await tracker.wait_idle(0.01)
+
+    async def work():
+        with tracker:
+            await asyncio.sleep(0.05)
+
+    task = asyncio.create_task(work())
+    await asyncio.sleep(0)
+    assert tracker.count == 1
+    assert not await tracker.wait_idle(0.01)
+    assert await tracker.wait_idle(1)
+    await task
+
+
+def test_drain_remaining_counts_from_start_drain(monkeypatch):
+    tracker = InFlightTracker()
+    assert tracker.drain_remaining(10) == 10
+
+    monkeypatch.setattr("src.worker.services.drain.time.monotonic", lambda: 100.0)
+    tracker.start_drain()
+    monkeypatch.setattr("src.worker.services.drain.time.monotonic", lambda: 107.0)
+    assert tracker.drain_remaining(10) == 3
+    assert tracker.drain_remaining(5) == 0
+
+
+@pytest.mark.asyncio
+async def test_sigterm_drains_before_previous_handler():
+    tracker = InFlightTracker()
+    received = []
+    original = signal.signal(signal.SIGTERM, lambda signum, frame: received.append(signum))
+    try:
+        restore = install_sigterm_drain(tracker, timeout=1)
+        with tracker:
+            signal.raise_signal(signal.SIGTERM)
+            await asyncio.sleep(0.01)
+            assert tracker.draining
+            assert received == []
+        await asyncio.sleep(0.01)
+        assert received == [signal.SIGTERM]
+        restore()
+    finally:
+        signal.signal(signal.SIGTERM, original)
+
+
+@pytest.mark.asyncio
+async def test_push_endpoint_refuses_while_draining(client, monkeypatch):
+    tracker = InFlightTracker()
+    tracker.start_drain()
+    monkeypatch.setattr(pubsub, "in_flight", tracker)
+
+    response = await client.post("/worker/pubsub/push", content=b"{}")
+    health = await client.get("/worker/health")
+
+    assert response.status_code == 503
+    assert health.status_code == 503
@@ -0,0 +1,165 @@
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from src.actions.base import BaseAction
+from src.core.config import settings
+from src.db.models import ExecutionLog
+from src.models.actions import ActionResult
+from src.repositories.execution_log import ExecutionLogRepository
+from src.worker.services.background import WorkerBackgroundServices
+from src.worker.services.execution_log_writer import ExecutionLogWriter
+from src.worker.services.executor import Executor
+from tests.conftest import make_context
+
+
+class DummyAction(BaseAction):
+    async def run(self, context):
+        return ActionResult(status="success", result={"ok": True})
+
+
+async def load_log(session_factory, event_id):
+    async with session_factory() as session:
+        return (
+            await session.execute(select(ExecutionLog).where(ExecutionLog.event_id == event_id))
+        ).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_buffers_until_flush(session_factory, active_workflow, tmp_path):
+    writer = ExecutionLogWriter(session_factory, flush_interval=60, spool_dir=str(tmp_path))
+    writer.start()
+    try:
+        context = make_context(active_workflow)
+        async with session_factory() as session:
+            executor = Executor(session, ExecutionLogRepository(session, write_behind=writer))
+            result = await executor.execute(DummyAction(), context)
+            await session.commit()
+
+            # Not flushed yet: the row is still leased, so a redelivery is deferred.
+            duplicate = await executor.execute(DummyAction(), context)
+            await session.commit()
+
+        assert result.status == "success"
+        assert duplicate.status == "skipped" and duplicate.retryable
+        assert (await load_log(session_factory, context.event.event_id)).status == "pending"
+        assert len(list(tmp_path.glob("*.spool"))[0].read_text().splitlines()) == 1
+
+        assert await writer.flush() == 1
+    finally:
+        await writer.stop()
+
+    log = await load_log(session_factory, context.event.event_id)
+    assert log.status == "success"
+    assert log.result == {"ok": True}
+    assert log.lease_owner is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_a_restarted_writer_recovers_a_crashed_writers_spool(session_factory, active_workflow, tmp_path):
+    crashed = ExecutionLogWriter(session_factory, flush_interval=60, spool_dir=str(tmp_path))
+    crashed.start()
+    context = make_context(active_workflow)
+    async with session_factory() as session:
+        executor = Executor(session, ExecutionLogRepository(session, write_behind=crashed))
+        await executor.execute(DummyAction(), context)
+        await session.commit()
+    # Crash: nothing is flushed and the spool is left behind.
+    crashed._task.cancel()
+    crashed._spool.close()
+    # The restarted process has another pid, so the old spool has another name.
+    crashed._spool_path.rename(tmp_path / "dead-host-1.spool")
+    assert (await load_log(session_factory, context.event.event_id)).status == "pending"
+
+    writer = ExecutionLogWriter(session_factory, spool_dir=str(tmp_path))
+    writer.start()
+    await writer.stop()
+
+    log = await load_log(session_factory, context.event.event_id)
+    assert log.status == "success"
+    assert log.lease_owner is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_behind_requires_a_spool_dir(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "EXECUTION_LOG_WRITE_BEHIND_ENABLED", True)
+    monkeypatch.setattr(settings, "EXECUTION_LOG_SPOOL_DIR", None)
+    with pytest.raises(ValueError):
+        WorkerBackgroundServices(session_factory).start()
+
+
+@pytest.mark.asyncio
+async def test_spool_replay_is_idempotent(session_factory, active_workflow, tmp_path):
+    context = make_context(active_workflow)
+    async with session_factory() as session:
+        claim = await ExecutionLogRepository(session).claim(
+            {
+                "workflow_id": active_workflow.id,
+                "event_id": context.event.event_id,
+                "trace_id": "trace",
+                "action": "DummyAction",
+                "status": "pending",
+                "retryable": False,
+            },
+            lease_owner="dead-host:1",
+            lease_seconds=60,
+        )
+        await session.commit()
+
+    row = {"id": str(claim.id), "lease_owner": "dead-host:1", "values": {"status": "success"}}
+    (tmp_path / "dead-host-1.spool").write_text(json.dumps(row) + "\n" + '{"id": "tor')
+    (tmp_path / "dead-host-1.flushing").write_text(
+        json.dumps({**row, "values": {"status": "failed"}}) + "\n"
+    )
+
+    writer = ExecutionLogWriter(session_factory, spool_dir=str(tmp_path))
+    assert await writer.replay_spools() == 2
+
+    log = await load_log(session_factory, context.event.event_id)
+    # The first replayed row released the lease; the second no longer matches.
+    assert log.status == "failed"
+    assert log.lease_owner is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_flush_isolates_and_eventually_drops_a_bad_row(session_factory, active_workflow):
+    claims = []
+    async with session_factory() as session:
+        for _ in range(2):
+            claims.append(
+                await ExecutionLogRepository(session).claim(
+                    {
+                        "workflow_id": active_workflow.id,
+                        "event_id": uuid4(),
+                        "trace_id": "trace",
+                        "action": "DummyAction",
+                        "status": "pending",
+                        "retryable": False,
+                    },
+                    lease_owner="writer-test",
+                    lease_seconds=60,
+                )
+            )
+        await session.commit()
+    good, bad = claims
+
+    writer = ExecutionLogWriter(session_factory, max_attempts=2)
+    writer.add(good.id, "writer-test", {"status": "success", "duration": 1.0}, good.created_at)
+    writer.add(bad.id, "writer-test", {"status": "success", "duration": "not a number"}, bad.created_at)
+
+    assert await writer.flush() == 1
+    async with session_factory() as session:
+        result = await session.execute(
+            select(ExecutionLog.id, ExecutionLog.status).where(ExecutionLog.id.in_([good.id, bad.id]))
+        )
+        statuses = dict(result.all())
+    assert statuses == {good.id: "success", bad.id: "pending"}
+
+    # The second failure reaches max_attempts and the row is dropped.
+    assert await writer.flush() == 0
+    assert await writer.flush() == 0
+    assert writer._buffer == []
@@ -4,12 +4,17 @@ import pytest
 from types import SimpleNamespace
 from uuid import uuid4
 
-from src.actions.base import BaseAction
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.actions.base import MAX_ATTEMPTS, BaseAction
+from src.core.config import settings
 from src.events.schema import EventEnvelope
 from src.models.actions import ActionResult, ExecutionContext
 from src.repositories.execution_log import ExecutionLogRepository
-from src.worker.services.executor import Executor, MAX_ATTEMPTS
+from src.worker.services.executor import Executor
 from src.db.models import Workflow
+from src.worker.services.event_handler import handle_event
+from tests.conftest import make_envelope
 
 
 class DummyAction(BaseAction):
@@ -100,9 +105,10 @@ async def test_executor_check_attempts_flags_dlq(async_session, envelope):
         "trace_id": context.trace_id,
         "payload_snapshot": context.event.payload,
     }
-    log_entry, _ = await repo.create_pending(payload)
-    log_entry.attempts = MAX_ATTEMPTS
-    await async_session.flush()
+    first_claim = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    await repo.finish(first_claim.id, {"status": "failed", "attempts": MAX_ATTEMPTS})
+    log_entry = await repo.claim(payload, lease_owner="test", lease_seconds=60)
+    assert log_entry.attempts == MAX_ATTEMPTS + 1
 
     result = await executor.check_attempts(log_entry, context, RetryableAction())
 
@@ -171,3 +177,103 @@ async def test_executor_timeout_moves_to_dlq(async_session, envelope):
     assert log.status == "failed"
     assert log.queued_to_dlq is True
     assert log.attempts == MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_executor_defers_delivery_while_leased(async_session, envelope):
+    workflow = Workflow(
+        id=uuid4(),
+        name=f"leased-workflow-{uuid4()}",
+        description="leased workflow",
+        status="published",
+        is_active=True,
+    )
+    async_session.add(workflow)
+    await async_session.flush()
+
+    repo = ExecutionLogRepository(async_session)
+    executor = Executor(async_session, repo)
+    context = ExecutionContext(
+        event=EventEnvelope(**envelope),
+        workflow=workflow,
+        trace_id="leased-trace",
+    )
+    await repo.claim(
+        {
+            "workflow_id": workflow.id,
+            "event_id": context.event.event_id,
+            "trace_id": context.trace_id,
+            "action": DummyAction.__name__,
+            "status": "pending",
+            "retryable": False,
+        },
+        lease_owner="other-worker",
+        lease_seconds=60,
+    )
+
+    DummyAction.calls = 0
+    result = await executor.execute(DummyAction(), context)
+
+    assert result.status == "skipped"
+    assert result.retryable is True
+    assert 0 < result.retry_after <= 60
+    assert DummyAction.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_commits_claim_before_running_action(session_factory, active_workflow, envelope):
+    started, release = asyncio.Event(), asyncio.Event()
+
+    class BlockingAction(BaseAction):
+        async def run(self, context):
+            started.set()
+            await release.wait()
+            return ActionResult(status="success")
+
+    context = ExecutionContext(
+        event=EventEnvelope(**envelope),
+        workflow=active_workflow,
+        trace_id="two-session-trace",
+    )
+
+    async def deliver(action):
+        async with session_factory() as session:
+            executor = Executor(session, ExecutionLogRepository(session), commit_claim=True)
+            result = await executor.execute(action, context, timeout=5)
+            await session.commit()
+            return result
+
+    first = asyncio.create_task(deliver(BlockingAction()))
+    await asyncio.wait_for(started.wait(), timeout=2)
+
+    # The second delivery sees the committed lease instead of waiting on the row.
+    DummyAction.calls = 0
+    second = await asyncio.wait_for(deliver(DummyAction()), timeout=2)
+    assert second.status == "skipped"
+    assert second.retryable is True
+    assert second.retry_after > 0
+    assert DummyAction.calls == 0
+
+    release.set()
+    assert (await first).status == "success"
+    async with session_factory() as session:
+        [log] = await ExecutionLogRepository(session).list(event_id=context.event.event_id)
+    assert log.status == "success"
+    assert log.lease_owner is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_events_fit_a_pool_of_their_size(active_workflow):
+    engine = create_async_engine(settings.DATABASE_URL, pool_size=2, max_overflow=0, pool_timeout=2)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def deliver():
+        async with factory() as session:
+            return await handle_event(session, make_envelope(active_workflow.id))
+
+    try:
+        outcomes = await asyncio.wait_for(asyncio.gather(deliver(), deliver()), timeout=5)
+    finally:
+        await engine.dispose()
+
+    assert [outcome.ack for outcome in outcomes] == [True, True]
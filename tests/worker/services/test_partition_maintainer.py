@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.db.models import ExecutionLogKey
+from src.repositories.execution_log_partitions import ExecutionLogPartitionRepository
+from src.worker.services.partition_maintainer import PartitionMaintainer
+
+SCHEMA = "test_partition_maintainer"
+
+
+@pytest_asyncio.fixture
+async def isolated_factory():
+    """A session factory whose ``execution_logs`` is an empty partitioned copy."""
+    admin = create_async_engine(settings.DATABASE_URL)
+    async with admin.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.execute(
+            text(
+                f"CREATE TABLE {SCHEMA}.execution_logs (LIKE public.execution_logs INCLUDING DEFAULTS) "
+                "PARTITION BY RANGE (created_at)"
+            )
+        )
+        await conn.execute(
+            text(f"CREATE TABLE {SCHEMA}.execution_log_keys (LIKE public.execution_log_keys INCLUDING ALL)")
+        )
+
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+    async with admin.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await admin.dispose()
+
+
+async def partitions(factory):
+    async with factory() as session:
+        return await ExecutionLogPartitionRepository(session).list()
+
+
+def at(day: int, hour: int = 0) -> datetime:
+    return datetime(2030, 1, day, hour, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_creates_partitions_ahead_once(isolated_factory):
+    maintainer = PartitionMaintainer(isolated_factory, ahead=3)
+
+    assert await maintainer.maintain_once(now=at(1, 12)) == (4, 0)
+    assert await maintainer.maintain_once(now=at(1, 12)) == (0, 0)
+
+    created = await partitions(isolated_factory)
+    assert [p.name for p in created] == [f"execution_logs_p2030010{day}" for day in range(1, 5)]
+    assert created[0].lower == at(1) and created[-1].upper == at(5)
+
+
+@pytest.mark.asyncio
+async def test_retention_drops_partitions_and_their_keys(isolated_factory):
+    await PartitionMaintainer(isolated_factory, ahead=3).maintain_once(now=at(1, 12))
+    old, recent = uuid4(), uuid4()
+    async with isolated_factory() as session:
+        for log_id, created_at in ((old, at(1, 5)), (recent, at(3))):
+            session.add(
+                ExecutionLogKey(log_id=log_id, event_id=uuid4(), workflow_id=uuid4(), created_at=created_at)
+            )
+        await session.commit()
+
+    maintainer = PartitionMaintainer(isolated_factory, ahead=3, retention=timedelta(days=1), key_batch_size=1)
+    assert await maintainer.maintain_once(now=at(3, 6)) == (2, 1)
+
+    assert "execution_logs_p20300101" not in [p.name for p in await partitions(isolated_factory)]
+    async with isolated_factory() as session:
+        assert (await session.execute(select(ExecutionLogKey.log_id))).scalars().all() == [recent]
+
+
+@pytest.mark.asyncio
+async def test_moves_rows_out_of_the_default_partition(isolated_factory):
+    log_id = uuid4()
+    async with isolated_factory() as session:
+        await session.execute(text("CREATE TABLE execution_logs_default PARTITION OF execution_logs DEFAULT"))
+        await session.execute(
+            text(
+                "INSERT INTO execution_logs (id, workflow_id, event_id, trace_id, action, status, retryable, created_at) "
+                "VALUES (:id, :id, :id, 't', 'a', 'success', false, :created_at)"
+            ),
+            {"id": log_id, "created_at": at(2, 8)},
+        )
+        await session.commit()
+
+    assert await PartitionMaintainer(isolated_factory, ahead=3).maintain_once(now=at(1, 12)) == (4, 0)
+
+    names = [p.name for p in await partitions(isolated_factory)]
+    assert "execution_logs_p20300102" in names and "execution_logs_default" in names
+    async with isolated_factory() as session:
+        moved = await session.execute(text("SELECT id FROM execution_logs_p20300102"))
+        assert moved.scalars().all() == [log_id]
+        assert (await session.execute(text("SELECT count(*) FROM execution_logs_default"))).scalar_one() == 0
+
+
+@pytest.mark.asyncio
+async def test_deletes_keys_orphaned_by_an_earlier_pass(isolated_factory):
+    await PartitionMaintainer(isolated_factory, ahead=3).maintain_once(now=at(1, 12))
+    orphaned, live = uuid4(), uuid4()
+    async with isolated_factory() as session:
+        # As if a pass dropped execution_logs_p20300101 and crashed before deleting its keys.
+        await ExecutionLogPartitionRepository(session).drop("execution_logs_p20300101")
+        session.add(ExecutionLogKey(log_id=orphaned, event_id=uuid4(), workflow_id=uuid4(), created_at=at(1, 5)))
+        session.add(ExecutionLogKey(log_id=live, event_id=uuid4(), workflow_id=uuid4(), created_at=at(2, 5)))
+        await session.commit()
+
+    assert await PartitionMaintainer(isolated_factory, ahead=3).maintain_once(now=at(1, 12)) == (0, 0)
+
+    async with isolated_factory() as session:
+        assert (await session.execute(select(ExecutionLogKey.log_id))).scalars().all() == [live]
+
+
+@pytest.mark.asyncio
+async def test_deletes_orphaned_keys_past_a_minvalue_partition(isolated_factory):
+    live, orphaned = uuid4(), uuid4()
+    legacy = datetime(2029, 12, 1, tzinfo=timezone.utc)
+    async with isolated_factory() as session:
+        await session.execute(
+            text(
+                "CREATE TABLE execution_logs_legacy PARTITION OF execution_logs "
+                "FOR VALUES FROM (MINVALUE) TO ('2030-01-01')"
+            )
+        )
+        await session.execute(
+            text(
+                "INSERT INTO execution_logs (id, workflow_id, event_id, trace_id, action, status, retryable, created_at) "
+                "VALUES (:id, :id, :id, 't', 'a', 'success', false, :created_at)"
+            ),
+            {"id": live, "created_at": legacy},
+        )
+        for log_id in (live, orphaned):
+            session.add(
+                ExecutionLogKey(
+                    log_id=log_id,
+                    event_id=uuid4(),
+                    workflow_id=uuid4(),
+                    created_at=legacy,
+                )
+            )
+        await session.commit()
+
+    assert await PartitionMaintainer(isolated_factory, ahead=3).maintain_once(now=at(1, 12)) == (4, 0)
+
+    async with isolated_factory() as session:
+        assert (await session.execute(select(ExecutionLogKey.log_id))).scalars().all() == [live]
@@ -0,0 +1,45 @@
+import base64
+import json
+
+import pytest
+
+from src.worker.services.pubsub_decoder import decode_event_data, decode_push_body
+
+
+def push_body(data) -> bytes:
+    return json.dumps(
+        {
+            "message": {"messageId": "1", "data": data, "publishTime": "2025-01-01T00:00:00Z"},
+            "subscription": "projects/test/subscriptions/test",
+        }
+    ).encode()
+
+
+def test_decode_push_body_reads_envelope(envelope):
+    data = base64.b64encode(json.dumps(envelope).encode()).decode()
+
+    event = decode_push_body(push_body(data))
+
+    assert str(event.event_id) == envelope["event_id"]
+    assert event.payload == envelope["payload"]
+
+
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        (b"not json", "Malformed Pub/Sub push body"),
+        (b'{"subscription": "s"}', "Malformed Pub/Sub push body"),
+        (push_body(None), "Empty Pub/Sub message data"),
+        (push_body("abc"), "Malformed Pub/Sub payload"),
+        (push_body(base64.b64encode(b"{oops").decode()), "Malformed Pub/Sub payload"),
+        (push_body(base64.b64encode(b'{"event_id": "x"}').decode()), "Invalid Envelope"),
+    ],
+)
+def test_decode_push_body_rejects_bad_input(body, message):
+    with pytest.raises(ValueError, match=message):
+        decode_push_body(body)
+
+
+def test_decode_event_data_rejects_empty():
+    with pytest.raises(ValueError, match="Empty"):
+        decode_event_data(b"")
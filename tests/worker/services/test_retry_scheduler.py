@@ -0,0 +1,102 @@
+import asyncio
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from src.actions.base import BaseAction
+from src.actions.registry import ActionRegistry
+from src.db.models import ScheduledRetry, Task
+from src.models.actions import ActionResult
+from src.repositories.scheduled_retry import ScheduledRetryRepository
+from src.worker.services import event_handler, workflow_engine
+from src.worker.services.retry_scheduler import RetryScheduler
+from tests.conftest import make_envelope
+
+
+async def scheduled(session_factory, event_ids):
+    async with session_factory() as session:
+        result = await session.execute(
+            select(ScheduledRetry).where(ScheduledRetry.event_id.in_(event_ids))
+        )
+        return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_scheduler_reinjects_due_retries(session_factory):
+    due, later, failing = make_envelope(), make_envelope(), make_envelope()
+    async with session_factory() as session, session.begin():
+        repo = ScheduledRetryRepository(session)
+        await repo.schedule(due, uuid4(), attempts=1, delay=0)
+        await repo.schedule(later, uuid4(), attempts=1, delay=3600)
+        await repo.schedule(failing, uuid4(), attempts=2, delay=0)
+
+    async def publish_batch(events):
+        return [
+            RuntimeError("boom") if event.event_id == failing.event_id else "message-id"
+            for event in events
+        ]
+
+    producer = MagicMock()
+    producer.publish_batch_async = AsyncMock(side_effect=publish_batch)
+    scheduler = RetryScheduler(session_factory, producer, batch_size=1000, failure_delay=3600)
+
+    await scheduler.reinject_once()
+
+    published = {e.event_id for e in producer.publish_batch_async.call_args.args[0]}
+    assert due.event_id in published
+    assert later.event_id not in published
+
+    remaining = {row.event_id for row in await scheduled(session_factory, [due.event_id, later.event_id, failing.event_id])}
+    assert remaining == {later.event_id, failing.event_id}
+
+
+class FlakyAction(BaseAction):
+    async def run(self, context):
+        return ActionResult(status="failed", error="downstream unavailable", retryable=True)
+
+
+@pytest.mark.asyncio
+async def test_handle_event_schedules_retry_and_acks(async_session, active_workflow, monkeypatch, session_factory):
+    registry = ActionRegistry(group=None)
+    registry.register("flaky", FlakyAction)
+    monkeypatch.setattr(workflow_engine, "action_registry", registry)
+    monkeypatch.setattr(event_handler.settings, "DELAYED_RETRIES_ENABLED", True)
+
+    async_session.add(Task(workflow_id=active_workflow.id, payload={"name": "call", "type": "flaky"}))
+    await async_session.commit()
+
+    event = make_envelope(active_workflow.id)
+    outcome = await event_handler.handle_event(async_session, event)
+
+    assert outcome.ack is True
+    rows = await scheduled(session_factory, [event.event_id])
+    assert len(rows) == 1
+    assert rows[0].attempts == 1
+    assert rows[0].last_error.endswith("downstream unavailable")
+
+
+@pytest.mark.asyncio
+async def test_retry_rescheduled_while_publishing_is_kept(session_factory):
+    event, workflow_id = make_envelope(), uuid4()
+    async with session_factory() as session, session.begin():
+        await ScheduledRetryRepository(session).schedule(event, workflow_id, attempts=1, delay=0)
+
+    async def publish_batch(events):
+        # The consumer fails the re-injected event again before the scheduler
+        # has cleaned up; no lock may be held on the row meanwhile.
+        async with session_factory() as session, session.begin():
+            await asyncio.wait_for(
+                ScheduledRetryRepository(session).schedule(event, workflow_id, attempts=2, delay=3600),
+                timeout=2,
+            )
+        return ["message-id" for _ in events]
+
+    producer = MagicMock()
+    producer.publish_batch_async = AsyncMock(side_effect=publish_batch)
+
+    assert await RetryScheduler(session_factory, producer).reinject_once() == 1
+
+    rows = await scheduled(session_factory, [event.event_id])
+    assert [row.attempts for row in rows] == [2]
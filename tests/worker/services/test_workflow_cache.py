@@ -0,0 +1,98 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.core.config import settings
+from src.repositories.workflow import WorkflowRepository
+from src.worker.services import workflow_cache as cache_module
+from src.worker.services.workflow_cache import (
+    WorkflowCache,
+    WorkflowChangeListener,
+    WorkflowSnapshot,
+    build_workflow_change_listener,
+)
+
+
+def make_snapshot(is_active=True):
+    return WorkflowSnapshot(id=uuid4(), name="wf", status="published", is_active=is_active)
+
+
+def test_cache_returns_stored_snapshot():
+    cache = WorkflowCache(max_size=10, ttl_seconds=60)
+    snapshot = make_snapshot()
+
+    cache.put(snapshot)
+
+    assert cache.get(snapshot.id) == snapshot
+    assert cache.get(uuid4()) is None
+
+
+def test_cache_expires_entries_after_ttl(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    cache = WorkflowCache(max_size=10, ttl_seconds=30)
+    snapshot = make_snapshot()
+    cache.put(snapshot)
+
+    now += 31
+
+    assert cache.get(snapshot.id) is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = WorkflowCache(max_size=2, ttl_seconds=60)
+    first, second, third = make_snapshot(), make_snapshot(), make_snapshot()
+    cache.put(first)
+    cache.put(second)
+    cache.get(first.id)
+
+    cache.put(third)
+
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) == first
+    assert cache.get(third.id) == third
+
+
+def test_cache_invalidate_drops_entry():
+    cache = WorkflowCache(max_size=10, ttl_seconds=60)
+    snapshot = make_snapshot()
+    cache.put(snapshot)
+
+    cache.invalidate(snapshot.id)
+
+    assert cache.get(snapshot.id) is None
+
+
+@pytest.mark.asyncio
+async def test_listener_invalidates_on_notify(async_session):
+    cache = WorkflowCache(max_size=10, ttl_seconds=60)
+    dsn = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+    listener = WorkflowChangeListener(cache, dsn)
+    listener.start()
+
+    snapshot = make_snapshot()
+    try:
+        for _ in range(50):
+            await asyncio.sleep(0.05)
+            cache.put(snapshot)
+            await WorkflowRepository(async_session).notify_changed(snapshot.id)
+            await async_session.commit()
+            await asyncio.sleep(0.05)
+            if cache.get(snapshot.id) is None:
+                break
+        else:
+            pytest.fail("workflow change notification was not received")
+    finally:
+        await listener.stop()
+
+
+def test_listener_refuses_pgbouncer_without_direct_url(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", True)
+    monkeypatch.setattr(settings, "DB_DIRECT_URL", None)
+    with pytest.raises(ValueError):
+        build_workflow_change_listener()
+
+    monkeypatch.setattr(settings, "DB_DIRECT_URL", "postgresql+asyncpg://u:p@db:5432/d")
+    assert build_workflow_change_listener()._dsn == "postgresql://u:p@db:5432/d"
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.actions.base import MAX_ATTEMPTS, BaseAction
+from src.actions.registry import ActionRegistry
+from src.db.models import Task, Workflow
+from src.events.schema import EventEnvelope
+from src.models.actions import ActionResult, ExecutionContext
+from src.repositories.execution_log import ExecutionLogRepository
+from src.worker.services import workflow_engine
+from src.worker.services.executor import Executor
+from src.worker.services.workflow_engine import (
+    DagAction,
+    WorkflowEngine,
+    WorkflowPlan,
+    WorkflowStep,
+)
+
+
+class SleepAction(BaseAction):
+    async def run(self, context):
+        await asyncio.sleep(context.config.get("delay", 0.1))
+        return ActionResult(status="success", result={"slept": context.config.get("delay", 0.1)})
+
+
+class FailingAction(BaseAction):
+    async def run(self, context):
+        return ActionResult(status="failed", error="boom", retryable=True)
+
+
+@pytest.fixture(autouse=True)
+def action_registry(monkeypatch):
+    registry = ActionRegistry(group=None)
+    registry.register("sleep", SleepAction)
+    registry.register("fail", FailingAction)
+    monkeypatch.setattr(workflow_engine, "action_registry", registry)
+    return registry
+
+
+def step(name, type_="sleep", depends_on=(), config=None, completed=False):
+    return WorkflowStep(
+        task_id=uuid4(),
+        name=name,
+        type=type_,
+        config=config or {"delay": 0.1},
+        depends_on=tuple(depends_on),
+        completed=completed,
+    )
+
+
+def test_plan_orders_dependencies_first():
+    plan = WorkflowPlan.build([step("c", depends_on=["b"]), step("b", depends_on=["a"]), step("a")])
+
+    assert [s.name for s in plan.steps] == ["a", "b", "c"]
+
+
+def test_plan_rejects_cycles_and_unknown_dependencies():
+    with pytest.raises(ValueError, match="cycle"):
+        WorkflowPlan.build([step("a", depends_on=["b"]), step("b", depends_on=["a"])])
+
+    with pytest.raises(ValueError, match="unknown"):
+        WorkflowPlan.build([step("a", depends_on=["missing"])])
+
+
+@pytest.mark.asyncio
+async def test_dag_runs_independent_steps_concurrently(envelope):
+    context = ExecutionContext(
+        event=EventEnvelope(**envelope),
+        workflow=Workflow(id=uuid4(), name="wf", status="published", is_active=True),
+        trace_id="dag-trace",
+    )
+    dag = DagAction(
+        [step("a"), step("b"), step("c"), step("d", depends_on=["a", "b", "c"])],
+        concurrency=10,
+    )
+
+    start = time.perf_counter()
+    result = await dag.run(context)
+    elapsed = time.perf_counter() - start
+
+    assert result.status == "success"
+    assert result.result["steps"] == {"a": "success", "b": "success", "c": "success", "d": "success"}
+    assert elapsed < 0.35
+
+
+@pytest.mark.asyncio
+async def test_dag_blocks_dependents_of_failed_step(envelope):
+    context = ExecutionContext(
+        event=EventEnvelope(**envelope),
+        workflow=Workflow(id=uuid4(), name="wf", status="published", is_active=True),
+        trace_id="dag-trace",
+    )
+    dag = DagAction([step("a", type_="fail"), step("b", depends_on=["a"]), step("c", completed=True)])
+
+    result = await dag.run(context)
+
+    assert result.status == "failed"
+    assert result.retryable is True
+    assert result.result["steps"] == {"a": "failed", "b": "blocked"}
+
+
+@pytest.mark.asyncio
+async def test_engine_records_step_logs(async_session, envelope):
+    workflow = Workflow(
+        id=uuid4(),
+        name=f"dag-workflow-{uuid4()}",
+        description="dag workflow",
+        status="published",
+        is_active=True,
+    )
+    async_session.add(workflow)
+    await async_session.flush()
+    async_session.add_all([
+        Task(workflow_id=workflow.id, payload={"name": "a", "type": "sleep", "config": {"delay": 0.01}}),
+        Task(workflow_id=workflow.id, payload={"name": "b", "type": "log", "depends_on": ["a"]}),
+    ])
+    await async_session.flush()
+
+    repo = ExecutionLogRepository(async_session)
+    context = ExecutionContext(
+        event=EventEnvelope(**envelope),
+        workflow=workflow,
+        trace_id="dag-trace",
+    )
+    engine = WorkflowEngine(async_session, Executor(async_session, repo))
+
+    result = await engine.run(context)
+
+    assert result.status == "success"
+    logs = await repo.list(event_id=context.event.event_id)
+    assert sorted((log.action, log.status) for log in logs) == [
+        ("DagAction", "success"),
+        ("LogAction", "success"),
+        ("SleepAction", "success"),
+    ]
+    assert sum(log.task_id is None for log in logs) == 1
+
+    duplicate = await engine.run(context)
+    assert duplicate.status == "skipped"
+
+
+@pytest.mark.asyncio
+async def test_engine_retries_dag_with_step_retry_policy(async_session, envelope, monkeypatch):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+    monkeypatch.setattr("src.actions.http_call.get_http_client", lambda: client)
+    workflow = Workflow(
+        id=uuid4(),
+        name=f"http-dag-workflow-{uuid4()}",
+        description="http dag workflow",
+        status="published",
+        is_active=True,
+    )
+    async_session.add(workflow)
+    await async_session.flush()
+    async_session.add(
+        Task(workflow_id=workflow.id, payload={"name": "call", "type": "http_call", "config": {"url": "http://down.test"}})
+    )
+    await async_session.flush()
+
+    context = ExecutionContext(
+        event=EventEnvelope(**envelope),
+        workflow=workflow,
+        trace_id="http-dag-trace",
+    )
+    engine = WorkflowEngine(async_session, Executor(async_session, ExecutionLogRepository(async_session)))
+
+    # HttpCallAction allows 5 attempts, more than the default MAX_ATTEMPTS.
+    results = [await engine.run(context) for _ in range(5)]
+
+    assert MAX_ATTEMPTS < 5
+    assert [r.retryable for r in results] == [True, True, True, True, False]
+    assert results[-1].queued_to_dlq is True
+    assert all(r.retry_after > 0 for r in results[:-1])
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from src.worker.pull import StreamingPullWorker
+from src.worker.services.event_handler import ACK, NACK
+
+
+class FakeMessage:
+    def __init__(self, data: bytes, message_id: str):
+        self.data = data
+        self.message_id = message_id
+        self.acked = threading.Event()
+        self.nacked = threading.Event()
+
+    def ack(self):
+        self.acked.set()
+
+    def nack(self):
+        self.nacked.set()
+
+
+class FakeSubscriber:
+    def __init__(self):
+        self.callback = None
+        self.flow_control = None
+        self.future = Future()
+
+    def subscribe(self, subscription, callback, flow_control):
+        self.callback = callback
+        self.flow_control = flow_control
+        return self.future
+
+    def deliver(self, *messages):
+        threads = [threading.Thread(target=self.callback, args=(m,)) for m in messages]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+
+async def wait_until(predicate, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_pull_worker_acks_nacks_and_bounds_concurrency(
+    session_factory, envelope, monkeypatch
+):
+    running = 0
+    peak = 0
+
+    async def fake_handle_event(session, event):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return NACK if event.trace_id == "retry" else ACK
+
+    monkeypatch.setattr("src.worker.pull.handle_event", fake_handle_event)
+
+    subscriber = FakeSubscriber()
+    worker = StreamingPullWorker(
+        subscriber,
+        "projects/test/subscriptions/test",
+        session_factory,
+        concurrency=2,
+        max_messages=10,
+    )
+    run = asyncio.create_task(worker.run())
+    await wait_until(lambda: subscriber.callback is not None)
+
+    ok = [FakeMessage(json.dumps(envelope).encode(), str(i)) for i in range(4)]
+    retry = FakeMessage(json.dumps({**envelope, "trace_id": "retry"}).encode(), "retry")
+    malformed = FakeMessage(b"not json", "malformed")
+    await asyncio.to_thread(subscriber.deliver, *ok, retry, malformed)
+
+    await wait_until(lambda: all(m.acked.is_set() for m in ok))
+    await wait_until(retry.nacked.is_set)
+    assert malformed.acked.is_set()
+    assert peak <= 2
+    assert subscriber.flow_control.max_messages == 10
+
+    worker.stop()
+    assert await run is None
+    assert subscriber.future.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_pull_worker_returns_stream_failure(session_factory):
+    subscriber = FakeSubscriber()
+    worker = StreamingPullWorker(subscriber, "projects/test/subscriptions/test", session_factory)
+    run = asyncio.create_task(worker.run())
+    await wait_until(lambda: subscriber.callback is not None)
+
+    error = RuntimeError("stream closed")
+    subscriber.future.set_exception(error)
+
+    assert await asyncio.wait_for(run, timeout=2) is error
@@ -139,7 +139,7 @@ async def test_worker_fatal_on_validation_error(client, monkeypatch, envelope):
         Dummy(value="not-int")
 
     monkeypatch.setattr(
-        "src.worker.routers.pubsub.decode_pubsub_message",
+        "src.worker.routers.pubsub.decode_push_body",
         bad_decode,
     )
     payload = make_push_payload(envelope)
@@ -1,8 +1,9 @@
 from datetime import datetime, timezone
 
 import pytest
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from src.db.models import Workflow
 from src.worker.services.workflow_resolver import WorkflowResolver
 from src.core.exceptions import WorkflowNotFound, WorkflowAlreadyExists, WorkflowInactive
 from src.events.schema import EventEnvelope
@@ -64,3 +65,47 @@ async def test_resolver_ok(event):
 
     workflow = await resolver.resolve(event)
     assert workflow.id == wf.id
+
+
+class CountingWorkflowRepository(FakeWorkflowRepository):
+    def __init__(self, workflow=None):
+        super().__init__(workflow)
+        self.calls = 0
+
+    async def get_by_id(self, workflow_id):
+        self.calls += 1
+        return self.workflow
+
+
+@pytest.mark.asyncio
+async def test_resolver_cache_hit_skips_repository(event):
+    from src.worker.services.workflow_cache import WorkflowCache
+
+    wf = Workflow(id=UUID(event.payload["workflow_id"]), name="wf", status="active", is_active=True)
+    cache = WorkflowCache(max_size=10, ttl_seconds=60)
+
+    resolver = WorkflowResolver(session=None, cache=cache)
+    resolver._repo = CountingWorkflowRepository(workflow=wf)
+
+    first = await resolver.resolve(event)
+    second = await resolver.resolve(event)
+
+    assert resolver._repo.calls == 1
+    assert first.id == second.id == wf.id
+
+
+@pytest.mark.asyncio
+async def test_resolver_caches_inactive_workflow(event):
+    from src.worker.services.workflow_cache import WorkflowCache
+
+    wf = Workflow(id=UUID(event.payload["workflow_id"]), name="wf", status="paused", is_active=False)
+    cache = WorkflowCache(max_size=10, ttl_seconds=60)
+
+    resolver = WorkflowResolver(session=None, cache=cache)
+    resolver._repo = CountingWorkflowRepository(workflow=wf)
+
+    for _ in range(2):
+        with pytest.raises(WorkflowInactive):
+            await resolver.resolve(event)
+
+    assert resolver._repo.calls == 1